@@ -8,23 +8,29 @@ include sequential_analysis_agent here.
 
 from google.adk.agents import LlmAgent
 
-from .callbacks import initialize_session_state_callback
+from .callbacks import initialize_session_state_callback, route_intent_callback
 from .config import config
 from .sub_agents import sequential_analysis_agent
+from .tools import scenario_tool
+from .tracing import instrument_agent_tree
+from .utils.intent_router import GREETING_RESPONSE
 
 # Root Agent - Orchestrates sub-agents via delegation
-# NOTE: Individual data agents are children of parallel_data_agent which is part of
-# sequential_analysis_agent. ADK agents can only have one parent, so we only include
+# NOTE: Individual agents are stages of sequential_analysis_agent (a dependency-graph
+# workflow). ADK agents can only have one parent, so we only include
 # sequential_analysis_agent here for full analysis workflows.
 root_agent = LlmAgent(
     name="market_signal_orchestrator",
     model=config.model_name,
     description="Coordinates signal agents to predict market volatility: VIX analysis, Fed events, earnings sentiment, forecasts, and alerts.",
     before_agent_callback=initialize_session_state_callback,
+    # Greetings, capability questions and analysis queries skip the model call
+    before_model_callback=route_intent_callback,
     sub_agents=[
-        sequential_analysis_agent,  # Full analysis workflow (parallel fetch -> sequential processing)
+        sequential_analysis_agent,  # Full analysis workflow (dependency-graph stages)
     ],
-    instruction="""You are the Market Volatility Prediction Orchestrator.
+    tools=[scenario_tool],  # What-if grids without the analysis workflow
+    instruction=f"""You are the Market Volatility Prediction Orchestrator.
 
 ## CRITICAL RULE - DELEGATION
 For ANY volatility, VIX, market, or analysis query, you MUST delegate to sequential_analysis_agent.
@@ -33,9 +39,9 @@ The sub-agents have the tools (BigQuery) - you only coordinate.
 
 ## WHAT sequential_analysis_agent DOES
 When you delegate to sequential_analysis_agent, it automatically:
-1. **Parallel Data Fetch**: Runs technical_agent, event_calendar_agent, speech_signal_agent concurrently
-2. **Synthesis**: Generates volatility forecasts from collected data
-3. **Alerts**: Checks VIX thresholds and generates alerts
+1. **Data Fetch**: Runs technical_agent, event_calendar_agent, speech_signal_agent concurrently
+2. **Alerts**: Checks VIX thresholds as soon as technical signals are ready
+3. **Synthesis**: Generates volatility forecasts once all data is collected
 4. **Persistence**: Saves forecasts and alerts to BigQuery
 
 ## VALID QUERIES (delegate to sequential_analysis_agent)
@@ -49,9 +55,21 @@ When you delegate to sequential_analysis_agent, it automatically:
 - "Check for alerts"
 - Any market, VIX, volatility, or analysis question
 
+## WHAT-IF / SCENARIO QUESTIONS (do NOT delegate)
+For hypothetical questions ("what if VIX jumps to 35 before FOMC?", "stress
+test VIX 20-40"), call `run_volatility_scenarios` directly:
+- Absolute VIX levels -> `vix_levels` (e.g. "35" or "20:40:5"); moves like
+  "VIX up 10 points" -> `vix_shocks` ("10")
+- Upcoming events -> `event_sets`, comparing with no event:
+  FOMC/Fed decision -> "none;fed_statement", Fed minutes -> "none;fed_minute",
+  big merger -> "none;mna_mega"
+- Leave `realized_vols` empty unless the user gives one
+Summarize the per-index 1-day/5-day forecasts, regime, confidence and which
+VIX alert would fire. Never run the full analysis for a what-if question.
+
 ## WHEN NOT TO DELEGATE
 Handle these directly WITHOUT delegating:
-- Greetings: "hi", "hello", "hey" -> Respond: "Hello! I'm the Market Volatility Prediction system. I analyze VIX levels, Fed events, earnings sentiment, and generate volatility forecasts. Try: 'Run a complete volatility analysis'"
+- Greetings: "hi", "hello", "hey" -> Respond: "{GREETING_RESPONSE}"
 - General questions about yourself or capabilities
 - Clarification questions
 
@@ -63,3 +81,7 @@ After analysis completes, present:
 4. Any alerts triggered
 """,
 )
+
+# Per-agent/model/tool latency spans (see tracing.py)
+if config.trace_exporter != "none":
+    instrument_agent_tree(root_agent)
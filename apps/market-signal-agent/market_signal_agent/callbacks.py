@@ -1,9 +1,34 @@
 """Callbacks for the Market Signal Agent system."""
 
+import logging
 from typing import TYPE_CHECKING, Any
 
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+from .config import config
+from .tools.alert_store import alert_engine
+from .utils.alert_state import ALERT_CHANGES_KEY
+from .utils.intent_router import (
+    ANALYSIS_AGENT_NAME,
+    CAPABILITIES_RESPONSE,
+    GREETING_RESPONSE,
+    classify_intent,
+)
+from .utils.query_planner import (
+    ANALYSIS_PLAN_KEY,
+    DEFAULT_SYMBOLS,
+    REQUESTED_SYMBOLS_KEY,
+    plan_query,
+)
+from .utils.snapshot import SNAPSHOT_BYPASS_KEY, snapshot_answer
+from .utils.sql_guard import check_query, truncate_rows
+
 if TYPE_CHECKING:
     from google.adk.agents import CallbackContext
+    from google.adk.tools import BaseTool, ToolContext
+
+logger = logging.getLogger(__name__)
 
 
 def initialize_session_state_callback(
@@ -58,3 +83,188 @@ def initialize_session_state_callback(
     for key, value in defaults.items():
         if not state.get(key):
             state[key] = value
+
+    # A plan only applies to the turn that produced it; clear the previous one
+    # so an LLM-delegated turn runs the full pipeline.
+    state[ANALYSIS_PLAN_KEY] = None
+    state[REQUESTED_SYMBOLS_KEY] = DEFAULT_SYMBOLS
+
+
+async def start_alert_sweep_callback(
+    callback_context: "CallbackContext",
+) -> None:
+    """Start a fresh alert sweep for the alert agent's run.
+
+    Runs as the alert agent's before_agent_callback; reloads the active-alert
+    index from the alerts table, which other processes also write, so the
+    check tools can tell new alerts from ongoing ones.
+    """
+    alert_engine.start_sweep(callback_context.invocation_id)
+    try:
+        await alert_engine.reload()
+    except Exception:
+        logger.exception("Failed to load active alerts")
+
+
+async def commit_alert_sweep_callback(
+    callback_context: "CallbackContext",
+) -> None:
+    """Persist the alert sweep's opened/updated/resolved transitions.
+
+    Runs as the alert agent's after_agent_callback and stores the transition
+    counts in session state for the persistence summary.
+    """
+    try:
+        changes = await alert_engine.finish_sweep(callback_context.invocation_id)
+    except Exception as e:
+        logger.exception("Failed to persist alerts")
+        changes = {"status": "error", "error_details": str(e)}
+    callback_context.state[ALERT_CHANGES_KEY] = changes
+
+
+def _latest_user_text(llm_request: LlmRequest) -> str | None:
+    """Return the user's message if it is the last content in the request.
+
+    Returns None when the request continues a tool exchange (function
+    responses are also sent with role "user").
+    """
+    if not llm_request.contents:
+        return None
+
+    last = llm_request.contents[-1]
+    if last.role != "user" or not last.parts:
+        return None
+    if any(part.function_response for part in last.parts):
+        return None
+
+    text = " ".join(part.text for part in last.parts if part.text)
+    return text or None
+
+
+def route_intent_callback(
+    callback_context: "CallbackContext",
+    llm_request: LlmRequest,
+) -> LlmResponse | None:
+    """Answer or delegate the user's message without calling the model.
+
+    Runs as the root agent's before_model_callback. Greetings and capability
+    questions are answered from templates; analysis queries are transferred
+    directly to sequential_analysis_agent. What-if questions and anything
+    else fall through to the LLM orchestrator (scenarios are answered with its
+    run_volatility_scenarios tool, without the analysis workflow).
+
+    Analysis queries also get a minimal plan (see utils/query_planner.py) so
+    the workflow only runs the agents the question needs. Questions in the
+    standard phrasing are answered from the precomputed snapshot while it is
+    fresh (see utils/snapshot.py).
+
+    Args:
+        callback_context: ADK callback context for the root agent.
+        llm_request: The request about to be sent to the model.
+
+    Returns:
+        LlmResponse that replaces the model call, or None to call the model.
+    """
+    if not config.intent_router_enabled:
+        return None
+
+    text = _latest_user_text(llm_request)
+    if text is None:
+        return None
+
+    intent = classify_intent(text)
+
+    if intent == "greeting":
+        return LlmResponse(
+            content=types.Content(
+                role="model", parts=[types.Part(text=GREETING_RESPONSE)]
+            )
+        )
+
+    if intent == "capabilities":
+        return LlmResponse(
+            content=types.Content(
+                role="model", parts=[types.Part(text=CAPABILITIES_RESPONSE)]
+            )
+        )
+
+    if intent == "analysis":
+        plan = plan_query(text)
+
+        # Standard questions are answered from the precomputed snapshot
+        if not callback_context.state.get(SNAPSHOT_BYPASS_KEY):
+            answer = snapshot_answer(text, plan)
+            if answer is not None:
+                answer_text, snapshot_state = answer
+                for key, value in snapshot_state.items():
+                    if value is not None:
+                        callback_context.state[key] = value
+                return LlmResponse(
+                    content=types.Content(
+                        role="model", parts=[types.Part(text=answer_text)]
+                    )
+                )
+
+        callback_context.state[ANALYSIS_PLAN_KEY] = plan
+        callback_context.state[REQUESTED_SYMBOLS_KEY] = plan["symbols"]
+
+        transfer_call = types.FunctionCall(
+            name="transfer_to_agent",
+            args={"agent_name": ANALYSIS_AGENT_NAME},
+        )
+        return LlmResponse(
+            content=types.Content(
+                role="model", parts=[types.Part(function_call=transfer_call)]
+            )
+        )
+
+    return None
+
+
+def guard_bigquery_query_callback(
+    tool: "BaseTool",
+    args: dict[str, Any],
+    tool_context: "ToolContext",
+) -> dict[str, Any] | None:
+    """Reject agent SQL that would pull transcripts or wide text columns.
+
+    Runs as before_tool_callback on agents with the BigQuery toolset; see
+    utils/sql_guard.py for the rules.
+
+    Returns:
+        Error response in the toolset's format instead of running the query,
+        or None to run it.
+    """
+    if tool.name != "execute_sql":
+        return None
+
+    reason = check_query(str(args.get("query", "")))
+    if reason is None:
+        return None
+    return {"status": "ERROR", "error_details": reason}
+
+
+def bound_bigquery_result_callback(
+    tool: "BaseTool",
+    args: dict[str, Any],
+    tool_context: "ToolContext",
+    tool_response: Any,
+) -> dict[str, Any] | None:
+    """Truncate long text values in execute_sql results before the model sees them.
+
+    Runs as after_tool_callback on agents with the BigQuery toolset.
+
+    Returns:
+        The bounded response, or None to keep the original.
+    """
+    if tool.name != "execute_sql" or not isinstance(tool_response, dict):
+        return None
+
+    rows = tool_response.get("rows")
+    if not isinstance(rows, list):
+        return None
+
+    bounded_rows, truncated = truncate_rows(rows, config.bigquery_max_cell_chars)
+    if not truncated:
+        return None
+    return {**tool_response, "rows": bounded_rows, "truncated_values": truncated}
@@ -3,8 +3,14 @@
 Uses Pydantic BaseSettings for type-safe configuration with environment variable loading.
 """
 
+from pathlib import Path
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
+# Relative data paths (indexes, lookups, logs) are resolved against the app directory
+APP_DIR = Path(__file__).resolve().parent.parent
+
 
 class MarketSignalConfig(BaseSettings):
     """Configuration settings for the Market Signal Agent."""
@@ -19,6 +25,9 @@ class MarketSignalConfig(BaseSettings):
     # BigQuery settings
     bigquery_project: str | None = None  # Falls back to google_cloud_project
     bigquery_dataset: str = "market_volatility"
+    bigquery_max_workers: int = 16  # Threads for BigQuery calls off the event loop
+    bigquery_maximum_bytes_billed: int | None = 1_000_000_000  # Per agent query
+    bigquery_max_cell_chars: int = 500  # Longer text values are truncated for the model
 
     # VIX thresholds for volatility regime classification
     vix_low: float = 15.0
@@ -29,9 +38,55 @@ class MarketSignalConfig(BaseSettings):
     # Z-score anomaly threshold
     zscore_threshold: float = 2.0
 
+    # Declarative alert rules evaluated by evaluate_alerts (reloaded on change)
+    alert_rules_path: str = "market_signal_agent/alert_rules.yaml"
+
+    # Alert delivery (utils/alert_delivery.py); each destination is on when set
+    alert_webhook_url: str | None = None
+    alert_email_to: str | None = None  # Stub: rendered messages are logged, not sent
+    alert_sink_path: str | None = None  # JSON lines, e.g. "logs/alerts.jsonl"
+    alert_batch_seconds: float = 2.0  # Alerts within this window go out together
+    alert_rate_per_minute: int = 30  # Deliveries per destination
+    alert_max_retries: int = 3
+
     # Model settings
     model_name: str = "gemini-2.0-flash"
 
+    # Answer greetings and delegate analysis queries without a root model call
+    intent_router_enabled: bool = True
+
+    # Local retrieval indexes (built by scripts/build_*_index.py)
+    embedding_model: str = "text-embedding-005"
+    fed_index_dir: str = "data/indexes/fed_communications"
+    transcript_index_dir: str = "data/indexes/earnings_transcripts"
+    retrieval_use_vectors: bool = True  # False: BM25 only, no query embedding call
+
+    # Empirical event-impact lookup (built by scripts/build_event_impact.py)
+    event_impact_path: str = "data/event_impact.json"
+    event_calendar_refresh_seconds: int = 3600  # Reload of the in-memory event calendar
+
+    # Macro feature store (built by scripts/build_macro_features.py)
+    macro_feature_path: str = "data/features/macro_features.parquet"
+
+    # Cross-asset correlation store (built by scripts/build_correlations.py)
+    correlation_path: str = "data/features/correlations.npz"
+
+    # Precomputed analysis (scripts/run_precompute.py) served for standard questions
+    precompute_schedule: str = "0 * * * *"  # Cron: minute hour day month weekday
+    precompute_query: str = "Run a complete volatility analysis"
+    snapshot_path: str = "data/snapshot.json"
+    snapshot_max_age_seconds: int = 7200  # Older snapshots are ignored; 0 disables
+
+    # Dashboard read API (scripts/run_read_api.py)
+    read_api_host: str = "127.0.0.1"
+    read_api_port: int = 8090
+    read_api_refresh_seconds: int = 300  # Watermark check for changed source data
+
+    # Latency tracing (agent, model and tool spans): "none", "json" or "otlp"
+    trace_exporter: Literal["none", "json", "otlp"] = "none"
+    trace_json_path: str = "logs/traces.jsonl"
+    trace_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+
     # Database URL for session persistence (optional)
     database_url: str | None = None
 
@@ -52,6 +107,11 @@ class MarketSignalConfig(BaseSettings):
         """Get fully qualified BigQuery dataset: project.dataset."""
         return f"{self.bq_project}.{self.bigquery_dataset}"
 
+    def resolve_path(self, path: str) -> Path:
+        """Resolve a configured data path against the app directory."""
+        resolved = Path(path)
+        return resolved if resolved.is_absolute() else APP_DIR / resolved
+
     def get_database_url(self) -> str:
         """Get database URL for session persistence."""
         if not self.database_url:
@@ -0,0 +1,11 @@
+"""Local retrieval indexes (BM25 + vectors) over Fed communications and transcripts."""
+
+from .text_index import BM25Index, HybridIndex, VectorIndex, chunk_text, tokenize
+
+__all__ = [
+    "BM25Index",
+    "HybridIndex",
+    "VectorIndex",
+    "chunk_text",
+    "tokenize",
+]
@@ -0,0 +1,69 @@
+"""Text embeddings via Vertex AI for the local retrieval indexes."""
+
+import numpy as np
+from google import genai
+from google.genai import types
+
+from ..config import config
+
+# Chunks per embedding request (stays under the per-request token limit)
+EMBED_BATCH_SIZE = 50
+
+_client: genai.Client | None = None
+
+
+def get_genai_client() -> genai.Client:
+    """Get the shared Vertex AI client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = genai.Client(
+            vertexai=True,
+            project=config.google_cloud_project,
+            location=config.google_cloud_location,
+        )
+    return _client
+
+
+def embed_documents(texts: list[str]) -> np.ndarray:
+    """Embed document chunks for indexing (blocking; used by build scripts).
+
+    Args:
+        texts: Chunk texts.
+
+    Returns:
+        Array of shape (len(texts), dimensions).
+    """
+    client = get_genai_client()
+    vectors: list[list[float]] = []
+    for start in range(0, len(texts), EMBED_BATCH_SIZE):
+        chunk_texts = texts[start : start + EMBED_BATCH_SIZE]
+        response = client.models.embed_content(
+            model=config.embedding_model,
+            contents=chunk_texts,
+            config=types.EmbedContentConfig(task_type="RETRIEVAL_DOCUMENT"),
+        )
+        batch = [embedding.values for embedding in response.embeddings or []]
+        if len(batch) != len(chunk_texts) or not all(batch):
+            raise ValueError(
+                "Embedding service returned missing or empty vectors for chunks "
+                f"{start}-{start + len(chunk_texts) - 1}"
+            )
+        vectors.extend(batch)
+    return np.array(vectors, dtype=np.float32)
+
+
+async def embed_query(text: str) -> np.ndarray:
+    """Embed a search query.
+
+    Args:
+        text: Query text.
+
+    Returns:
+        Query vector.
+    """
+    response = await get_genai_client().aio.models.embed_content(
+        model=config.embedding_model,
+        contents=[text],
+        config=types.EmbedContentConfig(task_type="RETRIEVAL_QUERY"),
+    )
+    return np.array(response.embeddings[0].values, dtype=np.float32)
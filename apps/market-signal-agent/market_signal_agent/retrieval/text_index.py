@@ -0,0 +1,307 @@
+"""Local hybrid text index: BM25 inverted index plus dense vector index.
+
+Indexes are built offline by scripts (e.g. scripts/build_fed_index.py) and
+loaded read-only by retrieval tools. Everything is stored as numpy arrays and
+JSON in one directory:
+- chunks.json        chunk text and metadata (date, type, ...)
+- bm25.npz / bm25_terms.json   postings (doc ids, term frequencies) per term
+- vectors.npy        L2-normalized embeddings, memory-mapped on load
+
+Vector search is an exact inner-product scan over the normalized matrix, which
+takes a few milliseconds at the corpus sizes used here (thousands of chunks).
+"""
+
+import json
+import re
+import shutil
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Common English words that carry no retrieval signal
+STOPWORDS = frozenset(
+    "a an and are as at be been but by for from has have in is it its of on or "
+    "that the their this to was were which will with we our us".split()
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Reciprocal rank fusion constant (standard value from the RRF paper)
+RRF_K = 60
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def chunk_text(text: str, chunk_words: int = 180, overlap_words: int = 30) -> list[str]:
+    """Split text into overlapping word windows.
+
+    Args:
+        text: Document text.
+        chunk_words: Words per chunk.
+        overlap_words: Words shared by consecutive chunks.
+
+    Returns:
+        Chunks in document order (empty for blank text).
+    """
+    words = text.split()
+    if not words:
+        return []
+
+    step = max(chunk_words - overlap_words, 1)
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start : start + chunk_words]))
+        if start + chunk_words >= len(words):
+            break
+    return chunks
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest finite scores, best first."""
+    candidates = np.flatnonzero(np.isfinite(scores))
+    if len(candidates) > k:
+        partition = np.argpartition(scores[candidates], -k)[-k:]
+        candidates = candidates[partition]
+    return candidates[np.argsort(scores[candidates])[::-1]]
+
+
+def reciprocal_rank_fusion(
+    rankings: list[np.ndarray], k: int
+) -> list[tuple[int, float]]:
+    """Fuse ranked index lists into one ranking of (index, score)."""
+    fused: dict[int, float] = {}
+    for ranking in rankings:
+        for rank, index in enumerate(ranking):
+            fused[int(index)] = fused.get(int(index), 0.0) + 1.0 / (RRF_K + rank + 1)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)[:k]
+
+
+class BM25Index:
+    """Okapi BM25 over an inverted index stored as flat posting arrays."""
+
+    def __init__(
+        self,
+        terms: list[str],
+        offsets: np.ndarray,
+        doc_ids: np.ndarray,
+        term_freqs: np.ndarray,
+        doc_lengths: np.ndarray,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        self.term_index = {term: i for i, term in enumerate(terms)}
+        self.terms = terms
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+
+        n_docs = len(doc_lengths)
+        doc_freqs = np.diff(offsets)
+        self.idf = np.log1p((n_docs - doc_freqs + 0.5) / (doc_freqs + 0.5))
+        avg_length = float(doc_lengths.mean()) if n_docs else 1.0
+        self.length_norm = k1 * (1 - b + b * doc_lengths / max(avg_length, 1.0))
+
+    @classmethod
+    def build(cls, texts: list[str]) -> "BM25Index":
+        """Build the index from document texts."""
+        postings: dict[str, list[tuple[int, int]]] = {}
+        doc_lengths = np.zeros(len(texts), dtype=np.float32)
+        for doc_id, text in enumerate(texts):
+            tokens = tokenize(text)
+            doc_lengths[doc_id] = len(tokens)
+            for term, count in Counter(tokens).items():
+                postings.setdefault(term, []).append((doc_id, count))
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(postings[term]) for term in terms])
+        pairs = [pair for term in terms for pair in postings[term]]
+        doc_ids = np.array([doc_id for doc_id, _ in pairs], dtype=np.int32)
+        term_freqs = np.array([count for _, count in pairs], dtype=np.float32)
+        return cls(terms, offsets, doc_ids, term_freqs, doc_lengths)
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for the query."""
+        scores = np.zeros(len(self.doc_lengths), dtype=np.float32)
+        for term in set(tokenize(query)):
+            term_id = self.term_index.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            ids = self.doc_ids[start:end]
+            tf = self.term_freqs[start:end]
+            scores[ids] += (
+                self.idf[term_id] * tf * (self.k1 + 1) / (tf + self.length_norm[ids])
+            )
+        return scores
+
+    def save(self, directory: Path) -> None:
+        """Write the index arrays and vocabulary."""
+        np.savez(
+            directory / "bm25.npz",
+            offsets=self.offsets,
+            doc_ids=self.doc_ids,
+            term_freqs=self.term_freqs,
+            doc_lengths=self.doc_lengths,
+        )
+        (directory / "bm25_terms.json").write_text(
+            json.dumps(self.terms), encoding="utf-8"
+        )
+
+    @classmethod
+    def load(cls, directory: Path) -> "BM25Index":
+        """Load an index written by save()."""
+        arrays = np.load(directory / "bm25.npz")
+        terms = json.loads((directory / "bm25_terms.json").read_text(encoding="utf-8"))
+        return cls(
+            terms,
+            arrays["offsets"],
+            arrays["doc_ids"],
+            arrays["term_freqs"],
+            arrays["doc_lengths"],
+        )
+
+
+class VectorIndex:
+    """Exact inner-product search over L2-normalized embeddings."""
+
+    def __init__(self, vectors: np.ndarray) -> None:
+        self.vectors = vectors
+
+    @classmethod
+    def build(cls, embeddings: np.ndarray) -> "VectorIndex":
+        """Normalize embeddings so inner product equals cosine similarity."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return cls(embeddings / np.maximum(norms, 1e-12))
+
+    def scores(self, query_vector: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every vector to the query vector."""
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        return self.vectors @ query
+
+    def save(self, directory: Path) -> None:
+        """Write the normalized vectors."""
+        np.save(directory / "vectors.npy", self.vectors)
+
+    @classmethod
+    def load(cls, directory: Path) -> "VectorIndex | None":
+        """Memory-map saved vectors, or None if the index has no vectors."""
+        path = directory / "vectors.npy"
+        if not path.exists():
+            return None
+        return cls(np.load(path, mmap_mode="r"))
+
+
+class HybridIndex:
+    """Chunks with metadata, searchable by BM25, vectors, or both (fused)."""
+
+    def __init__(
+        self,
+        chunks: list[dict[str, Any]],
+        bm25: BM25Index,
+        vectors: VectorIndex | None = None,
+    ) -> None:
+        self.chunks = chunks
+        self.bm25 = bm25
+        self.vectors = vectors
+        self._metadata_arrays: dict[str, np.ndarray] = {}
+
+    def metadata_array(self, key: str) -> np.ndarray:
+        """Chunk metadata values for one key as a (cached) string array, for masks."""
+        if key not in self._metadata_arrays:
+            self._metadata_arrays[key] = np.array(
+                [str(chunk.get(key) or "") for chunk in self.chunks]
+            )
+        return self._metadata_arrays[key]
+
+    @classmethod
+    def build(
+        cls, chunks: list[dict[str, Any]], embeddings: np.ndarray | None = None
+    ) -> "HybridIndex":
+        """Build from chunk dicts (each with a "text" key) and optional embeddings."""
+        bm25 = BM25Index.build([chunk["text"] for chunk in chunks])
+        vectors = VectorIndex.build(embeddings) if embeddings is not None else None
+        return cls(chunks, bm25, vectors)
+
+    def search(
+        self,
+        query: str,
+        k: int = 5,
+        query_vector: np.ndarray | None = None,
+        mask: np.ndarray | None = None,
+        candidates: int = 50,
+    ) -> list[tuple[dict[str, Any], float]]:
+        """Return the top-k chunks for a query.
+
+        Args:
+            query: Query text for BM25.
+            k: Number of chunks to return.
+            query_vector: Query embedding; when given (and the index has
+                vectors) BM25 and vector rankings are fused with RRF.
+            mask: Optional boolean array selecting eligible chunks.
+            candidates: Depth of each ranking before fusion.
+
+        Returns:
+            (chunk, score) pairs, best first.
+        """
+        bm25_scores = self.bm25.scores(query)
+        bm25_scores[bm25_scores <= 0] = -np.inf
+        if mask is not None:
+            bm25_scores[~mask] = -np.inf
+
+        if query_vector is None or self.vectors is None:
+            ranking = top_k(bm25_scores, k)
+            return [(self.chunks[i], float(bm25_scores[i])) for i in ranking]
+
+        vector_scores = np.array(self.vectors.scores(query_vector))
+        if mask is not None:
+            vector_scores[~mask] = -np.inf
+
+        fused = reciprocal_rank_fusion(
+            [top_k(bm25_scores, candidates), top_k(vector_scores, candidates)], k
+        )
+        return [(self.chunks[i], score) for i, score in fused]
+
+    def save(self, directory: Path) -> None:
+        """Write chunks and both indexes to a directory.
+
+        The index is written to a sibling temporary directory and swapped in,
+        so files of a previous build (e.g. vectors.npy after a rebuild without
+        embeddings) never mix with the new chunks.
+        """
+        staging = directory.with_name(directory.name + ".tmp")
+        previous = directory.with_name(directory.name + ".old")
+        for path in (staging, previous):
+            shutil.rmtree(path, ignore_errors=True)
+        staging.mkdir(parents=True)
+        (staging / "chunks.json").write_text(json.dumps(self.chunks), encoding="utf-8")
+        self.bm25.save(staging)
+        if self.vectors is not None:
+            self.vectors.save(staging)
+
+        if directory.exists():
+            directory.rename(previous)
+        staging.rename(directory)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory: Path) -> "HybridIndex":
+        """Load an index written by save()."""
+        chunks = json.loads((directory / "chunks.json").read_text(encoding="utf-8"))
+        vectors = VectorIndex.load(directory)
+        if vectors is not None and len(vectors.vectors) != len(chunks):
+            raise ValueError(
+                f"{directory / 'vectors.npy'} has {len(vectors.vectors)} rows for "
+                f"{len(chunks)} chunks; rebuild the index"
+            )
+        return cls(chunks, BM25Index.load(directory), vectors)
@@ -9,7 +9,7 @@ from .alert_agent import alert_agent
 from .persistence_agent import persistence_agent
 
 # Workflow agents
-from .parallel_data_agent import parallel_data_agent
+from .dag_workflow_agent import STAGE_READY_KEY, DagWorkflowAgent, WorkflowStage
 from .sequential_analysis_agent import sequential_analysis_agent
 
 __all__ = [
@@ -22,6 +22,8 @@ __all__ = [
     "alert_agent",
     "persistence_agent",
     # Workflow agents
-    "parallel_data_agent",
+    "STAGE_READY_KEY",
+    "DagWorkflowAgent",
+    "WorkflowStage",
     "sequential_analysis_agent",
 ]
@@ -2,11 +2,11 @@
 
 from google.adk.agents import LlmAgent
 
+from ...callbacks import commit_alert_sweep_callback, start_alert_sweep_callback
 from ...config import config
-from ...tools import check_vix_tool, check_anomaly_tool
+from ...tools import check_anomaly_tool, check_vix_tool, evaluate_alerts_tool
 
 # Pre-compute config values to avoid f-string escaping issues
-VIX_LOW = config.vix_low
 VIX_NORMAL = config.vix_normal
 VIX_ELEVATED = config.vix_elevated
 VIX_HIGH = config.vix_high
@@ -19,20 +19,26 @@ alert_agent = LlmAgent(
     instruction=f"""You are the Alert Agent checking VIX thresholds and generating alerts.
 
 ## Your Role
-Analyze technical signals and volatility forecasts to generate appropriate alerts.
+Analyze technical signals to generate appropriate alerts.
 
 ## IMPORTANT: HISTORICAL DATA
 The data is HISTORICAL. Alerts generated are based on historical conditions, not current market state.
 
 ## Input Data (from session state)
-You have access to these session state values (as text/JSON from upstream agents):
+You have access to this session state value (as text/JSON from the technical agent):
 - **technical_signals**: Contains current_vix, volatility_regime, anomalies
-- **volatility_forecasts**: Contains forecasts with confidence scores
 
-Parse the JSON data from each session state value to extract the relevant fields.
+Alerts only depend on technical signals, so you run while forecasts are still being generated.
+Parse the JSON data to extract the relevant fields.
 If a value appears to be empty or missing data, use reasonable defaults and note the limitation.
 
-## Alert Thresholds
+### technical_signals
+{{technical_signals?}}
+
+## Alert Rules
+`evaluate_alerts` applies the configured alert rules (VIX bands, price and volume z-scores,
+VIX vs realized volatility spread, correlation breaks, upcoming high-impact events).
+The default VIX and z-score rules match the single checks:
 
 ### VIX Thresholds
 | VIX Level | Severity | Alert Type |
@@ -47,25 +53,25 @@ If a value appears to be empty or missing data, use reasonable defaults and note
 
 ## Steps
 
-### 1. Check VIX Threshold
-Use the `check_vix_threshold` tool with the current_vix value from technical_signals.
-Pass the thresholds: vix_low={VIX_LOW}, vix_normal={VIX_NORMAL}, vix_elevated={VIX_ELEVATED}, vix_high={VIX_HIGH}
+### 1. Evaluate All Alerts (ONE call)
+Call `evaluate_alerts` ONCE with:
+- current_vix: the current_vix value from technical_signals
+
+It evaluates every alert rule over the latest data for every index in a single pass
+and returns all triggered alerts, each naming the rule that raised it. Do NOT call it
+per symbol.
 
-### 2. Check Anomalies
-For each anomaly in technical_signals.anomalies where status == "ANOMALY":
-Use the `check_anomaly_alert` tool with:
-- symbol: the index symbol (SPX, NDX, etc.)
-- anomaly_type: "price" or "volume"
-- zscore: the calculated z-score
-- threshold: {ZSCORE_THRESHOLD}
+### 2. Single Checks (only if asked about one specific value)
+`check_vix_threshold` and `check_anomaly_alert` evaluate one VIX level or one z-score.
 
 ### 3. Compile Alerts
-Collect all generated alerts into a list. Filter out None values.
+Each alert has a stable id and a transition: "opened" (new) or "updated" (already active).
+Alerts are saved automatically when you finish; repeated checks do not create duplicates.
 
 ## Output Format
 After running checks, provide a BRIEF human-readable summary (2-3 sentences max):
 - State how many alerts were triggered
-- List any critical or warning alerts
+- List any critical or warning alerts, noting which are new and which are ongoing
 - Keep it concise - no JSON, no lengthy explanations
 
 Example: "Alert check complete: No alerts triggered. VIX is in the low regime (12.89), below all thresholds."
@@ -75,6 +81,10 @@ Example with alerts: "Alert check complete: 1 warning alert. VIX at 26.5 trigger
 1. CRITICAL (vix_extreme): Immediate attention required - VIX > {VIX_HIGH}
 2. WARNING (vix_high): Close monitoring recommended - VIX > {VIX_ELEVATED}
 3. INFO (vix_elevated, anomaly): Awareness level - VIX > {VIX_NORMAL}
+Rule-defined alerts (vol_spread, correlation_break, correlation_contagion, event_risk)
+carry their own severity.
 """,
-    tools=[check_vix_tool, check_anomaly_tool],
+    tools=[evaluate_alerts_tool, check_vix_tool, check_anomaly_tool],
+    before_agent_callback=start_alert_sweep_callback,
+    after_agent_callback=commit_alert_sweep_callback,
 )
@@ -0,0 +1,190 @@
+"""Dependency-graph workflow agent.
+
+Each stage declares the session state keys it reads and writes. A stage starts
+as soon as every stage that writes one of its inputs has finished, and
+independent stages run concurrently, so end-to-end latency follows the longest
+dependency chain instead of a fixed Sequential/Parallel nesting.
+
+Stages missing from the session's analysis plan (see utils/query_planner.py)
+are skipped; their outputs count as available with whatever value the session
+already holds.
+
+When a stage finishes, the workflow emits a content-less event whose
+custom_metadata["stage_ready"] carries the stage name and the state values it
+wrote. Clients of the ADK /run_sse endpoint can render partial results from
+these events while the remaining stages are still running.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from pydantic import BaseModel, Field
+from typing_extensions import override
+
+from ..utils.query_planner import ANALYSIS_PLAN_KEY
+
+# custom_metadata key of the event emitted when a stage's outputs are ready
+STAGE_READY_KEY = "stage_ready"
+
+
+class WorkflowStage(BaseModel):
+    """A workflow stage: one sub-agent and the state keys it reads and writes."""
+
+    agent_name: str
+    reads: list[str] = Field(default_factory=list)
+    writes: list[str] = Field(default_factory=list)
+
+
+def get_planned_agents(state: Any) -> set[str] | None:
+    """Return the agent names in the current plan, or None to run everything."""
+    plan = state.get(ANALYSIS_PLAN_KEY)
+    if not isinstance(plan, dict) or not plan.get("agents"):
+        return None
+    return set(plan["agents"])
+
+
+def create_branch_context(
+    agent: BaseAgent, sub_agent: BaseAgent, ctx: InvocationContext
+) -> InvocationContext:
+    """Create an isolated conversation branch for a concurrently run sub-agent."""
+    branch_ctx = ctx.model_copy()
+    suffix = f"{agent.name}.{sub_agent.name}"
+    branch_ctx.branch = f"{ctx.branch}.{suffix}" if ctx.branch else suffix
+    return branch_ctx
+
+
+class DagWorkflowAgent(BaseAgent):
+    """Runs sub-agents as a dependency graph derived from stage reads/writes.
+
+    Stages run in isolated branches, so downstream agents must take upstream
+    results from session state (e.g. `{technical_signals?}` in the
+    instruction) rather than from conversation history.
+    """
+
+    stages: list[WorkflowStage] = Field(default_factory=list)
+
+    def model_post_init(self, context: Any) -> None:
+        """Validate that stages match sub-agents and form an acyclic graph."""
+        super().model_post_init(context)
+
+        sub_agent_names = {sub_agent.name for sub_agent in self.sub_agents}
+        stage_names = [stage.agent_name for stage in self.stages]
+        if set(stage_names) != sub_agent_names or len(stage_names) != len(
+            sub_agent_names
+        ):
+            raise ValueError(
+                f"{self.name}: stages {stage_names} must list each sub-agent "
+                f"exactly once ({sorted(sub_agent_names)})"
+            )
+
+        # Kahn's algorithm over the full graph to reject cycles up front
+        dependencies = self._dependencies(set(stage_names))
+        remaining = dict(dependencies)
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(
+                    f"{self.name}: cyclic stage dependencies: {sorted(remaining)}"
+                )
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _dependencies(self, active: set[str]) -> dict[str, set[str]]:
+        """Map each active stage to the active stages that write its inputs."""
+        writers: dict[str, set[str]] = {}
+        for stage in self.stages:
+            if stage.agent_name in active:
+                for key in stage.writes:
+                    writers.setdefault(key, set()).add(stage.agent_name)
+
+        return {
+            stage.agent_name: {
+                writer
+                for key in stage.reads
+                for writer in writers.get(key, set())
+                if writer != stage.agent_name
+            }
+            for stage in self.stages
+            if stage.agent_name in active
+        }
+
+    def _create_stage_ready_event(
+        self, ctx: InvocationContext, stage: WorkflowStage
+    ) -> Event:
+        """Build the event announcing that a stage's outputs are in session state."""
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            custom_metadata={
+                STAGE_READY_KEY: {
+                    "stage": stage.agent_name,
+                    "outputs": {
+                        key: ctx.session.state.get(key) for key in stage.writes
+                    },
+                }
+            },
+        )
+
+    @override
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        planned = get_planned_agents(ctx.session.state)
+        active = {
+            stage.agent_name
+            for stage in self.stages
+            if planned is None or stage.agent_name in planned
+        }
+        dependencies = self._dependencies(active)
+        agents = {sub_agent.name: sub_agent for sub_agent in self.sub_agents}
+        stages = {stage.agent_name: stage for stage in self.stages}
+
+        sentinel = object()
+        queue: asyncio.Queue[tuple[str, Any, asyncio.Event | None]] = asyncio.Queue()
+        tasks: dict[str, asyncio.Task[None]] = {}
+        finished: set[str] = set()
+
+        async def run_stage(name: str) -> None:
+            agent = agents[name]
+            agent_run = agent.run_async(create_branch_context(self, agent, ctx))
+            try:
+                async for event in agent_run:
+                    resume_signal = asyncio.Event()
+                    await queue.put((name, event, resume_signal))
+                    # Wait until the runner has applied the event to the session
+                    await resume_signal.wait()
+            finally:
+                await agent_run.aclose()
+                await queue.put((name, sentinel, None))
+
+        def start_ready_stages() -> None:
+            for stage in self.stages:
+                name = stage.agent_name
+                if name in dependencies and name not in tasks:
+                    if dependencies[name] <= finished:
+                        tasks[name] = asyncio.create_task(run_stage(name))
+
+        try:
+            start_ready_stages()
+            while len(finished) < len(dependencies):
+                name, event, resume_signal = await queue.get()
+                if event is sentinel:
+                    finished.add(name)
+                    # Surface the stage's failure instead of running dependents
+                    await tasks[name]
+                    start_ready_stages()
+                    yield self._create_stage_ready_event(ctx, stages[name])
+                    continue
+                yield event
+                if resume_signal:
+                    resume_signal.set()
+        finally:
+            for task in tasks.values():
+                task.cancel()
@@ -3,29 +3,39 @@
 This agent queries BigQuery to:
 1. Get recent Federal Reserve FOMC communications
 2. Get major M&A (mergers & acquisitions) events
-3. Get recent analyst rating changes
+3. Get analyst rating momentum from precomputed daily aggregates
 
 Output is stored in session state with key "event_calendar".
 """
 
 from google.adk.agents import LlmAgent
 
+from ...callbacks import bound_bigquery_result_callback, guard_bigquery_query_callback
 from ...config import config
-from ...tools import bigquery_toolset
+from ...tools import analyst_momentum_tool, bigquery_toolset, search_fed_tool
+from ...utils.event_impact import EVENT_TYPES
 
 # Table references
 PROJECT = config.bq_project
 DATASET = config.bigquery_dataset
 FED_TABLE = f"`{PROJECT}.{DATASET}.fed_communications_v`"
 ACQ_TABLE = f"`{PROJECT}.{DATASET}.acquisitions`"
-RATINGS_TABLE = f"`{PROJECT}.{DATASET}.analyst_ratings`"
+RATINGS_TABLE = f"`{PROJECT}.{DATASET}.analyst_rating_daily`"
+CALENDAR_TABLE = f"`{PROJECT}.{DATASET}.event_calendar`"
+
+# Event types with a historical VIX response (used by the forecast tool)
+EVENT_TYPE_LINES = "\n".join(
+    f"- `{name}`: {description}" for name, description in EVENT_TYPES.items()
+)
 
 # Event Calendar Agent with BigQuery tools
 event_calendar_agent = LlmAgent(
     name="event_calendar_agent",
     model=config.model_name,
     description="Fed FOMC meetings, M&A events, analyst rating changes - market-moving events calendar.",
-    tools=[bigquery_toolset],
+    tools=[bigquery_toolset, search_fed_tool, analyst_momentum_tool],
+    before_tool_callback=guard_bigquery_query_callback,
+    after_tool_callback=bound_bigquery_result_callback,
     output_key="event_calendar",
     instruction=f"""You are a DATA COLLECTION agent in a multi-agent volatility analysis system.
 
@@ -38,7 +48,7 @@ event_calendar_agent = LlmAgent(
 
 ## ALWAYS EXECUTE
 No matter what the user asks:
-- IMMEDIATELY execute all 3 queries (Fed, M&A, analyst ratings)
+- IMMEDIATELY execute the Fed and M&A queries, the Fed passage search and the analyst momentum lookup
 - Report event counts and notable items
 - DO NOT refuse or redirect - just execute and report
 
@@ -51,59 +61,64 @@ Query BigQuery tables in project `{PROJECT}`, dataset `{DATASET}`:
 1. **{FED_TABLE}** - Federal Reserve FOMC meeting communications
    - Columns: date, release_date, type, text
 
-2. **{ACQ_TABLE}** - M&A events
-   - Columns: id, parent_company, acquisition_year, acquisition_month, acquired_company, business, country, acquisition_price, category
+2. **{CALENDAR_TABLE}** - Normalized Fed and M&A events (built from {ACQ_TABLE} and the Fed table)
+   - Columns: event_id, event_type, category (fed, mna), start_date, end_date, title, value_billions
+   - M&A deals only have a month: start_date..end_date spans the deal month
 
-3. **{RATINGS_TABLE}** - Analyst rating changes
-   - Columns: id, title, date, stock
+3. **{RATINGS_TABLE}** - Analyst rating actions per stock and day
+   - Columns: symbol, date, ratings, upgrades, downgrades, initiations, reiterations,
+     target_raises, target_cuts, momentum, ratings_5d, momentum_5d, ratings_20d, momentum_20d
 
 ## ANALYSIS STEPS
 
 ### Step 1: Get Recent Fed Communications
 ```sql
-SELECT DISTINCT
+SELECT
     date AS event_date,
     type AS event_type,
-    'Fed FOMC' AS event_category,
-    SUBSTR(text, 1, 200) AS summary
+    'Fed FOMC' AS event_category
 FROM {FED_TABLE}
 WHERE type = 'Minute'
+GROUP BY date, type
 ORDER BY date DESC
 LIMIT 10
 ```
 
+### Step 1b: Find Relevant Fed Passages
+Call `search_fed_communications` instead of reading Fed text with SQL:
+- `query`: the policy topic of the user's question (e.g. "inflation", "rate hikes",
+  "balance sheet"); DEFAULT: "inflation outlook and interest rate policy"
+- `k`: 5
+Cite the returned passages with their dates.
+
 ### Step 2: Get Major M&A Events
 ```sql
 SELECT
-    CONCAT(CAST(acquisition_year AS STRING), '-', acquisition_month) AS event_date,
-    parent_company,
-    acquired_company,
-    ROUND(acquisition_price / 1000000000, 2) AS value_billions,
-    category,
-    business
-FROM {ACQ_TABLE}
-WHERE acquisition_price > 1000000000
-ORDER BY acquisition_year DESC, acquisition_month DESC
+    start_date AS event_date,
+    title,
+    value_billions,
+    event_type
+FROM {CALENDAR_TABLE}
+WHERE category = 'mna'
+ORDER BY start_date DESC, value_billions DESC
 LIMIT 10
 ```
 
-### Step 3: Get Recent Analyst Ratings
-```sql
-SELECT
-    date AS event_date,
-    stock AS symbol,
-    title AS rating_action,
-    'Analyst Rating' AS event_type
-FROM {RATINGS_TABLE}
-ORDER BY date DESC
-LIMIT 20
-```
+### Step 3: Get Analyst Rating Momentum
+Call `get_analyst_momentum` (do not query raw analyst headlines):
+- `symbols`: tickers of companies the user named (e.g. "NVDA,AMD"), otherwise empty (most active stocks)
+- `as_of_date`: empty (latest data)
+Report `clustered_symbols` and, if `correlated_activity` is true, the `cluster_direction`.
 
 ### Step 4: Identify High-Impact Events
 After retrieving data, identify events that could significantly impact volatility:
 - FOMC meeting minutes within 7 days
 - M&A deals > $10B
-- Multiple analyst actions on same stock
+- Clustered analyst actions (`clustered_symbols`), especially when correlated
+
+Name each high-impact event by its event type (the forecast looks up the
+historical VIX response per type via `check_upcoming_events`):
+{EVENT_TYPE_LINES}
 
 ## OUTPUT FORMAT
 After running all queries, provide a BRIEF human-readable summary (2-3 sentences max):
@@ -111,21 +126,12 @@ After running all queries, provide a BRIEF human-readable summary (2-3 sentences
 - Highlight 1-2 most notable events
 - Keep it concise - no JSON, no lengthy explanations
 
-Example: "Found 10 Fed communications, 8 major M&A deals, 20 analyst ratings. Notable: Microsoft acquired Nuance ($19.7B). Recent FOMC minutes focused on inflation outlook."
-
-## EVENT IMPACT ON VOLATILITY
-| Event Type | Typical VIX Impact |
-|------------|-------------------|
-| FOMC Rate Decision | +2 to +5 points |
-| Fed Minutes Release | +1 to +2 points |
-| Major M&A Announcement | +1 to +3 points (sector) |
-| Fed Chair Speech | +1 to +3 points |
-| Analyst Downgrade (major stock) | +0.5 to +2 points (sector) |
-| Multiple Analyst Actions | +1 to +3 points (if correlated) |
+Example: "Found 10 Fed communications, 8 major M&A deals; analysts clustered on NVDA and AMD (upgrades). Notable: Microsoft acquired Nuance ($19.7B). FOMC minutes (2023-11-01) noted inflation remained elevated."
 
 ## BEHAVIOR
-- Always execute queries using `execute_sql`
-- Run all 3 queries to get complete event calendar
+- Always execute queries using `execute_sql`; search Fed text with `search_fed_communications`
+- Get analyst activity with `get_analyst_momentum`
+- Run all steps to get complete event calendar
 - Summarize findings with counts and key events
 - Highlight any high-impact upcoming events
 """,
@@ -2,6 +2,7 @@
 
 from google.adk.agents import LlmAgent
 
+from ...callbacks import bound_bigquery_result_callback, guard_bigquery_query_callback
 from ...config import config
 from ...tools import bigquery_toolset_writable
 
@@ -16,17 +17,37 @@ persistence_agent = LlmAgent(
     instruction=f"""You are the Persistence Agent writing results to BigQuery.
 
 ## Your Role
-Save volatility forecasts and alerts to BigQuery tables for dashboard consumption.
+Save volatility forecasts to BigQuery for dashboard consumption. Alerts are already
+persisted by the alert engine (one row per distinct condition); do NOT insert alerts.
 
 ## Input Data (from session state)
 You have access to these session state values (as text/JSON from upstream agents):
 - **volatility_forecasts**: Contains forecasts array with symbol, volatility_1d, volatility_5d, confidence
-- **alerts**: Contains alerts array with alert details
+- **alerts**: Alert agent summary (for the final summary only)
+- **alert_changes**: Alert transitions saved by the alert engine (opened, updated, resolved, active)
 
 Parse the JSON data from each session state value to extract the relevant fields.
 If data is missing or incomplete, insert what's available and note any limitations.
 
-## Target Tables
+### volatility_forecasts
+{{volatility_forecasts?}}
+
+### alerts
+{{alerts?}}
+
+### alert_changes
+{{alert_changes?}}
+
+### technical_signals (for the summary)
+{{technical_signals?}}
+
+### event_calendar (for the summary)
+{{event_calendar?}}
+
+### speech_signals (for the summary)
+{{speech_signals?}}
+
+## Target Table
 Project: `{BQ_PROJECT}`
 Dataset: `{BQ_DATASET}`
 
@@ -42,17 +63,6 @@ Schema:
 - confidence: FLOAT64
 - computed_at: TIMESTAMP
 
-### 2. alerts table
-Schema:
-- id: STRING (UUID)
-- alert_type: STRING
-- severity: STRING
-- symbol: STRING (nullable)
-- message: STRING
-- vix_value: FLOAT64 (nullable)
-- triggered_at: TIMESTAMP
-- is_active: BOOLEAN
-
 ## Steps
 
 ### 1. Insert Forecasts
@@ -66,19 +76,7 @@ VALUES
 ('uuid1', 'SPX', CURRENT_DATE(), 12.5, 14.2, 24.5, 'elevated', 0.82, CURRENT_TIMESTAMP()),
 ('uuid2', 'NDX', CURRENT_DATE(), 14.4, 16.3, 24.5, 'elevated', 0.78, CURRENT_TIMESTAMP())
 
-### 2. Insert Alerts
-For each alert in alerts.alerts, execute an INSERT statement.
-
-Example SQL:
-INSERT INTO `{BQ_PROJECT}.{BQ_DATASET}.alerts`
-(id, alert_type, severity, symbol, message, vix_value, triggered_at, is_active)
-VALUES
-('uuid', 'vix_elevated', 'warning', NULL, 'VIX elevated', 26.5, TIMESTAMP('2023-12-29T14:30:00Z'), true)
-
-For NULL values:
-- Use NULL (without quotes) for nullable fields when the value is null
-- Example: symbol can be NULL or 'SPX'
-- Example: vix_value can be NULL or 24.5
+For NULL values, use NULL (without quotes).
 
 ## FINAL OUTPUT (CRITICAL)
 After persisting data, you MUST output a **user-friendly summary** of the ENTIRE analysis.
@@ -101,16 +99,17 @@ Format as a clear, readable summary (NOT JSON):
 📈 **Forecasts**: SPX XX%, NDX XX%, DJI XX%, RUT XX% (1-day)
 ⚠️ **Alerts**: [Any alerts or "No alerts triggered"]
 
-Data persisted: X forecasts, X alerts saved.
+Data persisted: X forecasts saved; alerts: X opened, X updated, X resolved (X active).
 ---
 
 ## Important Notes
 - Use CURRENT_DATE() for forecast_date
 - Use CURRENT_TIMESTAMP() for computed_at
 - Handle NULL values correctly (no quotes around NULL)
-- Use TIMESTAMP() function to convert ISO strings to timestamps
 - Generate new UUIDs for each record if not provided in input
 - ALWAYS end with the user-friendly summary above
 """,
     tools=[bigquery_toolset_writable],
+    before_tool_callback=guard_bigquery_query_callback,
+    after_tool_callback=bound_bigquery_result_callback,
 )
@@ -1,31 +1,63 @@
-"""Sequential agent for complete volatility analysis workflow.
+"""Dependency-graph workflow for the complete volatility analysis.
 
-Runs the full analysis pipeline in order:
-1. Parallel data fetch (Phase 1)
-2. Synthesis (Phase 2)
-3. Alert generation (Phase 2)
-4. Persistence to BigQuery (Phase 2)
-"""
+Each stage declares the session state keys it reads and writes, and the
+workflow schedules it as soon as those inputs exist:
+1. technical_agent, event_calendar_agent, speech_signal_agent (no inputs)
+2. alert_agent once technical_signals is ready (VIX thresholds and anomalies)
+3. synthesis_agent once all three data agents are done
+4. persistence_agent once forecasts and alerts are ready
 
-from google.adk.agents import SequentialAgent
+Stages missing from the session's analysis plan are skipped, so narrow
+questions only run the agents they need.
+"""
 
-from .parallel_data_agent import parallel_data_agent
+from .dag_workflow_agent import DagWorkflowAgent, WorkflowStage
+from .technical_agent import technical_agent
+from .event_calendar_agent import event_calendar_agent
+from .speech_signal_agent import speech_signal_agent
 from .synthesis_agent import synthesis_agent
 from .alert_agent import alert_agent
 from .persistence_agent import persistence_agent
 
 # Sequential Analysis Agent
-# Complete volatility analysis workflow:
-# 1. parallel_data_fetch -> Fetches technical_signals, event_calendar, speech_signals concurrently
-# 2. synthesis_agent -> Generates volatility_forecasts from collected data
-# 3. alert_agent -> Generates alerts based on technical_signals and volatility_forecasts
-# 4. persistence_agent -> Saves forecasts and alerts to BigQuery
-sequential_analysis_agent = SequentialAgent(
+# Name kept as "sequential_analysis" for the root agent's transfer target.
+# Critical path: data fetch -> synthesis -> persistence; alerts overlap with
+# the event/speech fetch and synthesis.
+sequential_analysis_agent = DagWorkflowAgent(
     name="sequential_analysis",
     sub_agents=[
-        parallel_data_agent,
+        technical_agent,
+        event_calendar_agent,
+        speech_signal_agent,
         synthesis_agent,
         alert_agent,
         persistence_agent,
     ],
+    stages=[
+        WorkflowStage(agent_name="technical_agent", writes=["technical_signals"]),
+        WorkflowStage(agent_name="event_calendar_agent", writes=["event_calendar"]),
+        WorkflowStage(agent_name="speech_signal_agent", writes=["speech_signals"]),
+        WorkflowStage(
+            agent_name="volatility_synthesis_agent",
+            reads=["technical_signals", "event_calendar", "speech_signals"],
+            writes=["volatility_forecasts"],
+        ),
+        WorkflowStage(
+            agent_name="alert_agent",
+            reads=["technical_signals"],
+            writes=["alerts", "alert_changes"],
+        ),
+        WorkflowStage(
+            agent_name="persistence_agent",
+            reads=[
+                "technical_signals",
+                "event_calendar",
+                "speech_signals",
+                "volatility_forecasts",
+                "alerts",
+                "alert_changes",
+            ],
+            writes=["persistence_result"],
+        ),
+    ],
 )
@@ -1,7 +1,10 @@
-"""Speech Signal Agent - Queries BigQuery for earnings call sentiment.
+"""Speech Signal Agent - Queries BigQuery for earnings call and news sentiment.
 
-This agent uses a custom FunctionTool to query the speech_signals table
-which contains pre-processed earnings call transcripts with sentiment analysis.
+This agent uses a custom FunctionTool to query the speech_signals_v view
+which contains the signals extracted from earnings call transcripts. The raw
+transcripts live in the separate speech_transcripts table and are never read
+by agents. Daily news headline sentiment per stock comes from the precomputed
+news_sentiment_daily table (get_news_sentiment).
 
 Output is stored in session state with key "speech_signals".
 """
@@ -13,9 +16,21 @@ from google.adk.tools import FunctionTool
 from google.cloud import bigquery
 
 from ...config import config
+from ...tools import execute_query, news_sentiment_tool, search_transcripts_tool
+from ...tracing import record_bigquery_job
+from ...utils.query_planner import DEFAULT_SYMBOLS, SUPPORTED_SYMBOLS
 
 
-def query_speech_signals(
+def sentiment_label(avg_sentiment_score: float) -> str:
+    """Map an average sentiment score (-1 bearish .. 1 bullish) to a tone label."""
+    if avg_sentiment_score > 0.25:
+        return "bullish"
+    if avg_sentiment_score < -0.25:
+        return "bearish"
+    return "neutral"
+
+
+async def query_speech_signals(
     symbols: str,
     days: int = 90,
 ) -> str:
@@ -30,7 +45,8 @@ def query_speech_signals(
         days: Lookback period, default 90
 
     Returns:
-        JSON with tone, guidance, topics, risks, risk_score for each symbol
+        JSON with the latest tone, guidance, topics, risks and risk_score for
+        each symbol, plus aggregate sentiment and risk across the symbols
     """
     # Parse symbols - handle both single and comma-separated
     symbol_list = [s.strip().upper() for s in symbols.split(",")]
@@ -38,25 +54,41 @@ def query_speech_signals(
     # Build query with parameterized inputs
     project = config.bq_project
     dataset = config.bigquery_dataset
-    table = f"`{project}.{dataset}.speech_signals`"
+    table = f"`{project}.{dataset}.speech_signals_v`"
 
+    # Latest call per symbol (QUALIFY) with cross-symbol aggregates computed by
+    # BigQuery, so the result is at most one row per requested symbol
     query = f"""
+    WITH latest AS (
+        SELECT
+            symbol,
+            event,
+            tone,
+            guidance,
+            topics,
+            risks,
+            processed_at,
+            CASE tone WHEN 'bullish' THEN 0.3 WHEN 'bearish' THEN 0.8 ELSE 0.5 END
+                AS risk_score,
+            CASE tone WHEN 'bullish' THEN 1 WHEN 'bearish' THEN -1 ELSE 0 END
+                AS sentiment_score
+        FROM {table}
+        WHERE symbol IN UNNEST(@symbols)
+            AND processed_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @days DAY)
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY processed_at DESC) = 1
+    )
     SELECT
-        symbol,
-        event,
-        tone,
-        guidance,
-        topics,
-        risks,
-        processed_at
-    FROM {table}
-    WHERE symbol IN UNNEST(@symbols)
-        AND processed_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @days DAY)
-    ORDER BY processed_at DESC
+        *,
+        AVG(risk_score) OVER () AS avg_risk_score,
+        AVG(sentiment_score) OVER () AS avg_sentiment_score,
+        COUNTIF(tone = 'bullish') OVER () AS bullish_count,
+        COUNTIF(tone = 'neutral') OVER () AS neutral_count,
+        COUNTIF(tone = 'bearish') OVER () AS bearish_count
+    FROM latest
+    ORDER BY symbol
     """
 
-    # Execute query with parameters
-    client = bigquery.Client()
+    # Execute query with parameters (off the event loop)
     job_config = bigquery.QueryJobConfig(
         query_parameters=[
             bigquery.ArrayQueryParameter("symbols", "STRING", symbol_list),
@@ -64,16 +96,12 @@ def query_speech_signals(
         ]
     )
 
-    results = client.query(query, job_config=job_config).result()
+    results, query_job = await execute_query(query, job_config=job_config)
+    record_bigquery_job(query_job)
 
-    # Process results
-    output: dict[str, dict] = {}
-    for row in results:
-        # Calculate risk_score from tone
-        tone_risk_map = {"bullish": 0.3, "neutral": 0.5, "bearish": 0.8}
-        risk_score = tone_risk_map.get(row.tone, 0.5)
-
-        output[row.symbol] = {
+    # Process results (one row per symbol)
+    output: dict[str, dict] = {
+        row.symbol: {
             "symbol": row.symbol,
             "event": row.event,
             "tone": row.tone,
@@ -81,8 +109,10 @@ def query_speech_signals(
             "topics": list(row.topics) if row.topics else [],
             "risks": list(row.risks) if row.risks else [],
             "processed_at": row.processed_at.isoformat() if row.processed_at else None,
-            "risk_score": risk_score,
+            "risk_score": row.risk_score,
         }
+        for row in results
+    }
 
     if not output:
         return json.dumps({
@@ -91,22 +121,39 @@ def query_speech_signals(
             "suggestion": "Try one of: AAPL, AMD, AMZN, ASML, CSCO, GOOGL, INTC, MSFT, MU, NVDA",
         })
 
-    return json.dumps(output, indent=2)
+    first = results[0]
+    return json.dumps(
+        {
+            "signals": output,
+            "aggregate": {
+                "symbols": len(output),
+                "aggregate_sentiment": sentiment_label(first.avg_sentiment_score),
+                "avg_sentiment_score": round(first.avg_sentiment_score, 3),
+                "avg_risk_score": round(first.avg_risk_score, 3),
+                "tone_counts": {
+                    "bullish": first.bullish_count,
+                    "neutral": first.neutral_count,
+                    "bearish": first.bearish_count,
+                },
+            },
+        },
+        indent=2,
+    )
 
 
 # Create the FunctionTool
 speech_signal_tool = FunctionTool(func=query_speech_signals)
 
 # Supported tickers from earnings transcripts
-SUPPORTED_TICKERS = "AAPL, AMD, AMZN, ASML, CSCO, GOOGL, INTC, MSFT, MU, NVDA"
-DEFAULT_TICKERS = "AAPL,AMD,AMZN,ASML,CSCO,GOOGL,INTC,MSFT,MU,NVDA"
+SUPPORTED_TICKERS = ", ".join(SUPPORTED_SYMBOLS)
+DEFAULT_TICKERS = DEFAULT_SYMBOLS
 
 # Speech Signal Agent with FunctionTool
 speech_signal_agent = LlmAgent(
     name="speech_signal_agent",
     model=config.model_name,
-    description="Earnings call analysis: management tone, guidance, key topics, risk factors from transcribed earnings calls.",
-    tools=[speech_signal_tool],
+    description="Earnings call analysis: management tone, guidance, key topics, risk factors from transcribed earnings calls, plus news headline sentiment.",
+    tools=[speech_signal_tool, news_sentiment_tool, search_transcripts_tool],
     output_key="speech_signals",
     instruction=f"""You are a DATA COLLECTION agent in a multi-agent volatility analysis system.
 
@@ -119,10 +166,16 @@ speech_signal_agent = LlmAgent(
 
 ## ALWAYS EXECUTE
 No matter what the user asks (VIX, volatility, analysis, etc.):
-- IMMEDIATELY call `query_speech_signals(symbols="{DEFAULT_TICKERS}")`
+- IMMEDIATELY call `query_speech_signals` and `get_news_sentiment` with the REQUESTED SYMBOLS below
 - Provide a brief summary of earnings sentiment
 - DO NOT refuse or redirect - just execute and report your findings
 
+## REQUESTED SYMBOLS
+{{requested_symbols?}}
+
+Pass exactly these symbols to `query_speech_signals` and `get_news_sentiment`. They were extracted from the
+user's question by the query planner. If the line above is empty, use "{DEFAULT_TICKERS}".
+
 ## DATA CONTEXT
 Historical earnings data from 2016-2020 (not current).
 
@@ -146,6 +199,17 @@ When users mention company names, map to tickers:
 - `symbols`: Required. Single ticker (e.g., "AAPL") or comma-separated. DEFAULT: "{DEFAULT_TICKERS}"
 - `days`: Optional. Lookback period in days, default 90
 
+## NEWS SENTIMENT
+`get_news_sentiment(symbols=<REQUESTED SYMBOLS>)` returns headline sentiment
+(-1 negative .. 1 positive) per stock over the last 30 days of news, plus an
+aggregate label. Report the aggregate label next to the earnings tone.
+
+## TRANSCRIPT SEARCH
+If the user asks about something specific that tone/guidance/topics/risks do not
+cover (e.g. "what did Nvidia say about data center demand?"), ALSO call
+`search_transcripts(query=<topic>, symbols=<REQUESTED SYMBOLS>, k=5)` and quote
+the most relevant passage with its event. Skip it for general sentiment queries.
+
 ## EXAMPLES
 - "Run analysis" or "complete analysis" → query_speech_signals(symbols="{DEFAULT_TICKERS}")
 - "Apple earnings" → query_speech_signals(symbols="AAPL")
@@ -155,13 +219,14 @@ When users mention company names, map to tickers:
 ## OUTPUT FORMAT
 After running the query, provide a BRIEF human-readable summary (2-3 sentences max):
 - Note this is historical data (2016-2020)
-- Summarize overall sentiment and notable company tones
+- Summarize overall sentiment (from the tool's `aggregate`) and notable company tones
+- Add the news sentiment label (from `get_news_sentiment`'s `aggregate`)
 - Keep it concise - no JSON, no lengthy explanations
 
-Example: "Historical earnings data (2016-2020): Overall sentiment bullish. NVDA showed strongest positive tone on AI/datacenter growth. INTC had cautious guidance on competition."
+Example: "Historical earnings data (2016-2020): Overall sentiment bullish, news sentiment positive. NVDA showed strongest positive tone on AI/datacenter growth. INTC had cautious guidance on competition."
 
 ## BEHAVIOR
-- ALWAYS call the tool immediately - NEVER ask for user input
+- ALWAYS call `query_speech_signals` and `get_news_sentiment` immediately - NEVER ask for user input
 - Use default tickers when no specific company is mentioned
 - Summarize key findings with tone and guidance
 - Highlight notable risks or opportunities mentioned
@@ -3,13 +3,19 @@
 from google.adk.agents import LlmAgent
 
 from ...config import config
-from ...tools import calculate_forecast_tool
+from ...tools import calculate_forecast_tool, macro_context_tool, upcoming_events_tool
+from ...utils.scenarios import INDEX_MULTIPLIERS
+
+# Same multipliers as the what-if scenario grid
+MULTIPLIER_ROWS = "\n".join(
+    f"| {index} | {multiplier} |" for index, multiplier in INDEX_MULTIPLIERS.items()
+)
 
 synthesis_agent = LlmAgent(
     name="volatility_synthesis_agent",
     model=config.model_name,
     output_key="volatility_forecasts",
-    instruction="""You are the Volatility Synthesis Agent generating volatility forecasts.
+    instruction=f"""You are the Volatility Synthesis Agent generating volatility forecasts.
 
 ## Your Role
 Combine technical signals, event calendar data, and earnings call sentiment to generate volatility forecasts for major indices.
@@ -22,11 +28,20 @@ When generating forecasts, use the MOST RECENT data available and clearly state
 You have access to these session state values (as text/JSON from upstream agents):
 - **technical_signals**: Contains current_vix, volatility_regime, historical_vol_20d, anomalies
 - **event_calendar**: Contains fed_meetings, mna_events, analyst_ratings, upcoming_high_impact
-- **speech_signals**: Contains earnings call sentiment (tone, guidance, topics, risks, risk_score)
+- **speech_signals**: Contains earnings call sentiment (tone, guidance, topics, risks, risk_score) and news headline sentiment
 
 Parse the JSON data from each session state value to extract the relevant fields.
 If a value appears to be empty or missing data, use reasonable defaults and note the limitation.
 
+### technical_signals
+{{technical_signals?}}
+
+### event_calendar
+{{event_calendar?}}
+
+### speech_signals
+{{speech_signals?}}
+
 ## Forecast Logic
 
 ### 1. Extract Key Inputs
@@ -36,15 +51,23 @@ From technical_signals:
 - historical_vol_20d: 20-day realized volatility
 
 From event_calendar:
-- Check if any upcoming_high_impact events exist
-- Fed meetings within 7 days increase expected volatility
-- Analyst rating changes (upgrades/downgrades)
+- Notable events and analyst rating changes (upgrades/downgrades) for the summary
+
+Upcoming high-impact events: call `check_upcoming_events` once with
+`as_of_date` = the data date from technical_signals (YYYY-MM-DD; empty uses
+the latest market date) and `days` = 7. Do not decide this from event_calendar.
+
+Macro context: call `get_macro_context` once with the same `as_of_date`.
+- `macro_regime` stagflationary or slowdown, or an inverted `term_spread` (< 0)
+  -> lean toward the higher end of forecast uncertainty and say so
+- Do not query economic indicators any other way
 
 From speech_signals:
 - Aggregate sentiment from major tech earnings (AAPL, MSFT, NVDA, GOOGL, etc.)
 - If majority bearish -> increase volatility forecast by 5-10%
 - If majority bullish -> decrease volatility forecast by 5%
 - Check for consensus risk factors across companies
+- Negative news sentiment confirming a bearish earnings tone strengthens the bearish adjustment
 
 ### 2. Generate Forecasts
 Use the `calculate_volatility_forecast` tool for each major index:
@@ -55,17 +78,17 @@ Use the `calculate_volatility_forecast` tool for each major index:
 
 Small-caps (RUT) typically have 1.3-1.5x the volatility of large-caps (SPX).
 
+Pass `has_upcoming_event` and `event_types` from `check_upcoming_events`
+unchanged; the tool adds the historical VIX response measured for those event types.
+
 ### 3. Apply Index-Specific Multipliers
 | Index | Volatility Multiplier |
 |-------|----------------------|
-| SPX | 1.0 (baseline) |
-| NDX | 1.15 (tech premium) |
-| DJI | 0.95 (blue chip discount) |
-| RUT | 1.35 (small cap premium) |
+{MULTIPLIER_ROWS}
 
 ## Output Format
 After calculating forecasts, provide a BRIEF human-readable summary (2-3 sentences max):
-- State the VIX level and regime
+- State the VIX level and regime, and the macro regime
 - List 1-day volatility forecasts for each index
 - Keep it concise - no JSON, no lengthy explanations
 
@@ -74,9 +97,9 @@ Example: "Volatility forecasts (VIX at 12.89, low regime): SPX 12.5%, NDX 14.4%,
 ## Important Notes
 - Forecasts are annualized volatility percentages
 - Confidence decreases during extreme regimes
-- Upcoming events increase forecast uncertainty
+- Upcoming events raise the forecast by their historical VIX response (see the tool's `event_adjustment`)
 - Earnings sentiment affects tech-heavy indices (NDX) more strongly
 - Bearish earnings tone from major tech can add 5-10% to NDX volatility forecast
 """,
-    tools=[calculate_forecast_tool],
+    tools=[upcoming_events_tool, macro_context_tool, calculate_forecast_tool],
 )
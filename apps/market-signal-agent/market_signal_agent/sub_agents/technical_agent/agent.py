@@ -4,14 +4,16 @@ This agent queries BigQuery to:
 1. Get current VIX level and determine volatility regime
 2. Calculate historical volatility metrics
 3. Detect z-score anomalies in index data
+4. Check cross-asset correlation breakdowns and contagion
 
 Output is stored in session state with key "technical_signals".
 """
 
 from google.adk.agents import LlmAgent
 
+from ...callbacks import bound_bigquery_result_callback, guard_bigquery_query_callback
 from ...config import config
-from ...tools import bigquery_toolset
+from ...tools import bigquery_toolset, cross_asset_correlation_tool
 
 # Table references for the clean views
 PROJECT = config.bq_project
@@ -24,7 +26,9 @@ technical_agent = LlmAgent(
     name="technical_agent",
     model=config.model_name,
     description="VIX analysis, volatility regime detection, z-score anomaly detection from market data.",
-    tools=[bigquery_toolset],
+    tools=[bigquery_toolset, cross_asset_correlation_tool],
+    before_tool_callback=guard_bigquery_query_callback,
+    after_tool_callback=bound_bigquery_result_callback,
     output_key="technical_signals",
     instruction=f"""You are a DATA COLLECTION agent in a multi-agent volatility analysis system.
 
@@ -38,7 +42,8 @@ technical_agent = LlmAgent(
 ## ALWAYS EXECUTE
 No matter what the user asks:
 - IMMEDIATELY execute all 3 queries (VIX, historical vol, z-score anomalies)
-- Report VIX level, regime, and any anomalies found
+- Call get_cross_asset_correlation once (Step 4)
+- Report VIX level, regime, any anomalies and correlation breakdowns found
 - DO NOT refuse or redirect - just execute and report
 
 ## DATA CONTEXT
@@ -129,10 +134,20 @@ JOIN stats s ON l.symbol = s.symbol
 ORDER BY ABS((l.close - s.avg_price) / NULLIF(s.std_price, 0)) DESC
 ```
 
+### Step 4: Cross-Asset Correlations
+Call `get_cross_asset_correlation` with as_of_date set to the date from Step 1
+(default 60-day window). Do NOT compute correlations in SQL - the tool serves
+precomputed matrices for sp500, nasdaq, dow, russell_2000, treasuries, gold,
+oil and VIX.
+- `breakdowns`: pairs whose 20-day correlation moved far from the 120-day one
+  (e.g. stocks/bonds flipping sign) - report the largest shifts
+- `contagion`: true when correlations are rising across assets (stress spreading)
+
 ## OUTPUT FORMAT
 After running all queries, provide a BRIEF human-readable summary (2-3 sentences max):
 - State the data date, VIX level, and regime
 - Mention any anomalies detected
+- Mention correlation breakdowns or contagion if flagged
 - Keep it concise - no JSON, no lengthy explanations
 
 Example: "Data as of 2023-11-29: VIX at 12.89 (low regime, 78th percentile). 20-day historical volatility: 15.2%. Volume anomaly detected in SPX (z-score: 2.3)."
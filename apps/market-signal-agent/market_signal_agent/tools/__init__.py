@@ -4,18 +4,38 @@ from .bigquery_tools import (
     bigquery_toolset,
     bigquery_toolset_writable,
     create_bigquery_toolset,
+    execute_query,
+    run_in_bigquery_executor,
 )
 from .forecast_tools import calculate_forecast_tool, generate_id_tool
-from .alert_tools import check_vix_tool, check_anomaly_tool
+from .alert_tools import check_vix_tool, check_anomaly_tool, evaluate_alerts_tool
 from .session_tools import initialize_state_tool
+from .retrieval_tools import search_fed_tool, search_transcripts_tool
+from .calendar_tools import upcoming_events_tool
+from .analyst_tools import analyst_momentum_tool
+from .news_tools import news_sentiment_tool
+from .macro_tools import macro_context_tool
+from .correlation_tools import cross_asset_correlation_tool
+from .scenario_tools import scenario_tool
 
 __all__ = [
     "bigquery_toolset",
     "bigquery_toolset_writable",
     "create_bigquery_toolset",
+    "execute_query",
+    "run_in_bigquery_executor",
     "calculate_forecast_tool",
     "generate_id_tool",
     "check_vix_tool",
     "check_anomaly_tool",
+    "evaluate_alerts_tool",
     "initialize_state_tool",
+    "search_fed_tool",
+    "search_transcripts_tool",
+    "upcoming_events_tool",
+    "analyst_momentum_tool",
+    "news_sentiment_tool",
+    "macro_context_tool",
+    "cross_asset_correlation_tool",
+    "scenario_tool",
 ]
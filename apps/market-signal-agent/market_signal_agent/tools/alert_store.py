@@ -0,0 +1,198 @@
+"""Active-alert store backed by the BigQuery alerts table.
+
+Keeps an ActiveAlertIndex (utils/alert_state.py) in memory, reloaded from the
+table's active rows at the start of every alert sweep, collects each run's
+sweep (AlertSweep) in memory by invocation id, and persists each
+sweep's opened, updated and resolved transitions with MERGEs keyed on the
+alert fingerprint. Several processes (ADK server workers, the precompute
+daemon) share the table, so the index is never trusted beyond one sweep, and
+the MERGE keeps the triggered_at of a row another process already opened.
+Persisted transitions are then published to the alert dispatcher
+(utils/alert_delivery.py) for push delivery.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+
+from google.cloud import bigquery
+
+from ..config import config
+from ..utils.alert_delivery import alert_dispatcher
+from ..utils.alert_state import ActiveAlertIndex, AlertSweep
+from .bigquery_tools import execute_query
+
+# Columns written by the MERGE (the alerts table schema)
+ALERT_COLUMNS = (
+    ("id", "STRING"),
+    ("alert_type", "STRING"),
+    ("severity", "STRING"),
+    ("symbol", "STRING"),
+    ("message", "STRING"),
+    ("vix_value", "FLOAT64"),
+    ("triggered_at", "TIMESTAMP"),
+    ("is_active", "BOOL"),
+    ("updated_at", "TIMESTAMP"),
+    ("resolved_at", "TIMESTAMP"),
+)
+
+# Rows per MERGE, keeping each job well under BigQuery's query parameter and
+# query size limits
+MERGE_BATCH_SIZE = 500
+
+# Sweeps kept for runs that never reached their commit (an agent run that
+# failed); the oldest is dropped beyond this
+MAX_OPEN_SWEEPS = 64
+
+
+def _row_to_alert(row: Any) -> dict[str, Any]:
+    alert = dict(row.items())
+    for key in ("triggered_at", "updated_at", "resolved_at"):
+        if isinstance(alert.get(key), datetime):
+            alert[key] = alert[key].isoformat()
+    return alert
+
+
+class AlertEngine:
+    """Active-alert index backed by the alerts table."""
+
+    def __init__(self) -> None:
+        self.index = ActiveAlertIndex()
+        self.loaded = False
+        self._lock = asyncio.Lock()
+        # Sweeps in progress by invocation id; kept out of session state, which
+        # would persist every checked scope and alert on each sweep
+        self._sweeps: dict[str, AlertSweep] = {}
+
+    @property
+    def table(self) -> str:
+        """Fully qualified alerts table."""
+        return f"`{config.bq_dataset_full}.alerts`"
+
+    async def reload(self) -> None:
+        """Replace the index with the table's current active alerts."""
+        async with self._lock:
+            self.loaded = False
+            query = f"""
+            SELECT
+                {", ".join(name for name, _ in ALERT_COLUMNS)}
+            FROM {self.table}
+            WHERE is_active
+            """
+            rows, _ = await execute_query(query)
+            self.index.load([_row_to_alert(row) for row in rows])
+            self.loaded = True
+
+    async def ensure_loaded(self) -> None:
+        """Load the active alerts if the last reload did not succeed."""
+        if not self.loaded:
+            await self.reload()
+
+    def start_sweep(self, invocation_id: str) -> AlertSweep:
+        """Start an empty sweep for an agent run."""
+        while len(self._sweeps) >= MAX_OPEN_SWEEPS:
+            self._sweeps.pop(next(iter(self._sweeps)))
+        sweep = self._sweeps[invocation_id] = AlertSweep()
+        return sweep
+
+    def sweep(self, invocation_id: str) -> AlertSweep | None:
+        """The sweep of an agent run, or None outside the alert agent."""
+        return self._sweeps.get(invocation_id)
+
+    async def finish_sweep(self, invocation_id: str) -> dict[str, int]:
+        """Commit and discard an agent run's sweep (empty if none started)."""
+        sweep = self._sweeps.pop(invocation_id, None) or AlertSweep()
+        return await self.commit(sweep.fired, sweep.checked)
+
+    async def commit(
+        self,
+        fired: dict[str, dict[str, Any]],
+        checked: set[str],
+        now: datetime | None = None,
+    ) -> dict[str, int]:
+        """Persist a sweep's transitions and update the index.
+
+        Args:
+            fired: Alerts raised by the sweep, keyed by fingerprint.
+            checked: Scopes the sweep evaluated.
+            now: Sweep time (default: now).
+
+        Returns:
+            Count of opened, updated and resolved alerts, and the active total.
+        """
+        await self.ensure_loaded()
+        now = now or datetime.now(timezone.utc)
+        async with self._lock:
+            legacy = await self.resolve_legacy(now)
+            rows = self.index.plan(fired, checked, now)
+            for start in range(0, len(rows), MERGE_BATCH_SIZE):
+                batch = rows[start : start + MERGE_BATCH_SIZE]
+                await self._merge(batch)
+                self.index.apply(batch)
+                alert_dispatcher.publish(batch)
+        counts = {"opened": 0, "updated": 0, "resolved": legacy}
+        for row in rows:
+            counts[row["transition"]] += 1
+        return {**counts, "active": len(self.index.active)}
+
+    async def resolve_legacy(self, now: datetime) -> int:
+        """Resolve every active pre-fingerprint (uuid) row in one UPDATE.
+
+        Returns:
+            Number of legacy rows that were active when the index was loaded.
+        """
+        if not self.index.legacy:
+            return 0
+        query = f"""
+        UPDATE {self.table}
+        SET is_active = FALSE, updated_at = @now, resolved_at = @now
+        WHERE is_active AND ARRAY_LENGTH(SPLIT(id, ':')) != 3
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("now", "TIMESTAMP", now)]
+        )
+        await execute_query(query, job_config)
+        count = len(self.index.legacy)
+        self.index.legacy = {}
+        return count
+
+    async def _merge(self, rows: list[dict[str, Any]]) -> None:
+        """Upsert alert rows by id in one MERGE statement."""
+        names = [name for name, _ in ALERT_COLUMNS]
+        updates = [
+            # An alert another process opened since the index was loaded keeps
+            # its original triggered_at
+            (
+                "triggered_at = IF(T.is_active, T.triggered_at, S.triggered_at)"
+                if name == "triggered_at"
+                else f"{name} = S.{name}"
+            )
+            for name in names[1:]
+        ]
+        structs = [
+            bigquery.StructQueryParameter(
+                None,
+                *(
+                    bigquery.ScalarQueryParameter(name, kind, row.get(name))
+                    for name, kind in ALERT_COLUMNS
+                ),
+            )
+            for row in rows
+        ]
+        query = f"""
+        MERGE {self.table} T
+        USING (SELECT * FROM UNNEST(@rows)) S
+        ON T.id = S.id
+        WHEN MATCHED THEN UPDATE SET
+            {", ".join(updates)}
+        WHEN NOT MATCHED THEN INSERT ({", ".join(names)})
+            VALUES ({", ".join(f"S.{name}" for name in names)})
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter("rows", "STRUCT", structs)]
+        )
+        await execute_query(query, job_config)
+
+
+# Process-wide engine shared by all sessions
+alert_engine = AlertEngine()
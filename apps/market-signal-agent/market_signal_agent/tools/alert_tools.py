@@ -1,10 +1,57 @@
-"""Function tools for alert generation."""
+"""Function tools for alert generation.
 
-import uuid
-from datetime import datetime, timezone
+Alert ids are stable fingerprints of the condition (utils/alert_state.py),
+so repeated checks of the same condition update one alert instead of adding
+new ones. Each check is recorded in the session's alert sweep, which the
+alert agent's after-agent callback commits as opened/updated/resolved
+transitions.
+"""
+
+import logging
+from datetime import date, datetime, timezone
 from typing import Any
 
-from google.adk.tools import FunctionTool
+import numpy as np
+from google.adk.tools import FunctionTool, ToolContext
+from google.cloud import bigquery
+
+from ..config import config
+from ..tracing import record_bigquery_job
+from ..utils.alert_rules import correlation_pairs, load_rules
+from ..utils.alert_state import (
+    ANY_SYMBOL,
+    VIX_SCOPE,
+    alert_fingerprint,
+    anomaly_band,
+    anomaly_scope,
+    vix_band,
+)
+from ..utils.correlation import load_correlation_store
+from ..utils.event_calendar import is_high_impact
+from .alert_store import alert_engine
+from .bigquery_tools import execute_query
+from .calendar_tools import load_event_calendar
+
+logger = logging.getLogger(__name__)
+
+# Alerts listed in evaluate_alerts' response (critical first); all are saved
+MAX_LISTED_ALERTS = 100
+
+# Days ahead covered by the events table of the alert rules
+EVENT_HORIZON_DAYS = 14
+
+
+def _finish(
+    alert: dict[str, Any] | None, scope: str, tool_context: ToolContext | None
+) -> dict[str, Any] | None:
+    """Mark the alert as new or ongoing and record the check in the sweep."""
+    if alert is not None:
+        ongoing = alert_engine.index.is_active(alert["id"])
+        alert["transition"] = "updated" if ongoing else "opened"
+    sweep = alert_engine.sweep(tool_context.invocation_id) if tool_context else None
+    if sweep is not None:
+        sweep.record([scope], [alert] if alert is not None else [])
+    return alert
 
 
 def check_vix_threshold(
@@ -13,6 +60,7 @@ def check_vix_threshold(
     vix_normal: float = 20.0,
     vix_elevated: float = 25.0,
     vix_high: float = 30.0,
+    tool_context: ToolContext | None = None,
 ) -> dict[str, Any] | None:
     """
     Check VIX against thresholds and generate appropriate alert.
@@ -25,42 +73,47 @@ def check_vix_threshold(
         vix_high: High/extreme threshold (default 30)
 
     Returns:
-        Dict with alert details if threshold exceeded, None otherwise
+        Dict with alert details if threshold exceeded, None otherwise.
+        transition is "opened" for a new alert, "updated" for one already
+        active.
     """
+    alert = None
     if current_vix > vix_high:
-        return {
-            "id": str(uuid.uuid4()),
+        alert = {
+            "id": alert_fingerprint("vix_extreme", None, vix_band(vix_high)),
             "alert_type": "vix_extreme",
             "severity": "critical",
             "symbol": None,
-            "message": f"EXTREME volatility detected - VIX at {current_vix:.1f}, above {vix_high}",
+            "message": f"EXTREME volatility detected - VIX at {current_vix:.1f}, above {vix_high:g}",
             "vix_value": current_vix,
             "triggered_at": datetime.now(timezone.utc).isoformat(),
             "is_active": True,
         }
     elif current_vix > vix_elevated:
-        return {
-            "id": str(uuid.uuid4()),
+        alert = {
+            "id": alert_fingerprint("vix_high", None, vix_band(vix_elevated, vix_high)),
             "alert_type": "vix_high",
             "severity": "warning",
             "symbol": None,
-            "message": f"HIGH volatility - VIX at {current_vix:.1f}, above {vix_elevated}",
+            "message": f"HIGH volatility - VIX at {current_vix:.1f}, above {vix_elevated:g}",
             "vix_value": current_vix,
             "triggered_at": datetime.now(timezone.utc).isoformat(),
             "is_active": True,
         }
     elif current_vix > vix_normal:
-        return {
-            "id": str(uuid.uuid4()),
+        alert = {
+            "id": alert_fingerprint(
+                "vix_elevated", None, vix_band(vix_normal, vix_elevated)
+            ),
             "alert_type": "vix_elevated",
             "severity": "info",
             "symbol": None,
-            "message": f"ELEVATED volatility - VIX at {current_vix:.1f}, above {vix_normal}",
+            "message": f"ELEVATED volatility - VIX at {current_vix:.1f}, above {vix_normal:g}",
             "vix_value": current_vix,
             "triggered_at": datetime.now(timezone.utc).isoformat(),
             "is_active": True,
         }
-    return None
+    return _finish(alert, VIX_SCOPE, tool_context)
 
 
 def check_anomaly_alert(
@@ -68,10 +121,14 @@ def check_anomaly_alert(
     anomaly_type: str,
     zscore: float,
     threshold: float = 2.0,
+    tool_context: ToolContext | None = None,
 ) -> dict[str, Any] | None:
     """
     Check if z-score exceeds threshold and generate alert.
 
+    Call it for every symbol's price and volume z-score, including normal
+    ones, so alerts for conditions that have cleared are resolved.
+
     Args:
         symbol: Ticker symbol (e.g., SPX, NDX)
         anomaly_type: Type of anomaly (price, volume)
@@ -79,12 +136,17 @@ def check_anomaly_alert(
         threshold: Z-score threshold (default 2.0)
 
     Returns:
-        Dict with alert details if anomaly detected, None otherwise
+        Dict with alert details if anomaly detected, None otherwise.
+        transition is "opened" for a new alert, "updated" for one already
+        active.
     """
+    alert = None
     if abs(zscore) > threshold:
         direction = "above" if zscore > 0 else "below"
-        return {
-            "id": str(uuid.uuid4()),
+        alert = {
+            "id": alert_fingerprint(
+                "anomaly", symbol, anomaly_band(anomaly_type, zscore, threshold)
+            ),
             "alert_type": "anomaly",
             "severity": "info",
             "symbol": symbol,
@@ -93,9 +155,219 @@ def check_anomaly_alert(
             "triggered_at": datetime.now(timezone.utc).isoformat(),
             "is_active": True,
         }
-    return None
+    return _finish(alert, anomaly_scope(symbol, anomaly_type), tool_context)
+
+
+async def latest_alert_inputs(
+    symbols: list[str],
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Latest market state and each symbol's price/volume z-scores.
+
+    One query returns the latest date and VIX, the 20-day S&P 500 realized
+    volatility, and the z-scores of every index (or the given symbols) on its
+    own latest trading day against the last 90 days. The symbols come back as
+    an array on the single market row, so the market state is returned even
+    when no index matches.
+    """
+    index_table = f"`{config.bq_dataset_full}.index_data_v`"
+    market_table = f"`{config.bq_dataset_full}.market_30yr_v`"
+    symbol_filter = "AND symbol IN UNNEST(@symbols)" if symbols else ""
+    query = f"""
+    WITH recent_market AS (
+        SELECT
+            date,
+            vix,
+            SAFE.LN(sp500 / LAG(sp500) OVER (ORDER BY date)) AS daily_return
+        FROM {market_table}
+        WHERE sp500 IS NOT NULL
+        QUALIFY ROW_NUMBER() OVER (ORDER BY date DESC) <= 21
+    ),
+    market AS (
+        SELECT
+            MAX(date) AS market_date,
+            ARRAY_AGG(vix IGNORE NULLS ORDER BY date DESC LIMIT 1)[SAFE_OFFSET(0)]
+                AS vix,
+            STDDEV(daily_return) * SQRT(252) * 100 AS hv_20d
+        FROM recent_market
+    ),
+    window_rows AS (
+        SELECT symbol, date, close, volume
+        FROM {index_table}
+        WHERE date >= DATE_SUB((SELECT MAX(date) FROM {index_table}), INTERVAL 90 DAY)
+            AND close IS NOT NULL
+            {symbol_filter}
+    ),
+    scored AS (
+        SELECT
+            symbol,
+            date,
+            MAX(date) OVER w AS latest_date,
+            (close - AVG(close) OVER w) / NULLIF(STDDEV(close) OVER w, 0)
+                AS price_zscore,
+            (volume - AVG(volume) OVER w) / NULLIF(STDDEV(volume) OVER w, 0)
+                AS volume_zscore
+        FROM window_rows
+        WINDOW w AS (PARTITION BY symbol)
+    )
+    SELECT
+        m.*,
+        ARRAY(
+            SELECT AS STRUCT symbol, price_zscore, volume_zscore
+            FROM scored
+            WHERE date = latest_date
+            ORDER BY symbol
+        ) AS symbols
+    FROM market m
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ArrayQueryParameter("symbols", "STRING", symbols)]
+    )
+    rows, query_job = await execute_query(query, job_config)
+    record_bigquery_job(query_job)
+
+    first = rows[0]
+    market = {
+        "date": str(first.market_date),
+        "vix": float(first.vix) if first.vix is not None else np.nan,
+        "hv_20d": float(first.hv_20d) if first.hv_20d is not None else np.nan,
+    }
+    latest = first.symbols or []
+    columns = {"symbol": np.array([row["symbol"] for row in latest], dtype=object)}
+    for kind in ("price", "volume"):
+        z = np.array([row[f"{kind}_zscore"] for row in latest], dtype=float)
+        columns[f"{kind}_zscore"] = z
+        columns[f"{kind}_sigma"] = np.abs(z)
+        columns[f"{kind}_direction"] = np.where(z > 0, "above", "below").astype(object)
+    return market, columns
+
+
+async def build_alert_snapshot(
+    symbols: list[str], current_vix: float | None = None
+) -> dict[str, dict[str, np.ndarray]]:
+    """Snapshot tables for the alert rules (see utils/alert_rules.py).
+
+    The pairs table and contagion need a correlation store that covers the
+    market date, and the events table needs the event_calendar table;
+    without them those rules are skipped.
+    """
+    market, symbol_columns = await latest_alert_inputs(symbols)
+    if current_vix is not None:
+        market["vix"] = current_vix
+    market["hv_vix_spread"] = market["vix"] - market["hv_20d"]
+    market["contagion"] = np.nan
+
+    tables: dict[str, dict[str, np.ndarray]] = {"symbols": symbol_columns}
+
+    store = load_correlation_store()
+    i = store.index_of(market["date"]) if store is not None else None
+    if i is not None and str(store.dates[i]) < market["date"][:10]:
+        # Matrices from an earlier day would flag breaks that are long gone
+        logger.warning(
+            "Correlation store ends %s, before market date %s; "
+            "skipping correlation rules",
+            store.dates[i],
+            market["date"][:10],
+        )
+        i = None
+    if i is not None:
+        short, long = store.correlation[0, i], store.correlation[-1, i]
+        tables["pairs"] = correlation_pairs(store.assets, store.shift[i], short, long)
+        market["contagion"] = float(store.contagion[i])
+
+    try:
+        calendar, _ = await load_event_calendar()
+    except Exception:
+        logger.exception("Event calendar unavailable for alert rules")
+    else:
+        as_of = date.fromisoformat(market["date"][:10])
+        events = calendar.within(as_of, EVENT_HORIZON_DAYS)
+        starts = [date.fromisoformat(str(e["start_date"])[:10]) for e in events]
+        tables["events"] = {
+            "symbol": np.array(
+                [
+                    f"{e['event_type']}@{start}"
+                    for e, start in zip(events, starts, strict=True)
+                ],
+                dtype=object,
+            ),
+            "event_type": np.array([e["event_type"] for e in events], dtype=object),
+            "title": np.array([e["title"] for e in events], dtype=object),
+            "start_date": np.array([str(start) for start in starts], dtype=object),
+            "days_until": np.array([(start - as_of).days for start in starts]),
+            "high_impact": np.array(
+                [is_high_impact(e["event_type"]) for e in events], dtype=bool
+            ),
+        }
+
+    tables["market"] = {name: np.array([value]) for name, value in market.items()}
+    return tables
+
+
+async def evaluate_alerts(
+    current_vix: float | None = None,
+    symbols: str = "",
+    tool_context: ToolContext | None = None,
+) -> dict[str, Any]:
+    """Evaluate every alert rule over the latest market snapshot in one call.
+
+    Applies the configured alert rules (VIX bands, price/volume z-scores,
+    realized-vs-implied volatility spread, correlation breaks, upcoming
+    high-impact events) to the latest data for every index (or the given
+    symbols) at once. Replaces one check_vix_threshold plus one
+    check_anomaly_alert call per anomaly.
+
+    Args:
+        current_vix: VIX level to check; omit to use the latest VIX in the data
+        symbols: Comma-separated symbols to evaluate; empty evaluates all
+
+    Returns:
+        Dictionary with the triggered alerts (critical first, each with a
+        stable id, the rule that raised it and transition "opened" or
+        "updated"), counts by severity, and the number of symbols evaluated
+    """
+    symbol_list = [s.strip() for s in symbols.split(",") if s.strip()]
+    try:
+        rules = load_rules()
+    except (OSError, ValueError) as e:
+        return {"status": "ERROR", "error_details": f"Alert rules unavailable: {e}"}
+
+    tables = await build_alert_snapshot(symbol_list, current_vix)
+    alerts, scopes = rules.evaluate(tables)
+    # Z-score alerts were checked only for the symbols the query returned
+    # (each on its own latest trading day); others keep their open alerts
+    wildcard = {anomaly_scope(ANY_SYMBOL, kind) for kind in ("price", "volume")}
+    scopes = [scope for scope in scopes if scope not in wildcard] + [
+        anomaly_scope(str(symbol), scope.rsplit(":", 1)[1])
+        for scope in sorted(wildcard & set(scopes))
+        for symbol in tables["symbols"]["symbol"]
+    ]
+
+    for alert in alerts:
+        ongoing = alert_engine.index.is_active(alert["id"])
+        alert["transition"] = "updated" if ongoing else "opened"
+    sweep = alert_engine.sweep(tool_context.invocation_id) if tool_context else None
+    if sweep is not None:
+        sweep.record(scopes, alerts)
+
+    severities = [alert["severity"] for alert in alerts]
+    return {
+        "status": "success",
+        "current_vix": float(tables["market"]["vix"][0]),
+        "symbols_evaluated": len(tables["symbols"]["symbol"]),
+        "rules_evaluated": len(rules.rules),
+        "rules_version": rules.version,
+        "alert_count": len(alerts),
+        "by_severity": {
+            level: severities.count(level) for level in ("critical", "warning", "info")
+        },
+        "new_alerts": sum(alert["transition"] == "opened" for alert in alerts),
+        "has_critical": "critical" in severities,
+        "alerts": alerts[:MAX_LISTED_ALERTS],
+        "alerts_not_listed": max(len(alerts) - MAX_LISTED_ALERTS, 0),
+    }
 
 
 # Create FunctionTool wrappers
 check_vix_tool = FunctionTool(func=check_vix_threshold)
 check_anomaly_tool = FunctionTool(func=check_anomaly_alert)
+evaluate_alerts_tool = FunctionTool(func=evaluate_alerts)
@@ -0,0 +1,135 @@
+"""Analyst rating momentum over the precomputed daily aggregates.
+
+analyst_rating_daily (scripts/build_analyst_aggregates.py) holds one row per
+symbol and day, so a 5/20-day momentum lookup reads at most 20 rows per symbol
+instead of scanning a million raw headlines, and clustered or correlated
+analyst activity is flagged by the tool rather than by the model.
+"""
+
+from datetime import date
+from typing import Any
+
+from google.adk.tools import FunctionTool
+from google.cloud import bigquery
+
+from ..config import config
+from ..tracing import record_bigquery_job
+from .bigquery_tools import execute_query
+
+# Rating actions on one symbol within 5 days that count as clustered activity
+CLUSTER_MIN_RATINGS = 3
+
+MAX_SYMBOLS = 25
+
+
+async def get_analyst_momentum(
+    symbols: str = "",
+    as_of_date: str = "",
+    limit: int = 10,
+) -> dict[str, Any]:
+    """Get analyst rating momentum (upgrades vs downgrades) per stock.
+
+    Use instead of reading raw analyst_ratings headlines.
+
+    Args:
+        symbols: Ticker symbols (e.g. "AAPL" or "AAPL,NVDA"); empty returns the
+            most active stocks
+        as_of_date: ISO date (YYYY-MM-DD) the windows end at; empty uses the
+            latest aggregated date
+        limit: Maximum stocks to return, default 10 (max 25)
+
+    Returns:
+        Dictionary with per-stock 5-day and 20-day rating counts and momentum,
+        stocks with clustered activity, and whether that activity is correlated
+    """
+    symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+    try:
+        as_of = date.fromisoformat(as_of_date) if as_of_date else None
+    except ValueError:
+        return {"status": "ERROR", "error_details": f"Invalid as_of_date: {as_of_date}"}
+    table = f"`{config.bq_dataset_full}.analyst_rating_daily`"
+
+    query = f"""
+    WITH params AS (
+        SELECT COALESCE(@as_of, (SELECT MAX(date) FROM {table})) AS as_of
+    ),
+    recent AS (
+        SELECT d.*, p.as_of, d.date > DATE_SUB(p.as_of, INTERVAL 5 DAY) AS in_5d
+        FROM {table} d
+        CROSS JOIN params p
+        WHERE d.date BETWEEN DATE_SUB(p.as_of, INTERVAL 19 DAY) AND p.as_of
+            AND (ARRAY_LENGTH(@symbols) = 0 OR d.symbol IN UNNEST(@symbols))
+    )
+    SELECT
+        symbol,
+        ANY_VALUE(as_of) AS as_of,
+        SUM(IF(in_5d, ratings, 0)) AS ratings_5d,
+        SUM(IF(in_5d, upgrades, 0)) AS upgrades_5d,
+        SUM(IF(in_5d, downgrades, 0)) AS downgrades_5d,
+        SUM(IF(in_5d, momentum, 0)) AS momentum_5d,
+        SUM(ratings) AS ratings_20d,
+        SUM(momentum) AS momentum_20d,
+        MAX(date) AS last_action_date
+    FROM recent
+    GROUP BY symbol
+    ORDER BY ratings_5d DESC, ratings_20d DESC, symbol
+    LIMIT @limit
+    """
+
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("as_of", "DATE", as_of),
+            bigquery.ArrayQueryParameter("symbols", "STRING", symbol_list),
+            bigquery.ScalarQueryParameter(
+                "limit", "INT64", max(1, min(limit, MAX_SYMBOLS))
+            ),
+        ]
+    )
+    rows, query_job = await execute_query(query, job_config=job_config)
+    record_bigquery_job(query_job)
+
+    if not rows:
+        return {
+            "status": "success",
+            "message": "No analyst rating actions in the 20 days up to the as-of date.",
+            "symbols_queried": symbol_list,
+        }
+
+    stocks = [
+        {
+            "symbol": row.symbol,
+            "ratings_5d": row.ratings_5d,
+            "upgrades_5d": row.upgrades_5d,
+            "downgrades_5d": row.downgrades_5d,
+            "momentum_5d": round(row.momentum_5d, 2),
+            "ratings_20d": row.ratings_20d,
+            "momentum_20d": round(row.momentum_20d, 2),
+            "last_action_date": str(row.last_action_date),
+            "clustered": row.ratings_5d >= CLUSTER_MIN_RATINGS,
+        }
+        for row in rows
+    ]
+    clustered = [stock for stock in stocks if stock["clustered"]]
+    positive = sum(1 for stock in clustered if stock["momentum_5d"] > 0)
+    negative = sum(1 for stock in clustered if stock["momentum_5d"] < 0)
+
+    direction = "none"
+    if positive > negative:
+        direction = "upgrades"
+    elif negative > positive:
+        direction = "downgrades"
+    elif clustered:
+        direction = "mixed"
+
+    return {
+        "status": "success",
+        "as_of_date": str(rows[0].as_of),
+        "stocks": stocks,
+        "clustered_symbols": [stock["symbol"] for stock in clustered],
+        # Two or more stocks with clustered actions in the same direction
+        "correlated_activity": max(positive, negative) >= 2,
+        "cluster_direction": direction,
+    }
+
+
+analyst_momentum_tool = FunctionTool(func=get_analyst_momentum)
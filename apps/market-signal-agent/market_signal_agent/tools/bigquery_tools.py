@@ -2,11 +2,101 @@
 
 Provides a configured BigQueryToolset instance for querying market data.
 Uses application default credentials. Supports both read-only and writable modes.
+
+BigQuery client calls block until the job finishes, so they run on a dedicated
+thread pool instead of the event loop that serves ADK. Concurrent sessions and
+concurrently running workflow stages then overlap their BigQuery round-trips.
 """
 
+import asyncio
+import functools
+import typing
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
 import google.auth
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools import BaseTool, FunctionTool
 from google.adk.tools.bigquery import BigQueryCredentialsConfig, BigQueryToolset
 from google.adk.tools.bigquery.config import BigQueryToolConfig, WriteMode
+from google.cloud import bigquery
+
+from ..config import config
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Shared pool for blocking BigQuery calls
+_bigquery_executor = ThreadPoolExecutor(
+    max_workers=config.bigquery_max_workers, thread_name_prefix="bigquery"
+)
+
+_bigquery_client: bigquery.Client | None = None
+
+
+def run_in_bigquery_executor(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """Wrap a blocking function so it runs on the BigQuery thread pool.
+
+    The wrapper keeps the original signature, so ADK builds the same tool
+    declaration for it.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _bigquery_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    # Resolve string annotations against func's module, not this one
+    wrapper.__annotations__ = typing.get_type_hints(func)
+    return wrapper
+
+
+def get_bigquery_client() -> bigquery.Client:
+    """Get the shared BigQuery client, creating it on first use."""
+    global _bigquery_client
+    if _bigquery_client is None:
+        _bigquery_client = bigquery.Client(project=config.bq_project)
+    return _bigquery_client
+
+
+async def execute_query(
+    query: str, job_config: bigquery.QueryJobConfig | None = None
+) -> tuple[list[bigquery.Row], bigquery.QueryJob]:
+    """Run a query without blocking the event loop.
+
+    Args:
+        query: SQL to execute.
+        job_config: Optional job configuration (e.g. query parameters).
+
+    Returns:
+        The result rows and the finished query job.
+    """
+
+    def run() -> tuple[list[bigquery.Row], bigquery.QueryJob]:
+        query_job = get_bigquery_client().query(query, job_config=job_config)
+        return list(query_job.result()), query_job
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bigquery_executor, run)
+
+
+class AsyncBigQueryToolset(BigQueryToolset):
+    """BigQueryToolset whose tools run on the BigQuery thread pool."""
+
+    async def get_tools(
+        self, readonly_context: ReadonlyContext | None = None
+    ) -> list[BaseTool]:
+        """Get the toolset's tools with their functions moved off the event loop."""
+        tools = await super().get_tools(readonly_context)
+        for tool in tools:
+            if isinstance(tool, FunctionTool) and not asyncio.iscoroutinefunction(
+                tool.func
+            ):
+                tool.func = run_in_bigquery_executor(tool.func)
+        return tools
 
 
 def create_bigquery_toolset(writable: bool = False) -> BigQueryToolset:
@@ -27,9 +117,12 @@ def create_bigquery_toolset(writable: bool = False) -> BigQueryToolset:
 
     # Set write mode based on parameter
     write_mode = WriteMode.ALLOWED if writable else WriteMode.BLOCKED
-    tool_config = BigQueryToolConfig(write_mode=write_mode)
+    tool_config = BigQueryToolConfig(
+        write_mode=write_mode,
+        maximum_bytes_billed=config.bigquery_maximum_bytes_billed,
+    )
 
-    return BigQueryToolset(
+    return AsyncBigQueryToolset(
         credentials_config=credentials_config,
         bigquery_tool_config=tool_config,
     )
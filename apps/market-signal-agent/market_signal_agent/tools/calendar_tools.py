@@ -0,0 +1,116 @@
+"""Upcoming-event lookups over the normalized event calendar.
+
+event_calendar (scripts/build_event_calendar.py) is read from BigQuery once
+per refresh interval into an EventCalendarIndex, so deciding whether a
+high-impact event falls within the forecast window is an in-memory binary
+search instead of an LLM reading raw query results.
+"""
+
+import time
+from typing import Any
+
+from google.adk.tools import FunctionTool
+
+from ..config import config
+from ..tracing import record_bigquery_job
+from ..utils.event_calendar import EventCalendarIndex, is_high_impact
+from .bigquery_tools import execute_query
+
+MAX_EVENTS = 20
+
+_calendar: EventCalendarIndex | None = None
+_market_as_of: str | None = None
+_loaded_at = 0.0
+
+
+async def load_event_calendar() -> tuple[EventCalendarIndex, str | None]:
+    """Load (and cache) the event calendar index and the latest market date."""
+    global _calendar, _market_as_of, _loaded_at
+
+    if (
+        _calendar is None
+        or time.monotonic() - _loaded_at > config.event_calendar_refresh_seconds
+    ):
+        dataset = config.bq_dataset_full
+        query = f"""
+            SELECT
+                event_type, start_date, end_date, title, value_billions,
+                (SELECT SAFE_CAST(MAX(date) AS DATE) FROM `{dataset}.market_30yr_v`)
+                    AS market_as_of
+            FROM `{dataset}.event_calendar`
+        """
+        rows, query_job = await execute_query(query)
+        record_bigquery_job(query_job)
+
+        _calendar = EventCalendarIndex(
+            [
+                {
+                    "event_type": row.event_type,
+                    "start_date": row.start_date,
+                    "end_date": row.end_date,
+                    "title": row.title,
+                    "value_billions": row.value_billions,
+                }
+                for row in rows
+            ]
+        )
+        _market_as_of = (
+            str(rows[0].market_as_of) if rows and rows[0].market_as_of else None
+        )
+        _loaded_at = time.monotonic()
+
+    return _calendar, _market_as_of
+
+
+async def check_upcoming_events(
+    as_of_date: str = "",
+    days: int = 7,
+) -> dict[str, Any]:
+    """Check for high-impact events (Fed releases, $10B+ M&A) in the forecast window.
+
+    Pass `has_upcoming_event` and `event_types` from the result straight to
+    calculate_volatility_forecast.
+
+    Args:
+        as_of_date: ISO date (YYYY-MM-DD) the window starts at; empty uses the
+            latest market data date
+        days: Window length in days, default 7
+
+    Returns:
+        Dictionary with has_upcoming_event, event_types (comma-separated) and
+        the events in the window
+    """
+    calendar, market_as_of = await load_event_calendar()
+    as_of = as_of_date or market_as_of
+    if not as_of:
+        return {"status": "ERROR", "error_details": "No as_of_date and no market data."}
+
+    try:
+        events = calendar.within(as_of, days)
+    except ValueError:
+        return {"status": "ERROR", "error_details": f"Invalid as_of_date: {as_of_date}"}
+
+    high_impact = [event for event in events if is_high_impact(event["event_type"])]
+    event_types = sorted({event["event_type"] for event in high_impact})
+
+    return {
+        "status": "success",
+        "as_of_date": str(as_of),
+        "window_days": days,
+        "has_upcoming_event": bool(high_impact),
+        "event_types": ",".join(event_types),
+        "events": [
+            {
+                "event_type": event["event_type"],
+                "start_date": str(event["start_date"]),
+                "end_date": str(event["end_date"]),
+                "title": event["title"],
+                "value_billions": event["value_billions"],
+                "high_impact": is_high_impact(event["event_type"]),
+            }
+            for event in events[:MAX_EVENTS]
+        ],
+    }
+
+
+upcoming_events_tool = FunctionTool(func=check_upcoming_events)
@@ -0,0 +1,75 @@
+"""Cross-asset correlation lookups over the local correlation store."""
+
+import math
+from typing import Any
+
+from google.adk.tools import FunctionTool
+
+from ..utils.correlation import BREAKDOWN_THRESHOLD, load_correlation_store
+
+# Contagion score above which cross-asset correlations are rising broadly
+CONTAGION_THRESHOLD = 0.15
+
+
+def get_cross_asset_correlation(
+    as_of_date: str = "",
+    window: int = 60,
+    include_covariance: bool = False,
+) -> dict[str, Any]:
+    """Get cross-asset correlations, breakdowns and contagion for a date.
+
+    Covers sp500, nasdaq, dow, russell_2000, treasury_10y, treasury_5y, gold,
+    oil_wti and vix daily moves.
+
+    Args:
+        as_of_date: ISO date (YYYY-MM-DD); empty uses the latest date available
+        window: Rolling window in trading days: 20, 60 or 120 (default 60)
+        include_covariance: Also return the covariance matrix for the window
+
+    Returns:
+        Dictionary with the correlation matrix for the window, pairs whose
+        short-window correlation broke away from the long-window one, and the
+        contagion score (rise in average absolute correlation)
+    """
+    store = load_correlation_store()
+    if store is None:
+        return {
+            "status": "ERROR",
+            "error_details": "Correlation store not built. "
+            "Run scripts/build_correlations.py.",
+        }
+    if window not in store.windows:
+        return {
+            "status": "ERROR",
+            "error_details": f"window must be one of {list(store.windows)}.",
+        }
+
+    try:
+        i = store.index_of(as_of_date or store.latest_date)
+    except ValueError:
+        i = None
+    if i is None:
+        return {
+            "status": "ERROR",
+            "error_details": f"No market data on or before '{as_of_date}'.",
+        }
+
+    contagion = float(store.contagion[i])
+    if math.isnan(contagion):  # not enough history for both windows
+        contagion = 0.0
+    result = {
+        "status": "success",
+        "date": str(store.dates[i]),
+        "window_days": window,
+        "correlation": store.matrix(i, window),
+        "breakdowns": store.breakdowns(i),
+        "breakdown_threshold": BREAKDOWN_THRESHOLD,
+        "contagion_score": round(contagion, 3),
+        "contagion": contagion >= CONTAGION_THRESHOLD,
+    }
+    if include_covariance:
+        result["covariance"] = store.matrix(i, window, kind="covariance")
+    return result
+
+
+cross_asset_correlation_tool = FunctionTool(func=get_cross_asset_correlation)
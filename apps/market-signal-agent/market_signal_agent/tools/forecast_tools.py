@@ -6,6 +6,20 @@ from typing import Any
 
 from google.adk.tools import FunctionTool
 
+from ..utils.event_impact import (
+    HEURISTIC_EVENT_MULTIPLIERS,
+    event_adjustment,
+    parse_event_types,
+)
+from ..utils.forecast_rules import (
+    CONFIDENCE_BY_REGIME,
+    DIVERGENCE_LIMIT,
+    DIVERGENCE_PENALTY,
+    MEAN_REVERSION_1D,
+    MEAN_REVERSION_5D,
+    VIX_LONG_TERM_AVG,
+)
+
 
 def generate_forecast_id() -> str:
     """Generate a unique forecast ID."""
@@ -17,6 +31,7 @@ def calculate_volatility_forecast(
     historical_vol: float,
     regime: str,
     has_upcoming_event: bool = False,
+    event_types: str = "",
 ) -> dict[str, Any]:
     """
     Calculate 1-day and 5-day volatility forecasts.
@@ -26,43 +41,52 @@ def calculate_volatility_forecast(
         historical_vol: 20-day historical volatility
         regime: Current volatility regime (low, normal, elevated, extreme)
         has_upcoming_event: Whether there's an upcoming high-impact event
+        event_types: Comma-separated upcoming event types (e.g. "fed_minute,mna_mega")
 
     Returns:
-        Dict with volatility forecasts and confidence
+        Dict with volatility forecasts, confidence and the event adjustment applied
     """
-    # Base forecast on current VIX with mean reversion tendency
-    vix_long_term_avg = 20.0  # Historical VIX average
+    # Base forecast on current VIX with mean reversion to the historical average
 
     # 1-day forecast: mostly current VIX with slight mean reversion
-    volatility_1d = current_vix * 0.95 + vix_long_term_avg * 0.05
+    volatility_1d = (
+        current_vix * (1 - MEAN_REVERSION_1D) + VIX_LONG_TERM_AVG * MEAN_REVERSION_1D
+    )
 
     # 5-day forecast: more mean reversion
-    volatility_5d = current_vix * 0.85 + vix_long_term_avg * 0.15
-
-    # Adjust for upcoming events (increase forecast by 10%)
-    if has_upcoming_event:
-        volatility_1d *= 1.10
-        volatility_5d *= 1.15
+    volatility_5d = (
+        current_vix * (1 - MEAN_REVERSION_5D) + VIX_LONG_TERM_AVG * MEAN_REVERSION_5D
+    )
+
+    # Adjust for upcoming events: historical excess VIX response per event type
+    # (scripts/build_event_impact.py), or fixed multipliers without a lookup
+    upcoming = parse_event_types(event_types)
+    adjustment = None
+    if has_upcoming_event or upcoming:
+        adjustment = event_adjustment(upcoming)
+        if adjustment is not None:
+            volatility_1d += adjustment["vix_points_1d"]
+            volatility_5d += adjustment["vix_points_5d"]
+        else:
+            multiplier_1d, multiplier_5d = HEURISTIC_EVENT_MULTIPLIERS
+            adjustment = {"source": "heuristic", "events": upcoming}
+            volatility_1d *= multiplier_1d
+            volatility_5d *= multiplier_5d
 
     # Calculate confidence based on regime stability
-    confidence_map = {
-        "low": 0.85,
-        "normal": 0.80,
-        "elevated": 0.70,
-        "extreme": 0.55,
-    }
-    confidence = confidence_map.get(regime, 0.70)
+    confidence = CONFIDENCE_BY_REGIME.get(regime, 0.70)
 
     # Lower confidence if historical vol differs significantly from VIX
     if current_vix > 0:
         vol_diff = abs(current_vix - historical_vol) / current_vix
-        if vol_diff > 0.3:
-            confidence *= 0.9
+        if vol_diff > DIVERGENCE_LIMIT:
+            confidence *= DIVERGENCE_PENALTY
 
     return {
         "volatility_1d": round(volatility_1d, 2),
         "volatility_5d": round(volatility_5d, 2),
         "confidence": round(confidence, 2),
+        "event_adjustment": adjustment,
         "forecast_id": generate_forecast_id(),
         "computed_at": datetime.now(timezone.utc).isoformat(),
     }
@@ -0,0 +1,47 @@
+"""Macro context lookups over the local macro feature store."""
+
+from typing import Any
+
+from google.adk.tools import FunctionTool
+
+from ..utils.macro_features import load_macro_store
+
+
+def get_macro_context(as_of_date: str = "") -> dict[str, Any]:
+    """Get macro context (inflation, growth, unemployment, rates) for a date.
+
+    Args:
+        as_of_date: ISO date (YYYY-MM-DD); empty uses the latest date available
+
+    Returns:
+        Dictionary with the macro regime and features: annual inflation, GDP
+        growth and unemployment with their changes and surprises vs the
+        trailing 3-year average, 10y yield, term spread and 20-day moves in
+        yields, oil and gold, plus the store's latest date
+    """
+    store = load_macro_store()
+    if store is None:
+        return {
+            "status": "ERROR",
+            "error_details": "Macro feature store not built. "
+            "Run scripts/build_macro_features.py.",
+        }
+
+    try:
+        features = store.lookup(as_of_date or store.latest_date)
+    except ValueError:
+        features = None
+    if features is None:
+        return {
+            "status": "ERROR",
+            "error_details": f"No macro data on or before '{as_of_date}'.",
+        }
+
+    return {
+        "status": "success",
+        "store_latest_date": store.latest_date,
+        "features": features,
+    }
+
+
+macro_context_tool = FunctionTool(func=get_macro_context)
@@ -0,0 +1,119 @@
+"""News sentiment lookups over the precomputed daily aggregates.
+
+news_sentiment_daily (scripts/build_news_sentiment.py) holds one row per
+symbol and day with headline counts and mean sentiment, so the lookup sums a
+handful of rows per symbol instead of scoring headlines at query time.
+"""
+
+from datetime import date
+from typing import Any
+
+from google.adk.tools import FunctionTool
+from google.cloud import bigquery
+
+from ..config import config
+from ..tracing import record_bigquery_job
+from .bigquery_tools import execute_query
+
+# Mean sentiment beyond which a symbol's news counts as positive / negative
+SENTIMENT_THRESHOLD = 0.15
+
+
+def news_label(sentiment: float) -> str:
+    """Map a mean sentiment (-1 negative .. 1 positive) to a label."""
+    if sentiment > SENTIMENT_THRESHOLD:
+        return "positive"
+    if sentiment < -SENTIMENT_THRESHOLD:
+        return "negative"
+    return "neutral"
+
+
+async def get_news_sentiment(
+    symbols: str,
+    as_of_date: str = "",
+    days: int = 30,
+) -> dict[str, Any]:
+    """Get news headline sentiment for stocks over recent days.
+
+    Args:
+        symbols: Ticker symbols (e.g. "AAPL" or "AAPL,NVDA,MSFT")
+        as_of_date: ISO date (YYYY-MM-DD) the window ends at; empty uses the
+            latest date with news
+        days: Window length in days, default 30
+
+    Returns:
+        Dictionary with headline counts, mean sentiment and label per symbol,
+        plus the headline-weighted aggregate across symbols
+    """
+    symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+    try:
+        as_of = date.fromisoformat(as_of_date) if as_of_date else None
+    except ValueError:
+        return {"status": "ERROR", "error_details": f"Invalid as_of_date: {as_of_date}"}
+    table = f"`{config.bq_dataset_full}.news_sentiment_daily`"
+
+    query = f"""
+    WITH params AS (
+        SELECT COALESCE(@as_of, (SELECT MAX(date) FROM {table})) AS as_of
+    )
+    SELECT
+        d.symbol,
+        ANY_VALUE(p.as_of) AS as_of,
+        SUM(d.headlines) AS headlines,
+        SUM(d.positive) AS positive,
+        SUM(d.negative) AS negative,
+        SUM(d.neutral) AS neutral,
+        SUM(d.sentiment * d.headlines) / SUM(d.headlines) AS sentiment
+    FROM {table} d
+    CROSS JOIN params p
+    WHERE d.symbol IN UNNEST(@symbols)
+        AND d.date > DATE_SUB(p.as_of, INTERVAL @days DAY)
+        AND d.date <= p.as_of
+    GROUP BY d.symbol
+    ORDER BY d.symbol
+    """
+
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("as_of", "DATE", as_of),
+            bigquery.ArrayQueryParameter("symbols", "STRING", symbol_list),
+            bigquery.ScalarQueryParameter("days", "INT64", max(days, 1)),
+        ]
+    )
+    rows, query_job = await execute_query(query, job_config=job_config)
+    record_bigquery_job(query_job)
+
+    if not rows:
+        return {
+            "status": "success",
+            "message": "No news headlines for the requested symbols in the window.",
+            "symbols_queried": symbol_list,
+        }
+
+    total = sum(row.headlines for row in rows)
+    aggregate_sentiment = sum(row.sentiment * row.headlines for row in rows) / total
+
+    return {
+        "status": "success",
+        "as_of_date": str(rows[0].as_of),
+        "window_days": days,
+        "symbols": {
+            row.symbol: {
+                "headlines": row.headlines,
+                "positive": row.positive,
+                "negative": row.negative,
+                "neutral": row.neutral,
+                "sentiment": round(row.sentiment, 3),
+                "label": news_label(row.sentiment),
+            }
+            for row in rows
+        },
+        "aggregate": {
+            "headlines": total,
+            "sentiment": round(aggregate_sentiment, 3),
+            "label": news_label(aggregate_sentiment),
+        },
+    }
+
+
+news_sentiment_tool = FunctionTool(func=get_news_sentiment)
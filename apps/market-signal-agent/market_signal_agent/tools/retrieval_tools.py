@@ -0,0 +1,167 @@
+"""Retrieval tools over the local text indexes.
+
+Indexes are built offline (scripts/build_fed_index.py,
+scripts/process_transcripts.py) and reloaded whenever a rebuild replaces
+their chunks.json; vectors are memory-mapped, so only the pages a search
+touches are read from disk.
+Queries are matched with BM25 and, when enabled, fused with vector
+similarity of the query embedding, so agents get relevant passages without
+scanning full documents in BigQuery.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from google.adk.tools import FunctionTool
+
+from ..config import config
+from ..retrieval import HybridIndex
+from ..retrieval.embeddings import embed_query
+
+MAX_RESULTS = 20
+
+# Loaded index and the chunks.json mtime it was read at, by directory
+_indexes: dict[Path, tuple[int, HybridIndex]] = {}
+
+
+def resolve_index_dir(index_dir: str) -> Path:
+    """Resolve a configured index directory."""
+    return config.resolve_path(index_dir)
+
+
+def load_index(index_dir: str) -> HybridIndex | None:
+    """Latest index, re-read only when a rebuild changes its files.
+
+    Returns None if the index has not been built.
+    """
+    path = resolve_index_dir(index_dir)
+    cached = _indexes.get(path)
+    try:
+        mtime = (path / "chunks.json").stat().st_mtime_ns
+    except FileNotFoundError:
+        # Not built, or a rebuild is swapping the directory in
+        return cached[1] if cached else None
+    if cached is None or cached[0] != mtime:
+        try:
+            _indexes[path] = (mtime, HybridIndex.load(path))
+        except (OSError, ValueError):
+            if cached is None:
+                raise
+            return cached[1]
+    return _indexes[path][1]
+
+
+async def search_index(
+    index: HybridIndex, query: str, k: int, mask: np.ndarray | None = None
+) -> tuple[list[tuple[dict[str, Any], float]], str]:
+    """Search an index, fusing vector similarity when available.
+
+    Returns:
+        The (chunk, score) results and the mode used ("hybrid" or "bm25").
+    """
+    query_vector = None
+    if config.retrieval_use_vectors and index.vectors is not None:
+        try:
+            query_vector = await embed_query(query)
+        except Exception:
+            query_vector = None  # Embedding service unavailable: BM25 only
+
+    results = index.search(query, k=k, query_vector=query_vector, mask=mask)
+    return results, "hybrid" if query_vector is not None else "bm25"
+
+
+async def search_fed_communications(
+    query: str,
+    k: int = 5,
+    since: str = "",
+) -> dict[str, Any]:
+    """Find Fed minutes and statement passages about a topic.
+
+    Use for inflation, interest rates, balance sheet, labor market or other
+    policy topics. Returns short passages with their dates for citation.
+
+    Args:
+        query: Topic to search for, e.g. "inflation expectations" or
+            "balance sheet runoff"
+        k: Number of passages to return, default 5 (max 20)
+        since: Optional ISO date (YYYY-MM-DD); only passages on or after it
+
+    Returns:
+        Dictionary with status and passages (date, release_date, type, text, score)
+    """
+    index = load_index(config.fed_index_dir)
+    if index is None:
+        return {
+            "status": "ERROR",
+            "error_details": "Fed communications index not built. "
+            "Run scripts/build_fed_index.py.",
+        }
+
+    mask = index.metadata_array("date") >= since if since else None
+    results, mode = await search_index(index, query, max(1, min(k, MAX_RESULTS)), mask)
+
+    return {
+        "status": "success",
+        "mode": mode,
+        "passages": [
+            {
+                "date": chunk.get("date"),
+                "release_date": chunk.get("release_date"),
+                "type": chunk.get("type"),
+                "text": chunk["text"],
+                "score": round(score, 4),
+            }
+            for chunk, score in results
+        ],
+    }
+
+
+async def search_transcripts(
+    query: str,
+    symbols: str = "",
+    k: int = 5,
+) -> dict[str, Any]:
+    """Find earnings call passages about a topic.
+
+    Use for questions the extracted tone/guidance/topics/risks do not answer,
+    e.g. "data center demand", "gross margin outlook", "China export restrictions".
+
+    Args:
+        query: Topic to search for
+        symbols: Optional ticker filter (e.g. "NVDA" or "AAPL,MSFT"); empty searches all
+        k: Number of passages to return, default 5 (max 20)
+
+    Returns:
+        Dictionary with status and passages (symbol, event, text, score)
+    """
+    index = load_index(config.transcript_index_dir)
+    if index is None:
+        return {
+            "status": "ERROR",
+            "error_details": "Transcript index not built. "
+            "Run scripts/process_transcripts.py --index-only.",
+        }
+
+    symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+    mask = np.isin(index.metadata_array("symbol"), symbol_list) if symbol_list else None
+    results, mode = await search_index(index, query, max(1, min(k, MAX_RESULTS)), mask)
+
+    return {
+        "status": "success",
+        "mode": mode,
+        "passages": [
+            {
+                "symbol": chunk.get("symbol"),
+                "event": chunk.get("event"),
+                "text": chunk["text"],
+                "score": round(score, 4),
+            }
+            for chunk, score in results
+        ],
+    }
+
+
+# Create FunctionTools
+search_fed_tool = FunctionTool(func=search_fed_communications)
+search_transcripts_tool = FunctionTool(func=search_transcripts)
@@ -0,0 +1,159 @@
+"""What-if scenario grid over the volatility forecast and VIX alert rules."""
+
+from typing import Any
+
+import numpy as np
+from google.adk.tools import FunctionTool
+
+from ..config import config
+from ..tracing import record_bigquery_job
+from ..utils.scenarios import (
+    INDEX_MULTIPLIERS,
+    MAX_SCENARIOS,
+    evaluate_grid,
+    parse_event_sets,
+    parse_values,
+)
+from .bigquery_tools import execute_query
+
+# Rows of the scenario table returned to the model (evenly spaced over the grid)
+MAX_TABLE_ROWS = 50
+
+
+async def latest_market_state() -> tuple[str, float, float]:
+    """Latest data date, VIX and 20-day S&P 500 realized volatility (percent)."""
+    table = f"`{config.bq_dataset_full}.market_30yr_v`"
+    query = f"""
+    WITH recent AS (
+        SELECT
+            date,
+            vix,
+            SAFE.LN(sp500 / LAG(sp500) OVER (ORDER BY date)) AS daily_return
+        FROM {table}
+        WHERE sp500 IS NOT NULL
+        QUALIFY ROW_NUMBER() OVER (ORDER BY date DESC) <= 21
+    )
+    SELECT
+        MAX(date) AS as_of,
+        ARRAY_AGG(vix IGNORE NULLS ORDER BY date DESC LIMIT 1)[SAFE_OFFSET(0)] AS vix,
+        STDDEV(daily_return) * SQRT(252) * 100 AS historical_vol_20d
+    FROM recent
+    """
+    rows, query_job = await execute_query(query)
+    record_bigquery_job(query_job)
+    row = rows[0]
+    return str(row.as_of), float(row.vix), float(row.historical_vol_20d)
+
+
+async def run_volatility_scenarios(
+    vix_levels: str = "",
+    vix_shocks: str = "",
+    realized_vols: str = "",
+    event_sets: str = "none",
+    indices: str = "SPX,NDX,DJI,RUT",
+) -> dict[str, Any]:
+    """Evaluate what-if scenarios through the forecast and VIX alert rules.
+
+    Every combination of VIX level, realized volatility and event set is
+    evaluated for each index in one call. Lists are comma-separated; numeric
+    lists also accept "start:stop:step" ranges (e.g. "15:45:5").
+
+    Args:
+        vix_levels: Absolute VIX levels (e.g. "25,30,35")
+        vix_shocks: VIX changes in points added to the latest VIX (e.g. "5,10,15");
+            used when vix_levels is empty. Both empty: latest VIX only
+        realized_vols: 20-day realized volatility levels in percent; empty uses
+            the latest S&P 500 realized volatility
+        event_sets: ";"-separated event sets: "none", "event" (unknown type) or
+            comma-separated types fed_minute, fed_statement, mna_large, mna_mega
+            (e.g. "none;fed_statement")
+        indices: Comma-separated indices from SPX, NDX, DJI, RUT
+
+    Returns:
+        Dictionary with the scenario table (columns + rows, sampled evenly if
+        the grid is large), the lowest VIX triggering each alert, and the
+        forecast range per index and event set
+    """
+    try:
+        levels = parse_values(vix_levels)
+        shocks = parse_values(vix_shocks)
+        vols = parse_values(realized_vols)
+    except ValueError as exc:
+        return {"status": "ERROR", "error_details": f"Invalid number list: {exc}"}
+
+    index_list = [s.strip().upper() for s in indices.split(",") if s.strip()]
+    unknown = [s for s in index_list if s not in INDEX_MULTIPLIERS]
+    if unknown or not index_list:
+        return {
+            "status": "ERROR",
+            "error_details": f"Unknown indices {unknown}; "
+            f"use {list(INDEX_MULTIPLIERS)}.",
+        }
+
+    base = None
+    if not levels or not vols:
+        as_of, base_vix, base_vol = await latest_market_state()
+        base = {
+            "date": as_of,
+            "vix": round(base_vix, 2),
+            "realized_vol": round(base_vol, 2),
+        }
+        if not levels:
+            levels = [base_vix + shock for shock in shocks] if shocks else [base_vix]
+        if not vols:
+            vols = [base_vol]
+
+    sets = parse_event_sets(event_sets)
+    size = len(levels) * len(vols) * len(sets)
+    if size > MAX_SCENARIOS:
+        return {
+            "status": "ERROR",
+            "error_details": f"{size:,} scenarios exceeds the limit "
+            f"of {MAX_SCENARIOS:,}.",
+        }
+
+    columns = evaluate_grid(levels, vols, sets, index_list)
+    vix = columns["vix"]
+
+    alert_thresholds = {}
+    for alert in ("vix_elevated", "vix_high", "vix_extreme"):
+        triggered = vix[columns["alert"] == alert]
+        if len(triggered):
+            alert_thresholds[alert] = round(float(triggered.min()), 2)
+
+    ranges: dict[str, dict[str, list[float]]] = {}
+    for label in dict.fromkeys(columns["events"]):
+        in_set = columns["events"] == label
+        ranges[label] = {
+            index: [
+                float(columns[f"{index}_1d"][in_set].min()),
+                float(columns[f"{index}_1d"][in_set].max()),
+            ]
+            for index in index_list
+        }
+
+    names = list(columns)
+    rows = np.unique(np.linspace(0, size - 1, min(size, MAX_TABLE_ROWS)).astype(int))
+    table = [
+        [
+            value.item() if isinstance(value, np.generic) else value
+            for value in (columns[name][r] for name in names)
+        ]
+        for r in rows
+    ]
+    for row in table:
+        row[0], row[1] = round(row[0], 2), round(row[1], 2)
+
+    return {
+        "status": "success",
+        "scenarios": size,
+        "baseline": base,
+        "columns": names,
+        "rows": table,
+        "rows_shown": len(table),
+        "lowest_vix_per_alert": alert_thresholds,
+        "volatility_1d_range": ranges,
+    }
+
+
+scenario_tool = FunctionTool(func=run_volatility_scenarios)
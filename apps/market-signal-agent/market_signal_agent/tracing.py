@@ -0,0 +1,288 @@
+"""Latency tracing for agents, model calls and tools.
+
+Records OpenTelemetry spans from ADK callbacks so slow analyses can be broken
+down into model time, BigQuery time and orchestration overhead:
+- agent spans (before/after_agent_callback), nested along the agent tree
+- model spans (before/after_model_callback) with token counts
+- tool spans (before/after_tool_callback) with BigQuery job statistics
+
+Spans go to a dedicated TracerProvider (independent of ADK's own telemetry)
+and are exported according to config.trace_exporter:
+- "json": one JSON object per span appended to config.trace_json_path
+- "otlp": OTLP/HTTP to a collector at config.trace_otlp_endpoint
+"""
+
+import json
+from collections.abc import Sequence
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.models import LlmRequest, LlmResponse
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+
+from .config import config
+
+if TYPE_CHECKING:
+    from google.adk.agents import CallbackContext
+    from google.adk.tools import BaseTool, ToolContext
+    from google.cloud import bigquery
+
+# Open spans, keyed by (invocation_id, agent_name) or function call id
+_agent_spans: dict[tuple[str, str], trace.Span] = {}
+_model_spans: dict[tuple[str, str], trace.Span] = {}
+_tool_spans: dict[str, trace.Span] = {}
+
+# Parent agent name for every instrumented agent, used to nest agent spans
+_parents: dict[str, str | None] = {}
+
+# Tool span of the running function tool, for record_bigquery_job()
+_current_tool_span: ContextVar[trace.Span | None] = ContextVar(
+    "current_tool_span", default=None
+)
+
+_tracer: trace.Tracer | None = None
+
+
+class JsonFileSpanExporter(SpanExporter):
+    """Appends finished spans to a JSON-lines file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Write each span as one JSON line."""
+        with open(self.path, "a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps(span_to_dict(span)) + "\n")
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        """Nothing to release; the file is opened per export."""
+
+
+def span_to_dict(span: ReadableSpan) -> dict[str, Any]:
+    """Convert a finished span to a JSON-serializable dict."""
+    start = span.start_time or 0
+    end = span.end_time or start
+    return {
+        "name": span.name,
+        "trace_id": f"{span.context.trace_id:032x}",
+        "span_id": f"{span.context.span_id:016x}",
+        "parent_span_id": f"{span.parent.span_id:016x}" if span.parent else None,
+        "start_time_ns": start,
+        "end_time_ns": end,
+        "duration_ms": round((end - start) / 1e6, 3),
+        "status": span.status.status_code.name,
+        "attributes": dict(span.attributes or {}),
+    }
+
+
+def _create_exporter() -> SpanExporter:
+    """Create the span exporter selected by config.trace_exporter."""
+    if config.trace_exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter(endpoint=config.trace_otlp_endpoint)
+    return JsonFileSpanExporter(Path(config.trace_json_path))
+
+
+def get_tracer() -> trace.Tracer:
+    """Get the market signal tracer, creating its provider on first use."""
+    global _tracer
+    if _tracer is None:
+        provider = TracerProvider(
+            resource=Resource.create({"service.name": config.agent_name})
+        )
+        provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+        _tracer = provider.get_tracer(__name__)
+    return _tracer
+
+
+def _start_child_span(
+    name: str, parent: trace.Span | None, attributes: dict[str, Any]
+) -> trace.Span:
+    """Start a span under the given parent span (or as a new trace root)."""
+    context = trace.set_span_in_context(parent) if parent else None
+    return get_tracer().start_span(name, context=context, attributes=attributes)
+
+
+def _end_short_circuited_model_span(key: tuple[str, str]) -> None:
+    """End a model span whose after_model_callback was skipped.
+
+    A before_model_callback that returns a response (e.g. the intent router)
+    skips after_model_callback, so the span is closed at the next step instead.
+    """
+    if span := _model_spans.pop(key, None):
+        span.set_attribute("adk.model.short_circuited", True)
+        span.end()
+
+
+def trace_before_agent(callback_context: "CallbackContext") -> None:
+    """Open the agent span, nested under the parent agent's span."""
+    invocation_id = callback_context.invocation_id
+    agent_name = callback_context.agent_name
+    parent_name = _parents.get(agent_name)
+    parent = _agent_spans.get((invocation_id, parent_name)) if parent_name else None
+
+    _agent_spans[(invocation_id, agent_name)] = _start_child_span(
+        f"agent {agent_name}",
+        parent,
+        {"adk.agent": agent_name, "adk.invocation_id": invocation_id},
+    )
+
+
+def trace_after_agent(callback_context: "CallbackContext") -> None:
+    """Close the agent span and any model span left open by a short-circuit."""
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    _end_short_circuited_model_span(key)
+
+    if span := _agent_spans.pop(key, None):
+        span.end()
+
+
+def trace_before_model(
+    callback_context: "CallbackContext", llm_request: LlmRequest
+) -> None:
+    """Open a model-call span under the calling agent's span."""
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    _model_spans[key] = _start_child_span(
+        f"model {callback_context.agent_name}",
+        _agent_spans.get(key),
+        {
+            "adk.agent": callback_context.agent_name,
+            "gen_ai.request.model": llm_request.model or "",
+            "adk.model.request_contents": len(llm_request.contents),
+        },
+    )
+
+
+def trace_after_model(
+    callback_context: "CallbackContext", llm_response: LlmResponse
+) -> None:
+    """Close the model-call span with token counts."""
+    if llm_response.partial:
+        return
+
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    span = _model_spans.pop(key, None)
+    if span is None:
+        return
+
+    usage = llm_response.usage_metadata
+    if usage:
+        span.set_attribute("gen_ai.usage.input_tokens", usage.prompt_token_count or 0)
+        span.set_attribute(
+            "gen_ai.usage.output_tokens", usage.candidates_token_count or 0
+        )
+        span.set_attribute("gen_ai.usage.total_tokens", usage.total_token_count or 0)
+    if llm_response.error_code:
+        span.set_status(trace.StatusCode.ERROR, llm_response.error_message or "")
+    span.end()
+
+
+def trace_before_tool(
+    tool: "BaseTool", args: dict[str, Any], tool_context: "ToolContext"
+) -> None:
+    """Open a tool span under the calling agent's span."""
+    key = (tool_context.invocation_id, tool_context.agent_name)
+    _end_short_circuited_model_span(key)
+
+    span = _start_child_span(
+        f"tool {tool.name}",
+        _agent_spans.get(key),
+        {"adk.agent": tool_context.agent_name, "adk.tool": tool.name},
+    )
+    if tool_context.function_call_id:
+        _tool_spans[tool_context.function_call_id] = span
+    _current_tool_span.set(span)
+
+
+def trace_after_tool(
+    tool: "BaseTool",
+    args: dict[str, Any],
+    tool_context: "ToolContext",
+    tool_response: Any,
+) -> None:
+    """Close the tool span, recording the status and row count if present."""
+    _current_tool_span.set(None)
+    span = _tool_spans.pop(tool_context.function_call_id or "", None)
+    if span is None:
+        return
+
+    if isinstance(tool_response, dict):
+        status = tool_response.get("status")
+        if status:
+            span.set_attribute("adk.tool.status", str(status))
+        if isinstance(tool_response.get("rows"), list):
+            span.set_attribute("bigquery.rows", len(tool_response["rows"]))
+        if status == "ERROR":
+            span.set_status(
+                trace.StatusCode.ERROR, str(tool_response.get("error_details", ""))
+            )
+    span.end()
+
+
+def record_bigquery_job(job: "bigquery.QueryJob") -> None:
+    """Attach a finished BigQuery job's statistics to the current tool span.
+
+    Called by function tools after job.result(); a no-op when tracing is off.
+    """
+    span = _current_tool_span.get()
+    if span is None:
+        return
+
+    span.set_attribute("bigquery.job_id", job.job_id or "")
+    span.set_attribute("bigquery.total_bytes_processed", job.total_bytes_processed or 0)
+    span.set_attribute("bigquery.total_bytes_billed", job.total_bytes_billed or 0)
+    span.set_attribute("bigquery.cache_hit", bool(job.cache_hit))
+
+
+def instrument_agent_tree(agent: BaseAgent, parent_name: str | None = None) -> None:
+    """Attach tracing callbacks to an agent and all of its descendants.
+
+    Tracing callbacks are placed first: ADK stops at the first callback that
+    returns a value, and the tracing callbacks always return None.
+    """
+    _parents[agent.name] = parent_name
+
+    agent.before_agent_callback = [
+        trace_before_agent,
+        *agent.canonical_before_agent_callbacks,
+    ]
+    agent.after_agent_callback = [
+        trace_after_agent,
+        *agent.canonical_after_agent_callbacks,
+    ]
+
+    if isinstance(agent, LlmAgent):
+        agent.before_model_callback = [
+            trace_before_model,
+            *agent.canonical_before_model_callbacks,
+        ]
+        agent.after_model_callback = [
+            trace_after_model,
+            *agent.canonical_after_model_callbacks,
+        ]
+        agent.before_tool_callback = [
+            trace_before_tool,
+            *agent.canonical_before_tool_callbacks,
+        ]
+        agent.after_tool_callback = [
+            trace_after_tool,
+            *agent.canonical_after_tool_callbacks,
+        ]
+
+    for sub_agent in agent.sub_agents:
+        instrument_agent_tree(sub_agent, agent.name)
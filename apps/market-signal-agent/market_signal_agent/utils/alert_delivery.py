@@ -0,0 +1,308 @@
+"""Push alert transitions to subscribers instead of having them poll BigQuery.
+
+AlertEngine.commit (tools/alert_store.py) publishes every persisted sweep's
+opened and resolved alerts to the process-wide alert_dispatcher, which fans
+them out to the configured destinations:
+- webhook: JSON batches POSTed to config.alert_webhook_url
+- email: stub that renders one message per batch for config.alert_email_to
+  and logs it (no SMTP server is configured)
+- file: one JSON line per alert appended to config.alert_sink_path
+
+Each destination has its own queue and worker task. Alerts arriving within
+config.alert_batch_seconds of each other go out as one batch; deliveries are
+spaced by config.alert_rate_per_minute, and alerts arriving while a
+destination waits are coalesced into the next batch (latest transition per
+alert id). Failed deliveries are retried with exponential backoff, then
+dropped and counted. Publishing never blocks the sweep.
+
+Pointing the webhook at the read API's refresh endpoint
+(http://127.0.0.1:8090/api/volatility/refresh) refreshes the dashboard
+within seconds of an alert; scripts/run_alert_receiver.py is a local
+stand-in receiver for testing.
+"""
+
+import asyncio
+import json
+import logging
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# Transitions worth a notification; "updated" rows only refresh an open alert
+DELIVERED_TRANSITIONS = ("opened", "resolved")
+
+# Alerts per delivery; the rest go out in the next batch
+MAX_BATCH_SIZE = 100
+
+# Backoff before the first retry, doubled for each further attempt
+RETRY_BACKOFF_SECONDS = 1.0
+
+
+def _payload(batch: list[dict[str, Any]]) -> str:
+    return json.dumps({"alerts": batch}, default=str)
+
+
+class WebhookDestination:
+    """POST each batch as {"alerts": [...]} JSON."""
+
+    name = "webhook"
+
+    def __init__(self, url: str, timeout: float = 10.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    async def send(self, batch: list[dict[str, Any]]) -> None:
+        """Deliver one batch; raises on transport errors and non-2xx replies."""
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(
+                self.url,
+                content=_payload(batch),
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+
+
+class EmailDestination:
+    """Render one email per batch and log it instead of sending it."""
+
+    name = "email"
+
+    def __init__(self, to: str, sender: str = "alerts@market-signal-agent") -> None:
+        self.to = to
+        self.sender = sender
+
+    def render(self, batch: list[dict[str, Any]]) -> EmailMessage:
+        """Email summarizing a batch, most severe alerts first."""
+        rank = {"critical": 0, "warning": 1, "info": 2}
+        batch = sorted(batch, key=lambda alert: rank.get(alert.get("severity"), 3))
+        opened = sum(alert.get("transition") == "opened" for alert in batch)
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = self.to
+        message["Subject"] = (
+            f"[{batch[0].get('severity', 'info').upper()}] {opened} new, "
+            f"{len(batch) - opened} resolved market alert(s)"
+        )
+        message.set_content(
+            "\n".join(
+                f"- {alert.get('transition', 'opened').upper()} "
+                f"[{alert.get('severity')}] {alert.get('message')}"
+                for alert in batch
+            )
+        )
+        return message
+
+    async def send(self, batch: list[dict[str, Any]]) -> None:
+        """Log the rendered message (stub: no SMTP delivery)."""
+        message = self.render(batch)
+        logger.info("Email (stub) to %s: %s", self.to, message["Subject"])
+
+
+class FileDestination:
+    """Append each alert as one JSON line."""
+
+    name = "file"
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    async def send(self, batch: list[dict[str, Any]]) -> None:
+        """Append the batch to the sink file."""
+        lines = "".join(json.dumps(alert, default=str) + "\n" for alert in batch)
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class DeliveryQueue:
+    """Pending alerts and the worker delivering them to one destination."""
+
+    def __init__(
+        self,
+        destination: Any,
+        batch_seconds: float,
+        rate_per_minute: int,
+        max_retries: int,
+    ) -> None:
+        self.destination = destination
+        self.batch_seconds = batch_seconds
+        self.min_interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self.max_retries = max_retries
+        # Latest transition per alert id, in arrival order
+        self.pending: dict[str, dict[str, Any]] = {}
+        self.stats = {"batches": 0, "delivered": 0, "coalesced": 0, "failed": 0}
+        self._in_flight = 0
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._last_sent: float | None = None
+
+    @property
+    def idle(self) -> bool:
+        """Whether nothing is pending or being delivered."""
+        return not self.pending and not self._in_flight
+
+    def start(self) -> None:
+        """Start the worker on the running event loop."""
+        self._wake = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        if self.pending:
+            self._wake.set()
+
+    def put(self, alerts: list[dict[str, Any]]) -> None:
+        """Queue alerts, replacing pending ones with the same id."""
+        for alert in alerts:
+            if alert["id"] in self.pending:
+                self.stats["coalesced"] += 1
+                del self.pending[alert["id"]]  # Re-queue at the end
+            self.pending[alert["id"]] = alert
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wake.wait()
+            # Let the rest of a burst arrive, then respect the rate limit
+            await asyncio.sleep(self.batch_seconds)
+            if self._last_sent is not None:
+                wait = self._last_sent + self.min_interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            self._wake.clear()
+            ids = list(self.pending)[:MAX_BATCH_SIZE]
+            batch = [self.pending.pop(alert_id) for alert_id in ids]
+            if self.pending:
+                self._wake.set()
+            if not batch:
+                continue
+
+            self._in_flight = len(batch)
+            self._last_sent = loop.time()
+            try:
+                await self._deliver(batch)
+            finally:
+                self._in_flight = 0
+
+    async def _deliver(self, batch: list[dict[str, Any]]) -> None:
+        """Send one batch, retrying with exponential backoff."""
+        name = self.destination.name
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.destination.send(batch)
+            except Exception:
+                if attempt == self.max_retries:
+                    self.stats["failed"] += len(batch)
+                    logger.exception(
+                        "Alert delivery to %s failed, dropped %d", name, len(batch)
+                    )
+                    return
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+            else:
+                self.stats["batches"] += 1
+                self.stats["delivered"] += len(batch)
+                return
+
+    def stop(self) -> None:
+        """Cancel the worker; pending alerts are kept for the next start."""
+        if self._task is not None:
+            self._task.cancel()
+        self._task = self._wake = None
+        self._in_flight = 0
+
+
+class AlertDispatcher:
+    """Fans published alert transitions out to every destination."""
+
+    def __init__(
+        self,
+        destinations: list[Any],
+        batch_seconds: float = 2.0,
+        rate_per_minute: int = 30,
+        max_retries: int = 3,
+    ) -> None:
+        self.queues = [
+            DeliveryQueue(destination, batch_seconds, rate_per_minute, max_retries)
+            for destination in destinations
+        ]
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def publish(self, rows: list[dict[str, Any]]) -> int:
+        """Queue a sweep's opened and resolved alerts for delivery.
+
+        Must be called from the event loop; returns without waiting for
+        delivery.
+
+        Returns:
+            Number of alerts queued per destination.
+        """
+        alerts = [row for row in rows if row.get("transition") in DELIVERED_TRANSITIONS]
+        if not alerts or not self.queues:
+            return 0
+        self._ensure_started()
+        for queue in self.queues:
+            queue.put(alerts)
+        return len(alerts)
+
+    def _ensure_started(self) -> None:
+        """(Re)start the workers on the running loop (e.g. a new asyncio.run)."""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        for queue in self.queues:
+            queue.stop()
+            queue.start()
+        self._loop = loop
+
+    async def flush(self, timeout: float = 30.0) -> bool:
+        """Wait until every destination has delivered its pending alerts.
+
+        Returns:
+            True if everything was delivered (or dropped) within the timeout.
+        """
+        if any(not queue.idle for queue in self.queues):
+            self._ensure_started()
+        deadline = asyncio.get_running_loop().time() + timeout
+        while any(not queue.idle for queue in self.queues):
+            if asyncio.get_running_loop().time() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    def status(self) -> dict[str, dict[str, int]]:
+        """Delivery counters and queue depth per destination."""
+        return {
+            queue.destination.name: {**queue.stats, "pending": len(queue.pending)}
+            for queue in self.queues
+        }
+
+
+def configured_destinations() -> list[Any]:
+    """Destinations enabled in the config."""
+    destinations: list[Any] = []
+    if config.alert_webhook_url:
+        destinations.append(WebhookDestination(config.alert_webhook_url))
+    if config.alert_email_to:
+        destinations.append(EmailDestination(config.alert_email_to))
+    if config.alert_sink_path:
+        path = config.resolve_path(config.alert_sink_path)
+        destinations.append(FileDestination(path))
+    return destinations
+
+
+# Process-wide dispatcher fed by AlertEngine.commit
+alert_dispatcher = AlertDispatcher(
+    configured_destinations(),
+    batch_seconds=config.alert_batch_seconds,
+    rate_per_minute=config.alert_rate_per_minute,
+    max_retries=config.alert_max_retries,
+)
@@ -0,0 +1,328 @@
+"""Declarative alert rules compiled into vectorized predicates.
+
+Rules live in a YAML or JSON file (config.alert_rules_path, default
+market_signal_agent/alert_rules.yaml) instead of if/elif chains. Each rule
+names the snapshot table it runs over, a condition, and the alert it raises:
+
+    - id: vix_high
+      table: market
+      alert_type: vix_high
+      severity: warning
+      band: "25-30"
+      when: {all: [{field: vix, op: ">", value: 25}, {field: vix, op: "<=", value: 30}]}
+      message: "HIGH volatility - VIX at {vix:.1f}, above 25"
+
+Tables (built once per evaluation, one NumPy array per column):
+
+- market: one row with date, vix, hv_20d (20-day S&P 500 realized
+  volatility, percent), hv_vix_spread (vix - hv_20d) and contagion (mean
+  absolute correlation rise across assets);
+- symbols: one row per index with symbol, price_zscore, volume_zscore,
+  price_sigma / volume_sigma (|z|) and price_direction / volume_direction
+  ("above"/"below");
+- pairs: one row per asset pair with symbol ("sp500/gold"), shift
+  (short- minus long-window correlation), correlation_short, correlation_long;
+- events: one row per calendar event in the next weeks with symbol
+  ("<event_type>@<start_date>"), event_type, title, start_date, days_until
+  and high_impact.
+
+Conditions are {field, op, value} with op one of > >= < <= == != in, an
+optional abs: true (compare |field|), or {all: [...]}, {any: [...]},
+{not: ...}. A condition on a NaN value is false. message and band are format
+strings over the row's fields; band (default: the rule id) and the symbol
+make the alert fingerprint, so VIX and z-score rules produce the same ids as
+check_vix_threshold and check_anomaly_alert.
+
+Thresholds shared with the rest of the app are written as ${name}
+placeholders for numeric config settings (e.g. ${vix_high},
+${zscore_threshold}) and substituted before parsing, so VIX_HIGH and friends
+remain the single source for the rules, check_vix_threshold, the alert
+agent's prompt and the scenario grid.
+
+load_rules() recompiles the file when its modification time changes, so
+edits take effect on the next evaluation without restarting the server; a
+file that fails to parse or validate is reported and the previous rules stay
+in use.
+"""
+
+import json
+import logging
+import operator
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from string import Template
+from typing import Any, Literal
+
+import numpy as np
+import yaml
+from pydantic import BaseModel, Field
+
+from ..config import config
+from .alert_state import ANY_SYMBOL, alert_fingerprint, alert_scope
+
+logger = logging.getLogger(__name__)
+
+# Columns of each snapshot table
+TABLE_FIELDS = {
+    "market": ("date", "vix", "hv_20d", "hv_vix_spread", "contagion"),
+    "symbols": (
+        "symbol",
+        "price_zscore",
+        "volume_zscore",
+        "price_sigma",
+        "volume_sigma",
+        "price_direction",
+        "volume_direction",
+    ),
+    "pairs": ("symbol", "shift", "correlation_short", "correlation_long"),
+    "events": (
+        "symbol",
+        "event_type",
+        "title",
+        "start_date",
+        "days_until",
+        "high_impact",
+    ),
+}
+
+# Text columns (the rest are numeric or boolean)
+TEXT_FIELDS = frozenset(
+    {
+        "date",
+        "symbol",
+        "price_direction",
+        "volume_direction",
+        "event_type",
+        "title",
+        "start_date",
+    }
+)
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+Predicate = Callable[[dict[str, np.ndarray]], np.ndarray]
+
+
+class AlertRule(BaseModel):
+    """One declarative alert rule."""
+
+    id: str
+    table: Literal["market", "symbols", "pairs", "events"]
+    alert_type: str
+    severity: Literal["info", "warning", "critical"]
+    when: dict[str, Any]
+    message: str
+    band: str | None = None  # Format string; defaults to the rule id
+    enabled: bool = True
+
+
+class RuleFile(BaseModel):
+    """Top-level structure of the rules file."""
+
+    rules: list[AlertRule] = Field(default_factory=list)
+
+
+def _compile_condition(condition: dict[str, Any], table: str) -> Predicate:
+    """Compile one condition into a function of the table's columns."""
+    if "all" in condition or "any" in condition:
+        combine = np.logical_and if "all" in condition else np.logical_or
+        children = condition.get("all", condition.get("any"))
+        parts = [_compile_condition(child, table) for child in children]
+        if not parts:
+            raise ValueError("'all'/'any' needs at least one condition")
+
+        def combined(columns: dict[str, np.ndarray]) -> np.ndarray:
+            return combine.reduce([part(columns) for part in parts])
+
+        return combined
+
+    if "not" in condition:
+        inner = _compile_condition(condition["not"], table)
+        return lambda columns: ~inner(columns)
+
+    field, op, value = (condition.get(key) for key in ("field", "op", "value"))
+    if field not in TABLE_FIELDS[table]:
+        raise ValueError(
+            f"Unknown field '{field}' for table '{table}'; "
+            f"use one of {list(TABLE_FIELDS[table])}"
+        )
+    if op == "in":
+        if not isinstance(value, list):
+            raise ValueError(f"'in' needs a list value for field '{field}'")
+        return lambda columns: np.isin(columns[field], value)
+    if op not in _COMPARISONS:
+        raise ValueError(f"Unknown op '{op}'; use one of {[*_COMPARISONS, 'in']}")
+    compare = _COMPARISONS[op]
+    use_abs = bool(condition.get("abs"))
+
+    def predicate(columns: dict[str, np.ndarray]) -> np.ndarray:
+        values = columns[field]
+        if values.dtype.kind in "fiub":
+            values = np.abs(values) if use_abs else values
+            with np.errstate(invalid="ignore"):
+                return compare(values, value) & ~np.isnan(values.astype(float))
+        return np.asarray(compare(values, value), dtype=bool)
+
+    return predicate
+
+
+class CompiledRule:
+    """A validated rule with its compiled predicate."""
+
+    def __init__(self, rule: AlertRule) -> None:
+        self.rule = rule
+        self.predicate = _compile_condition(rule.when, rule.table)
+        self.band = rule.band or rule.id
+        # Fail on unknown placeholders at load time, not at alert time
+        sample = {
+            name: "" if name in TEXT_FIELDS else 0.0
+            for name in TABLE_FIELDS[rule.table]
+        }
+        try:
+            rule.message.format_map(sample)
+            self.band.format_map(sample)
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Rule '{rule.id}': bad template: {e}") from e
+        self.scope = alert_scope(
+            {"id": alert_fingerprint(rule.alert_type, ANY_SYMBOL, self.band)}
+        )
+
+    def evaluate(
+        self, columns: dict[str, np.ndarray], timestamp: str
+    ) -> list[dict[str, Any]]:
+        """Alerts for the rows matching the rule."""
+        rule = self.rule
+        hits = np.flatnonzero(self.predicate(columns))
+        vix = columns.get("vix")
+        alerts = []
+        for i in hits:
+            row = {name: values[i] for name, values in columns.items()}
+            row = {
+                name: value.item() if isinstance(value, np.generic) else value
+                for name, value in row.items()
+            }
+            symbol = None if rule.table == "market" else str(row["symbol"])
+            alerts.append(
+                {
+                    "id": alert_fingerprint(
+                        rule.alert_type, symbol, self.band.format_map(row)
+                    ),
+                    "alert_type": rule.alert_type,
+                    "severity": rule.severity,
+                    "symbol": symbol,
+                    "message": rule.message.format_map(row),
+                    "vix_value": float(vix[i]) if vix is not None else None,
+                    "triggered_at": timestamp,
+                    "is_active": True,
+                    "rule": rule.id,
+                }
+            )
+        return alerts
+
+
+class RuleSet:
+    """Compiled rules evaluated together over one snapshot."""
+
+    def __init__(self, rules: list[AlertRule], version: str = "") -> None:
+        ids = [rule.id for rule in rules]
+        duplicates = sorted({i for i in ids if ids.count(i) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rule ids: {duplicates}")
+        self.rules = [CompiledRule(rule) for rule in rules if rule.enabled]
+        self.version = version
+
+    @classmethod
+    def from_file(cls, path: Path) -> "RuleSet":
+        """Parse, validate and compile a YAML or JSON rules file."""
+        text = substitute_settings(path.read_text(encoding="utf-8"))
+        data = json.loads(text) if path.suffix == ".json" else yaml.safe_load(text)
+        rule_file = RuleFile.model_validate(data or {})
+        version = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+        return cls(rule_file.rules, version.isoformat())
+
+    def evaluate(
+        self,
+        tables: dict[str, dict[str, np.ndarray]],
+        now: datetime | None = None,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Evaluate every rule whose table is present.
+
+        Args:
+            tables: Snapshot tables (see TABLE_FIELDS) as column arrays;
+                missing tables skip their rules.
+            now: Alert time (default: now).
+
+        Returns:
+            Triggered alerts (critical first) and the alert scopes the
+            evaluated rules cover, for resolving alerts that cleared.
+        """
+        timestamp = (now or datetime.now(timezone.utc)).isoformat()
+        alerts: list[dict[str, Any]] = []
+        scopes: list[str] = []
+        for compiled in self.rules:
+            columns = tables.get(compiled.rule.table)
+            if columns is None:
+                continue
+            alerts.extend(compiled.evaluate(columns, timestamp))
+            if compiled.scope:
+                scopes.append(compiled.scope)
+        rank = {"critical": 0, "warning": 1, "info": 2}
+        alerts.sort(key=lambda alert: rank[alert["severity"]])
+        return alerts, list(dict.fromkeys(scopes))
+
+
+def substitute_settings(text: str) -> str:
+    """Replace ${name} placeholders with numeric config settings.
+
+    Values are formatted with :g (30.0 -> "30"), matching vix_band() and
+    anomaly_band() so rule fingerprints equal the single-check tools'.
+    """
+    settings = {
+        name: f"{value:g}"
+        for name, value in config.model_dump().items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+    try:
+        return Template(text).substitute(settings)
+    except KeyError as e:
+        raise ValueError(f"Unknown config setting in rules file: {e}") from e
+
+
+_cache: dict[str, Any] = {"mtime": None, "rules": None}
+
+
+def load_rules() -> RuleSet:
+    """Current rules, recompiled only when the rules file changes."""
+    path = config.resolve_path(config.alert_rules_path)
+    mtime = path.stat().st_mtime_ns
+    if mtime != _cache["mtime"]:
+        try:
+            _cache["rules"] = RuleSet.from_file(path)
+        except (OSError, ValueError, yaml.YAMLError):
+            if _cache["rules"] is None:
+                raise
+            logger.exception("Alert rules not reloaded (%s)", path)
+        _cache["mtime"] = mtime
+    return _cache["rules"]
+
+
+def correlation_pairs(
+    assets: tuple[str, ...], shift: np.ndarray, short: np.ndarray, long: np.ndarray
+) -> dict[str, np.ndarray]:
+    """Pairs table from one day's (assets, assets) correlation matrices."""
+    rows, cols = np.triu_indices(len(assets), k=1)
+    names = np.array(assets, dtype=object)
+    return {
+        "symbol": names[rows] + "/" + names[cols],
+        "shift": shift[rows, cols],
+        "correlation_short": short[rows, cols],
+        "correlation_long": long[rows, cols],
+    }
@@ -0,0 +1,163 @@
+"""Alert deduplication: stable fingerprints and an in-memory active-alert index.
+
+An alert's id is its fingerprint, built from its type, symbol and threshold
+band (e.g. "vix_high:*:25-30", "anomaly:SPX:price_above_2"), so re-checking an
+unchanged condition yields the same id instead of a new uuid. Each alert
+check ("sweep", one alert_agent run) moves the conditions it covered through
+three transitions:
+
+- opened: a fingerprint that is not active starts a new alert (a resolved
+  fingerprint that fires again is re-opened with a new triggered_at);
+- updated: an active fingerprint that fires again keeps its triggered_at and
+  refreshes severity, message, VIX value and updated_at;
+- resolved: an active fingerprint whose scope was checked (VIX, or one
+  symbol's price/volume z-score) but did not fire is closed (is_active false,
+  resolved_at set).
+
+AlertSweep collects what one run checked and fired, and ActiveAlertIndex
+holds the active alerts and plans a sweep's transitions; tools/alert_store.py
+keeps the sweeps in memory, loads the index from the alerts table and
+persists each sweep with MERGEs keyed on id. The alerts table therefore holds
+one row per distinct condition, and the active set is the rows with is_active
+true.
+"""
+
+from datetime import datetime
+from typing import Any
+
+# Session state key with the transition counts of the last sweep
+ALERT_CHANGES_KEY = "alert_changes"
+
+VIX_ALERT_TYPES = ("vix_elevated", "vix_high", "vix_extreme")
+
+# Scope covering the VIX threshold alerts
+VIX_SCOPE = "vix"
+
+# Symbol placeholder in fingerprints of market-wide alerts and in scopes
+# covering every symbol
+ANY_SYMBOL = "*"
+
+
+def alert_fingerprint(alert_type: str, symbol: str | None, band: str) -> str:
+    """Stable alert id for a condition."""
+    return f"{alert_type}:{symbol or ANY_SYMBOL}:{band}"
+
+
+def vix_band(lower: float, upper: float | None = None) -> str:
+    """Threshold band of a VIX alert, e.g. "25-30" or "30+"."""
+    return f"{lower:g}-{upper:g}" if upper is not None else f"{lower:g}+"
+
+
+def anomaly_band(anomaly_type: str, zscore: float, threshold: float) -> str:
+    """Threshold band of a z-score alert: kind, direction and threshold."""
+    direction = "above" if zscore > 0 else "below"
+    return f"{anomaly_type}_{direction}_{threshold:g}"
+
+
+def anomaly_scope(symbol: str, anomaly_type: str) -> str:
+    """Scope covering one symbol's z-score alerts of one kind."""
+    return f"anomaly:{symbol}:{anomaly_type}"
+
+
+def alert_scope(alert: dict[str, Any]) -> str | None:
+    """Scope of an alert's fingerprint, or None for ids that are not one."""
+    parts = str(alert["id"]).split(":")
+    if len(parts) != 3:
+        return None
+    alert_type, symbol, band = parts
+    if alert_type in VIX_ALERT_TYPES:
+        return VIX_SCOPE
+    if alert_type == "anomaly":
+        return anomaly_scope(symbol, band.split("_", 1)[0])
+    # Other (rule-defined) types: one scope per type across all symbols
+    return f"{alert_type}:{ANY_SYMBOL}"
+
+
+class AlertSweep:
+    """Scopes checked and alerts fired during one alert agent run."""
+
+    def __init__(self) -> None:
+        self.checked: set[str] = set()
+        self.fired: dict[str, dict[str, Any]] = {}
+
+    def record(self, scopes: list[str], alerts: list[dict[str, Any]]) -> None:
+        """Add checked scopes and the alerts they fired."""
+        self.checked.update(scopes)
+        self.fired.update((alert["id"], alert) for alert in alerts)
+
+
+class ActiveAlertIndex:
+    """Active alerts by fingerprint, with the transitions a sweep implies."""
+
+    def __init__(self) -> None:
+        self.active: dict[str, dict[str, Any]] = {}
+        # Active rows with pre-fingerprint ids; resolved in bulk by the next
+        # commit (AlertEngine.resolve_legacy), not through plan()
+        self.legacy: dict[str, dict[str, Any]] = {}
+
+    def load(self, rows: list[dict[str, Any]]) -> None:
+        """Replace the index with active rows from the alerts table."""
+        self.active, self.legacy = {}, {}
+        for row in rows:
+            target = self.active if alert_scope(row) else self.legacy
+            target[row["id"]] = row
+
+    def is_active(self, fingerprint: str) -> bool:
+        """Whether a fingerprint is currently open."""
+        return fingerprint in self.active
+
+    def plan(
+        self,
+        fired: dict[str, dict[str, Any]],
+        checked: set[str],
+        now: datetime,
+    ) -> list[dict[str, Any]]:
+        """Transitions for a sweep, without changing the index.
+
+        Args:
+            fired: Alerts raised by the sweep, keyed by fingerprint.
+            checked: Scopes the sweep evaluated.
+            now: Sweep time.
+
+        Returns:
+            Alert rows to upsert, each with a "transition" of opened, updated
+            or resolved. Legacy rows are not included.
+        """
+        timestamp = now.isoformat()
+        rows = []
+        for fingerprint, alert in fired.items():
+            current = self.active.get(fingerprint)
+            rows.append(
+                {
+                    **alert,
+                    "triggered_at": (current["triggered_at"] if current else timestamp),
+                    "is_active": True,
+                    "updated_at": timestamp,
+                    "resolved_at": None,
+                    "transition": "updated" if current else "opened",
+                }
+            )
+        for fingerprint, alert in self.active.items():
+            if fingerprint not in fired and alert_scope(alert) in checked:
+                rows.append(self._resolved(alert, timestamp))
+        return rows
+
+    @staticmethod
+    def _resolved(alert: dict[str, Any], timestamp: str) -> dict[str, Any]:
+        return {
+            **alert,
+            "is_active": False,
+            "updated_at": timestamp,
+            "resolved_at": timestamp,
+            "transition": "resolved",
+        }
+
+    def apply(self, rows: list[dict[str, Any]]) -> None:
+        """Apply planned transitions once they are persisted."""
+        for row in rows:
+            alert = {k: v for k, v in row.items() if k != "transition"}
+            if row["transition"] == "resolved":
+                self.active.pop(row["id"], None)
+                self.legacy.pop(row["id"], None)
+            else:
+                self.active[row["id"]] = alert
@@ -0,0 +1,282 @@
+"""Rolling cross-asset correlation and covariance matrices.
+
+market_30yr_v holds equity indices, treasury yields, gold, oil and VIX side by
+side. For every trading day and each window in CORRELATION_WINDOWS this module
+computes the full N x N covariance and correlation matrix of daily moves
+(log returns for prices, changes for yields and VIX).
+
+All windows come from one pass of cumulative sums over the per-day outer
+products, so each day's window sums are a difference of two cumulative
+rows (the incremental sliding-window update, vectorized over all days).
+Missing values are handled pairwise: each pair only uses days on which both
+assets traded. Thirty years of daily data take well under a second.
+
+A correlation breakdown is a pair whose short-window correlation has moved
+at least BREAKDOWN_THRESHOLD away from its long-window correlation, e.g.
+stocks and bonds flipping from negative to positive. The contagion score is
+the mean absolute pairwise correlation of the short window minus that of the
+long window: positive when everything starts moving together.
+
+Results are cached per date in an .npz store (scripts/build_correlations.py),
+re-read whenever a build replaces the file, and looked up with one binary
+search.
+"""
+
+import os
+import warnings
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..config import config
+
+# Asset columns of market_30yr_v and how their daily move is measured
+ASSET_RETURNS = {
+    "sp500": "log",
+    "nasdaq": "log",
+    "dow": "log",
+    "russell_2000": "log",
+    "treasury_10y": "diff",
+    "treasury_5y": "diff",
+    "gold": "log",
+    "oil_wti": "log",
+    "vix": "diff",
+}
+ASSETS = tuple(ASSET_RETURNS)
+
+# Rolling windows in trading days (short to long)
+CORRELATION_WINDOWS = (20, 60, 120)
+
+# Minimum days in a window with both assets present for a valid correlation
+MIN_OBSERVATIONS = 10
+
+# Shift between short- and long-window correlation that counts as a breakdown
+BREAKDOWN_THRESHOLD = 0.5
+
+_cache: dict[str, Any] = {"mtime": None, "store": None}
+
+
+def daily_moves(market: pd.DataFrame) -> np.ndarray:
+    """Daily moves per asset as a (days, assets) array, NaN where missing.
+
+    Args:
+        market: Rows sorted by date with the ASSETS columns.
+    """
+    moves = np.full((len(market), len(ASSETS)), np.nan)
+    for j, (asset, kind) in enumerate(ASSET_RETURNS.items()):
+        level = market[asset].to_numpy(dtype=float)
+        if kind == "log":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                level = np.where(level > 0, np.log(level), np.nan)
+        moves[1:, j] = np.diff(level)
+    return moves
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sums along axis 0, from one cumulative sum."""
+    cumulative = np.cumsum(values, axis=0)
+    sums = cumulative.copy()
+    sums[window:] -= cumulative[:-window]
+    return sums
+
+
+def rolling_matrices(
+    moves: np.ndarray, windows: tuple[int, ...] = CORRELATION_WINDOWS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling covariance and correlation matrices for each window.
+
+    Args:
+        moves: (days, assets) daily moves, NaN where missing.
+        windows: Window lengths in days.
+
+    Returns:
+        Covariance and correlation arrays shaped (windows, days, assets, assets),
+        NaN until a window holds MIN_OBSERVATIONS joint days.
+    """
+    present = ~np.isnan(moves)
+    # Centering on the full-sample mean keeps the cumulative sums well conditioned
+    x = np.where(present, moves - np.nanmean(moves, axis=0), 0.0)
+    m = present.astype(float)
+
+    # Pairwise terms: [t, i, j] only counts days where both i and j are present
+    pair_count = m[:, :, None] * m[:, None, :]
+    pair_sum = x[:, :, None] * m[:, None, :]  # sum of x_i over joint days
+    pair_square = (x * x)[:, :, None] * m[:, None, :]
+    cross = x[:, :, None] * x[:, None, :]
+
+    days, n_assets = moves.shape
+    covariance = np.full((len(windows), days, n_assets, n_assets), np.nan)
+    correlation = np.full_like(covariance, np.nan)
+    for w, window in enumerate(windows):
+        n = _window_sums(pair_count, window)
+        s = _window_sums(pair_sum, window)
+        sxx = _window_sums(pair_square, window)
+        sxy = _window_sums(cross, window)
+
+        valid = n >= max(MIN_OBSERVATIONS, 2)
+        n = np.where(valid, n, np.nan)
+        s_t = s.swapaxes(1, 2)  # sum of x_j over the same joint days
+        cov = (sxy - s * s_t / n) / (n - 1)
+        var_i = (sxx - s * s / n) / (n - 1)
+        var_j = var_i.swapaxes(1, 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.sqrt(var_i * var_j)
+
+        covariance[w] = cov
+        correlation[w] = np.clip(corr, -1.0, 1.0)
+    return covariance, correlation
+
+
+def breakdown_scores(correlation: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Shortest-minus-longest window correlation shift and contagion score.
+
+    Args:
+        correlation: (windows, days, assets, assets) from rolling_matrices.
+
+    Returns:
+        (days, assets, assets) correlation shift and (days,) contagion score.
+    """
+    short, long = correlation[0], correlation[-1]
+    shift = short - long
+    off_diagonal = ~np.eye(correlation.shape[-1], dtype=bool)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # days before any window fills
+        contagion = np.nanmean(np.abs(short[:, off_diagonal]), axis=1) - np.nanmean(
+            np.abs(long[:, off_diagonal]), axis=1
+        )
+    return shift, contagion
+
+
+class CorrelationStore:
+    """Per-date correlation and covariance matrices for all windows."""
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        covariance: np.ndarray,
+        correlation: np.ndarray,
+        windows: tuple[int, ...] = CORRELATION_WINDOWS,
+        assets: tuple[str, ...] = ASSETS,
+    ) -> None:
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.covariance = covariance
+        self.correlation = correlation
+        self.windows = tuple(int(w) for w in windows)
+        self.assets = tuple(str(a) for a in assets)
+        self.shift, self.contagion = breakdown_scores(correlation)
+
+    @classmethod
+    def build(cls, market: pd.DataFrame) -> "CorrelationStore":
+        """Compute the store from market rows (date plus ASSETS columns)."""
+        market = market.sort_values("date").reset_index(drop=True)
+        covariance, correlation = rolling_matrices(daily_moves(market))
+        dates = pd.to_datetime(market["date"]).to_numpy(dtype="datetime64[D]")
+        return cls(dates, covariance, correlation)
+
+    def extend(self, market: pd.DataFrame) -> "CorrelationStore":
+        """Append days after the last cached date.
+
+        market must start at least max(windows) days before the first new
+        date; only the new days are computed and appended.
+        """
+        market = market.sort_values("date").reset_index(drop=True)
+        dates = pd.to_datetime(market["date"]).to_numpy(dtype="datetime64[D]")
+        new = dates > self.dates[-1]
+        if not new.any():
+            return self
+        covariance, correlation = rolling_matrices(daily_moves(market), self.windows)
+        return CorrelationStore(
+            np.concatenate([self.dates, dates[new]]),
+            np.concatenate([self.covariance, covariance[:, new]], axis=1),
+            np.concatenate([self.correlation, correlation[:, new]], axis=1),
+            self.windows,
+            self.assets,
+        )
+
+    def save(self, path: str) -> None:
+        """Write the store as compressed .npz, swapping the file in atomically."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                dates=self.dates,
+                covariance=self.covariance.astype(np.float32),
+                correlation=self.correlation.astype(np.float32),
+                windows=np.array(self.windows),
+                assets=np.array(self.assets),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CorrelationStore":
+        """Read a store written by save()."""
+        with np.load(path) as data:
+            return cls(
+                data["dates"],
+                data["covariance"].astype(float),
+                data["correlation"].astype(float),
+                tuple(data["windows"]),
+                tuple(data["assets"]),
+            )
+
+    @property
+    def latest_date(self) -> str:
+        """Most recent date in the store."""
+        return str(self.dates[-1])
+
+    def index_of(self, date: str) -> int | None:
+        """Position of the latest date on or before the given date."""
+        day = np.datetime64(date[:10], "D")
+        i = int(np.searchsorted(self.dates, day, side="right")) - 1
+        return i if i >= 0 else None
+
+    def breakdowns(self, i: int) -> list[dict[str, Any]]:
+        """Pairs whose short-window correlation shifted past the threshold."""
+        shift = self.shift[i]
+        rows, cols = np.nonzero(np.triu(np.abs(shift) >= BREAKDOWN_THRESHOLD, k=1))
+        short, long = self.correlation[0, i], self.correlation[-1, i]
+        pairs = [
+            {
+                "pair": f"{self.assets[a]}/{self.assets[b]}",
+                f"correlation_{self.windows[0]}d": round(float(short[a, b]), 3),
+                f"correlation_{self.windows[-1]}d": round(float(long[a, b]), 3),
+                "shift": round(float(shift[a, b]), 3),
+            }
+            for a, b in zip(rows, cols, strict=True)
+        ]
+        return sorted(pairs, key=lambda p: -abs(p["shift"]))
+
+    def matrix(self, i: int, window: int, kind: str = "correlation") -> dict[str, dict]:
+        """Nested {asset: {asset: value}} matrix for one date and window."""
+        values = (self.correlation if kind == "correlation" else self.covariance)[
+            self.windows.index(window), i
+        ]
+        digits = 3 if kind == "correlation" else 8
+        rounded = np.round(values, digits)
+        return {
+            a: {
+                b: None if np.isnan(rounded[x, y]) else float(rounded[x, y])
+                for y, b in enumerate(self.assets)
+            }
+            for x, a in enumerate(self.assets)
+        }
+
+
+def load_correlation_store() -> CorrelationStore | None:
+    """Latest correlation store, re-read only when the file's mtime changes.
+
+    Returns None if the store has not been built.
+    """
+    path = config.resolve_path(config.correlation_path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if mtime != _cache["mtime"]:
+        try:
+            _cache["store"] = CorrelationStore.load(str(path))
+        except (OSError, ValueError):
+            return _cache["store"]
+        _cache["mtime"] = mtime
+    return _cache["store"]
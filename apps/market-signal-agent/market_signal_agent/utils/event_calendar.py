@@ -0,0 +1,67 @@
+"""In-memory interval index over the event_calendar table.
+
+Each event covers start_date..end_date (a single day for Fed releases, the
+deal month for M&A). Events are kept sorted by start date, and the longest
+event span bounds how far back an overlapping event can start, so "events
+within N days of date D" is two binary searches plus the matches.
+"""
+
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+# Event types that count as high-impact for the forecast's upcoming-event flag;
+# every fed_<type> release counts as well
+HIGH_IMPACT_EVENT_TYPES = frozenset({"mna_mega"})
+
+
+def is_high_impact(event_type: str) -> bool:
+    """Whether an event type should raise the volatility forecast."""
+    return event_type.startswith("fed_") or event_type in HIGH_IMPACT_EVENT_TYPES
+
+
+def _to_day(value: date | str) -> np.datetime64:
+    """Convert a date or ISO date string to a day-resolution datetime64."""
+    return np.datetime64(str(value)[:10], "D")
+
+
+class EventCalendarIndex:
+    """Interval index answering "which events overlap [start, end]"."""
+
+    def __init__(self, events: list[dict[str, Any]]) -> None:
+        """Build the index.
+
+        Args:
+            events: Event dicts with at least start_date and end_date
+                (dates or ISO strings) and event_type.
+        """
+        starts = np.array(
+            [_to_day(e["start_date"]) for e in events], dtype="datetime64[D]"
+        )
+        ends = np.array([_to_day(e["end_date"]) for e in events], dtype="datetime64[D]")
+        order = np.argsort(starts, kind="stable")
+
+        self.events = [events[i] for i in order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.max_span = (
+            (self.ends - self.starts).max() if len(events) else np.timedelta64(0, "D")
+        )
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def overlapping(self, start: date | str, end: date | str) -> list[dict[str, Any]]:
+        """Events whose interval overlaps [start, end], in start-date order."""
+        start_day, end_day = _to_day(start), _to_day(end)
+        lo = np.searchsorted(self.starts, start_day - self.max_span, side="left")
+        hi = np.searchsorted(self.starts, end_day, side="right")
+        candidates = np.arange(lo, hi)
+        matches = candidates[self.ends[candidates] >= start_day]
+        return [self.events[i] for i in matches]
+
+    def within(self, as_of: date | str, days: int) -> list[dict[str, Any]]:
+        """Events overlapping the N days starting at as_of (inclusive)."""
+        as_of_date = date.fromisoformat(str(as_of)[:10])
+        return self.overlapping(as_of_date, as_of_date + timedelta(days=days))
@@ -0,0 +1,74 @@
+"""Empirical event-impact lookup for volatility forecasts.
+
+scripts/build_event_impact.py runs an event study over market_30yr_v and
+writes, per event type, how much more VIX moves after the event than on an
+average day. calculate_volatility_forecast reads the lookup once per process
+and adds the excess VIX response of the upcoming event types, instead of a
+fixed percentage bump. Without a lookup the old multipliers are used.
+"""
+
+import functools
+import json
+from typing import Any
+
+from ..config import config
+
+# Event types produced by the event study (see scripts/build_event_impact.py)
+EVENT_TYPES = {
+    "fed_minute": "FOMC minutes release",
+    "fed_statement": "FOMC statement / rate decision",
+    "mna_large": "M&A deal of $1B-$10B",
+    "mna_mega": "M&A deal over $10B",
+}
+
+# Pooled response over all event types, used when the event type is unknown
+ANY_EVENT = "any"
+
+# (1-day, 5-day) forecast multipliers used when no lookup has been built
+HEURISTIC_EVENT_MULTIPLIERS = (1.10, 1.15)
+
+
+@functools.cache
+def load_event_impact() -> dict[str, Any] | None:
+    """Load the event-impact lookup, or None if it has not been built."""
+    path = config.resolve_path(config.event_impact_path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def parse_event_types(event_types: str) -> list[str]:
+    """Split a comma-separated event type list into normalized names."""
+    return [name.strip().lower() for name in event_types.split(",") if name.strip()]
+
+
+def event_adjustment(event_types: list[str]) -> dict[str, Any] | None:
+    """Excess VIX points expected after the given events.
+
+    Args:
+        event_types: Upcoming event types (e.g. ["fed_minute"]); empty means
+            an event is expected but its type is unknown.
+
+    Returns:
+        Dict with vix_points_1d, vix_points_5d, the matched events and their
+        historical sample count, or None if the lookup is missing or covers
+        none of the events.
+    """
+    lookup = load_event_impact()
+    if lookup is None:
+        return None
+
+    impacts = lookup["event_types"]
+    matched = [name for name in event_types if name in impacts]
+    if not matched and ANY_EVENT in impacts:
+        matched = [ANY_EVENT]
+    if not matched:
+        return None
+
+    return {
+        "source": "event_study",
+        "events": matched,
+        "samples": sum(impacts[name]["n"] for name in matched),
+        "vix_points_1d": sum(impacts[name]["excess_vix_1d"] for name in matched),
+        "vix_points_5d": sum(impacts[name]["excess_vix_5d"] for name in matched),
+    }
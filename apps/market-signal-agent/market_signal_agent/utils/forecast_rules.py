@@ -0,0 +1,37 @@
+"""Volatility forecast rules shared by every forecast path.
+
+calculate_volatility_forecast (tools/forecast_tools.py), the per-symbol
+forecasts (utils/symbol_forecast.py), the scenario grid (utils/scenarios.py)
+and the dashboard read model (utils/read_model.py) all apply the same mean
+reversion, regime bands and confidence rules, so they are defined once here.
+"""
+
+from ..config import config
+
+# Mean reversion weight towards the long-run level (the VIX average for the
+# index forecast, a symbol's one-year realized volatility per symbol)
+VIX_LONG_TERM_AVG = 20.0
+MEAN_REVERSION_1D = 0.05
+MEAN_REVERSION_5D = 0.15
+
+# Forecast confidence by VIX regime, reduced by DIVERGENCE_PENALTY when
+# short-term and current volatility disagree by more than DIVERGENCE_LIMIT
+CONFIDENCE_BY_REGIME = {
+    "low": 0.85,
+    "normal": 0.80,
+    "elevated": 0.70,
+    "extreme": 0.55,
+}
+DIVERGENCE_LIMIT = 0.3
+DIVERGENCE_PENALTY = 0.9
+
+
+def vix_regime(vix: float) -> str:
+    """Volatility regime for a VIX level (same bands as the technical agent)."""
+    if vix < config.vix_low:
+        return "low"
+    if vix < config.vix_normal:
+        return "normal"
+    if vix < config.vix_high:
+        return "elevated"
+    return "extreme"
@@ -0,0 +1,179 @@
+"""Rule-based intent router for the root orchestrator.
+
+Classifies the latest user message without a model call so greetings and
+capability questions can be answered from templates, and analysis queries
+can be handed straight to sequential_analysis_agent. What-if questions stay
+with the orchestrator, which answers them with its scenario tool.
+"""
+
+import re
+from typing import Literal
+
+Intent = Literal["greeting", "capabilities", "scenario", "analysis", "unknown"]
+
+# Name of the workflow agent that handles every analysis query
+ANALYSIS_AGENT_NAME = "sequential_analysis"
+
+GREETING_RESPONSE = (
+    "Hello! I'm the Market Volatility Prediction system. I analyze VIX levels, "
+    "Fed events, earnings sentiment, and generate volatility forecasts. "
+    "Try: 'Run a complete volatility analysis'"
+)
+
+CAPABILITIES_RESPONSE = (
+    "I'm the Market Volatility Prediction system. I can:\n"
+    "- Report the VIX level, volatility regime and 20-day historical volatility\n"
+    "- Detect price and volume anomalies across major indices\n"
+    "- Summarize Fed FOMC communications, M&A deals and analyst rating changes\n"
+    "- Analyze earnings call sentiment (AAPL, AMD, AMZN, ASML, CSCO, GOOGL, "
+    "INTC, MSFT, MU, NVDA)\n"
+    "- Generate 1-day and 5-day volatility forecasts for SPX, NDX, DJI and RUT\n"
+    "- Raise VIX threshold and anomaly alerts\n"
+    "- Answer what-if questions (e.g. VIX at 35 before an FOMC statement) "
+    "without rerunning the analysis\n\n"
+    "Try: 'Run a complete volatility analysis' or 'What's Apple's earnings sentiment?'"
+)
+
+# Prefix added by the web app's /api/run route, e.g. "[Signal Profile: macro] hi"
+_PROFILE_PREFIX = re.compile(r"^\s*\[[^\]]*\]\s*")
+
+_GREETING_WORDS = frozenset(
+    {
+        "hi",
+        "hello",
+        "hey",
+        "hiya",
+        "yo",
+        "howdy",
+        "greetings",
+        "good",
+        "morning",
+        "afternoon",
+        "evening",
+        "there",
+        "thanks",
+        "thank",
+        "you",
+        "ok",
+        "okay",
+    }
+)
+
+_CAPABILITY_PATTERNS = (
+    re.compile(r"\bwhat (can|do) you (do|offer|support)\b"),
+    re.compile(r"\bwho are you\b"),
+    re.compile(r"\bwhat are you\b"),
+    re.compile(r"\bhow (do|does) (you|this|it) work\b"),
+    re.compile(r"\b(capabilities|features)\b"),
+    re.compile(r"^(help|help me|\?)$"),
+)
+
+# What-if questions, answered by the orchestrator's scenario tool
+_SCENARIO_PATTERNS = (
+    re.compile(r"\bwhat if\b"),
+    re.compile(r"\bwhat happens if\b"),
+    re.compile(r"\b(scenarios?|stress[- ]?tests?|stress[- ]?testing)\b"),
+    re.compile(r"\b(jumps?|spikes?|rises?|falls?|drops?|goes|went) (up |down )?to \d"),
+)
+
+_ANALYSIS_KEYWORDS = frozenset(
+    {
+        # Technical / VIX
+        "vix",
+        "volatility",
+        "vol",
+        "regime",
+        "anomaly",
+        "anomalies",
+        "zscore",
+        "market",
+        "markets",
+        "index",
+        "indices",
+        "spx",
+        "ndx",
+        "dji",
+        "rut",
+        "s&p",
+        "nasdaq",
+        "dow",
+        "russell",
+        # Events
+        "fed",
+        "fomc",
+        "minutes",
+        "rates",
+        "event",
+        "events",
+        "m&a",
+        "merger",
+        "mergers",
+        "acquisition",
+        "acquisitions",
+        "analyst",
+        "analysts",
+        "rating",
+        "ratings",
+        "upgrade",
+        "downgrade",
+        # Earnings
+        "earnings",
+        "sentiment",
+        "guidance",
+        "transcript",
+        "transcripts",
+        # Outputs
+        "forecast",
+        "forecasts",
+        "predict",
+        "prediction",
+        "alert",
+        "alerts",
+        "analysis",
+        "analyze",
+        "analyse",
+        "signal",
+        "signals",
+    }
+)
+
+_TOKEN = re.compile(r"[a-z0-9&\-]+")
+
+
+def normalize_message(text: str) -> str:
+    """Lowercase the message and strip the web app's profile prefix."""
+    return _PROFILE_PREFIX.sub("", text).strip().lower()
+
+
+def classify_intent(text: str) -> Intent:
+    """Classify a user message into a routing intent.
+
+    What-if questions take precedence over analysis keywords, and analysis
+    keywords over greetings, so "hi, what's the VIX?" is routed to the
+    analysis workflow rather than answered as a greeting.
+
+    Args:
+        text: Raw user message.
+
+    Returns:
+        "scenario", "analysis", "greeting", "capabilities", or "unknown" when
+        the message should fall through to the LLM orchestrator.
+    """
+    message = normalize_message(text)
+    if not message:
+        return "unknown"
+
+    if any(pattern.search(message) for pattern in _SCENARIO_PATTERNS):
+        return "scenario"
+
+    tokens = _TOKEN.findall(message)
+    if any(token in _ANALYSIS_KEYWORDS for token in tokens):
+        return "analysis"
+
+    if any(pattern.search(message) for pattern in _CAPABILITY_PATTERNS):
+        return "capabilities"
+
+    if tokens and len(tokens) <= 4 and all(t in _GREETING_WORDS for t in tokens):
+        return "greeting"
+
+    return "unknown"
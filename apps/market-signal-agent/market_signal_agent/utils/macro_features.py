@@ -0,0 +1,146 @@
+"""Macro feature store: daily feature vectors keyed by date.
+
+scripts/build_macro_features.py combines the annual economic_indicators
+(inflation, GDP growth, unemployment) with daily rates and commodities from
+market_30yr_v and writes one row per trading day to a Parquet file. Annual
+figures are only used from the year after they describe (a year's numbers are
+published early the following year), so no date sees future data. Surprises
+are measured against the trailing 3-year average.
+
+The store is loaded into numpy columns and re-read whenever a rebuild
+replaces the file; a lookup for any date is one binary search for the latest
+row on or before it.
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ..config import config
+
+# Trailing years that form the "expected" value for surprise features
+SURPRISE_YEARS = 3
+
+# Trading days for daily change features
+CHANGE_DAYS = 20
+
+ANNUAL_INDICATORS = ("inflation_rate", "gdp_growth", "unemployment_rate")
+
+_cache: dict[str, Any] = {"mtime": None, "store": None}
+
+
+def macro_regime(inflation_change: float, gdp_surprise: float) -> str:
+    """Classify the macro backdrop from inflation direction and growth surprise."""
+    if np.isnan(inflation_change) or np.isnan(gdp_surprise):
+        return "unknown"
+    if inflation_change > 0:
+        return "overheating" if gdp_surprise >= 0 else "stagflationary"
+    return "goldilocks" if gdp_surprise >= 0 else "slowdown"
+
+
+def compute_macro_features(
+    indicators: pd.DataFrame, market: pd.DataFrame
+) -> pd.DataFrame:
+    """Build the daily feature table.
+
+    Args:
+        indicators: Annual rows with year and ANNUAL_INDICATORS columns.
+        market: Daily rows with date, treasury_10y, treasury_5y, oil_wti, gold.
+
+    Returns:
+        One row per market date, sorted by date.
+    """
+    annual = indicators.sort_values("year").set_index("year")[list(ANNUAL_INDICATORS)]
+    expected = annual.rolling(SURPRISE_YEARS, min_periods=1).mean().shift(1)
+    annual_features = pd.DataFrame(index=annual.index)
+    for column in ANNUAL_INDICATORS:
+        annual_features[column] = annual[column]
+        annual_features[f"{column}_change"] = annual[column].diff()
+        annual_features[f"{column}_surprise"] = annual[column] - expected[column]
+
+    daily = market.sort_values("date").reset_index(drop=True)
+    features = pd.DataFrame({"date": pd.to_datetime(daily["date"]).dt.date})
+    features["treasury_10y"] = daily["treasury_10y"]
+    features["term_spread"] = daily["treasury_10y"] - daily["treasury_5y"]
+    features["treasury_10y_change_20d"] = daily["treasury_10y"].diff(CHANGE_DAYS)
+    features["oil_return_20d"] = daily["oil_wti"].pct_change(
+        CHANGE_DAYS, fill_method=None
+    )
+    features["gold_return_20d"] = daily["gold"].pct_change(
+        CHANGE_DAYS, fill_method=None
+    )
+
+    # As-of join: each day uses the latest published year (the year before)
+    data_year = pd.to_datetime(daily["date"]).dt.year - 1
+    features["indicator_year"] = data_year
+    features = features.join(annual_features, on="indicator_year")
+
+    features["macro_regime"] = [
+        macro_regime(change, surprise)
+        for change, surprise in zip(
+            features["inflation_rate_change"],
+            features["gdp_growth_surprise"],
+            strict=True,
+        )
+    ]
+    return features
+
+
+class MacroFeatureStore:
+    """Date-keyed feature vectors held as numpy columns."""
+
+    def __init__(self, features: pd.DataFrame) -> None:
+        self.dates = pd.to_datetime(features["date"]).to_numpy(dtype="datetime64[D]")
+        self.columns = {
+            name: features[name].to_numpy()
+            for name in features.columns
+            if name != "date"
+        }
+
+    @classmethod
+    def load(cls, path: str) -> "MacroFeatureStore":
+        """Read a store written by scripts/build_macro_features.py."""
+        return cls(pq.read_table(path).to_pandas())
+
+    @property
+    def latest_date(self) -> str:
+        """Most recent date in the store."""
+        return str(self.dates[-1])
+
+    def lookup(self, date: str) -> dict[str, Any] | None:
+        """Feature vector of the latest date on or before the given date."""
+        day = np.datetime64(date[:10], "D")
+        i = int(np.searchsorted(self.dates, day, side="right")) - 1
+        if i < 0:
+            return None
+
+        vector: dict[str, Any] = {"date": str(self.dates[i])}
+        for name, values in self.columns.items():
+            value = values[i]
+            if isinstance(value, (float, np.floating)):
+                value = None if np.isnan(value) else round(float(value), 4)
+            elif isinstance(value, np.integer):
+                value = int(value)
+            vector[name] = value
+        return vector
+
+
+def load_macro_store() -> MacroFeatureStore | None:
+    """Latest feature store, re-read only when the file's mtime changes.
+
+    Returns None if the store has not been built.
+    """
+    path = config.resolve_path(config.macro_feature_path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if mtime != _cache["mtime"]:
+        try:
+            _cache["store"] = MacroFeatureStore.load(str(path))
+        except (OSError, ValueError):
+            return _cache["store"]
+        _cache["mtime"] = mtime
+    return _cache["store"]
@@ -0,0 +1,104 @@
+"""Headline sentiment model: multinomial naive Bayes over word tokens.
+
+Fitted on the labeled stock_news headlines (positive / negative / neutral) and
+applied to any headline column. Both fitting and scoring are vectorized: the
+headlines are tokenized with Arrow compute kernels into one dictionary-encoded
+token column, only the distinct tokens are mapped to vocabulary ids, and
+per-class log-likelihoods are summed per headline with np.bincount, so a
+million headlines score in seconds on CPU.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+SENTIMENT_LABELS = ("negative", "neutral", "positive")
+
+_NON_WORD = r"[^a-z0-9]+"
+
+
+def tokenize_headlines(
+    headlines: pd.Series,
+) -> tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Split headlines into dictionary-encoded tokens.
+
+    Returns:
+        Parallel arrays of headline positions (0..len-1) and token codes, and
+        the distinct tokens the codes index into.
+    """
+    text = pa.array(
+        headlines.to_numpy(dtype=object), type=pa.large_string(), from_pandas=True
+    )
+    words = pc.utf8_split_whitespace(
+        pc.replace_substring_regex(pc.utf8_lower(text), _NON_WORD, " ")
+    )
+    tokens = pc.list_flatten(words).dictionary_encode()
+    docs = pc.list_parent_indices(words).to_numpy()
+    codes = tokens.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+    return docs, codes, pd.Index(tokens.dictionary.to_pylist())
+
+
+class NewsSentimentModel:
+    """Naive Bayes headline classifier with Laplace smoothing."""
+
+    def __init__(
+        self, vocabulary: pd.Index, log_likelihood: np.ndarray, log_prior: np.ndarray
+    ) -> None:
+        self.vocabulary = vocabulary
+        self.log_likelihood = log_likelihood  # (vocabulary, labels)
+        self.log_prior = log_prior  # (labels,)
+
+    @classmethod
+    def fit(
+        cls, headlines: pd.Series, labels: pd.Series, alpha: float = 1.0
+    ) -> "NewsSentimentModel":
+        """Fit on headlines labeled with one of SENTIMENT_LABELS (any case)."""
+        normalized = labels.reset_index(drop=True).astype(str).str.lower()
+        label_ids = pd.Categorical(normalized, categories=SENTIMENT_LABELS).codes
+        known = label_ids >= 0
+
+        docs, token_ids, vocabulary = tokenize_headlines(headlines)
+        docs_known = known[docs]
+        docs, token_ids = docs[docs_known], token_ids[docs_known]
+
+        n_labels = len(SENTIMENT_LABELS)
+        counts = np.bincount(
+            token_ids * n_labels + label_ids[docs],
+            minlength=len(vocabulary) * n_labels,
+        ).reshape(len(vocabulary), n_labels)
+
+        smoothed = counts + alpha
+        log_likelihood = np.log(smoothed / smoothed.sum(axis=0))
+        label_counts = np.bincount(label_ids[known], minlength=n_labels) + 1
+        log_prior = np.log(label_counts / label_counts.sum())
+        return cls(vocabulary, log_likelihood, log_prior)
+
+    def predict_proba(self, headlines: pd.Series) -> np.ndarray:
+        """Label probabilities per headline, columns in SENTIMENT_LABELS order."""
+        n_docs = len(headlines)
+        docs, codes, tokens = tokenize_headlines(headlines)
+        token_ids = self.vocabulary.get_indexer(tokens)[codes]
+        in_vocabulary = token_ids >= 0
+        docs, token_ids = docs[in_vocabulary], token_ids[in_vocabulary]
+
+        scores = np.tile(self.log_prior, (n_docs, 1))
+        for label in range(len(SENTIMENT_LABELS)):
+            scores[:, label] += np.bincount(
+                docs, weights=self.log_likelihood[token_ids, label], minlength=n_docs
+            )
+
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        return probabilities / probabilities.sum(axis=1, keepdims=True)
+
+    def score(self, headlines: pd.Series) -> pd.DataFrame:
+        """Label and sentiment (P(positive) - P(negative), -1..1) per headline."""
+        probabilities = self.predict_proba(headlines)
+        return pd.DataFrame(
+            {
+                "label": np.array(SENTIMENT_LABELS)[probabilities.argmax(axis=1)],
+                "sentiment": probabilities[:, 2] - probabilities[:, 0],
+            },
+            index=headlines.index,
+        )
@@ -0,0 +1,165 @@
+"""Query planner that maps analysis intents to the minimal set of agents.
+
+Narrow questions ("What's Apple's earnings sentiment?") only need one data
+agent, while "Run a complete volatility analysis" needs the whole pipeline.
+The plan is stored in session state under ANALYSIS_PLAN_KEY and read by the
+workflow agent in sub_agents/dag_workflow_agent.py.
+"""
+
+import re
+from typing import Any
+
+from .intent_router import normalize_message
+
+# Session state keys written by the planner
+ANALYSIS_PLAN_KEY = "analysis_plan"
+REQUESTED_SYMBOLS_KEY = "requested_symbols"
+
+# Pipeline agents in execution order
+TECHNICAL_AGENT = "technical_agent"
+EVENT_CALENDAR_AGENT = "event_calendar_agent"
+SPEECH_SIGNAL_AGENT = "speech_signal_agent"
+SYNTHESIS_AGENT = "volatility_synthesis_agent"
+ALERT_AGENT = "alert_agent"
+PERSISTENCE_AGENT = "persistence_agent"
+
+DATA_AGENTS = [TECHNICAL_AGENT, EVENT_CALENDAR_AGENT, SPEECH_SIGNAL_AGENT]
+ALL_AGENTS = [*DATA_AGENTS, SYNTHESIS_AGENT, ALERT_AGENT, PERSISTENCE_AGENT]
+
+# Agents needed to answer each narrow intent
+INTENT_AGENTS: dict[str, list[str]] = {
+    "technical": [TECHNICAL_AGENT],
+    "events": [EVENT_CALENDAR_AGENT],
+    "earnings": [SPEECH_SIGNAL_AGENT],
+    "alerts": [TECHNICAL_AGENT, ALERT_AGENT],
+    "forecast": [*DATA_AGENTS, SYNTHESIS_AGENT],
+    "full": ALL_AGENTS,
+}
+
+# Company names and tickers covered by the speech_signals table
+COMPANY_TICKERS: dict[str, str] = {
+    "apple": "AAPL",
+    "aapl": "AAPL",
+    "amd": "AMD",
+    "amazon": "AMZN",
+    "amzn": "AMZN",
+    "asml": "ASML",
+    "cisco": "CSCO",
+    "csco": "CSCO",
+    "google": "GOOGL",
+    "alphabet": "GOOGL",
+    "googl": "GOOGL",
+    "intel": "INTC",
+    "intc": "INTC",
+    "microsoft": "MSFT",
+    "msft": "MSFT",
+    "micron": "MU",
+    "mu": "MU",
+    "nvidia": "NVDA",
+    "nvda": "NVDA",
+}
+
+SUPPORTED_SYMBOLS = sorted(set(COMPANY_TICKERS.values()))
+DEFAULT_SYMBOLS = ",".join(SUPPORTED_SYMBOLS)
+
+_FULL_PATTERNS = (
+    re.compile(r"\b(complete|full|comprehensive|overall|entire|everything)\b"),
+    re.compile(r"\brun (an? )?(volatility )?analysis\b"),
+)
+
+_INTENT_KEYWORDS: dict[str, frozenset[str]] = {
+    "technical": frozenset(
+        {
+            "vix",
+            "regime",
+            "anomaly",
+            "anomalies",
+            "zscore",
+            "z-score",
+            "historical",
+            "realized",
+        }
+    ),
+    "events": frozenset(
+        {
+            "fed",
+            "fomc",
+            "minutes",
+            "m&a",
+            "merger",
+            "mergers",
+            "acquisition",
+            "acquisitions",
+            "analyst",
+            "analysts",
+            "rating",
+            "ratings",
+            "upgrade",
+            "downgrade",
+            "event",
+            "events",
+        }
+    ),
+    "earnings": frozenset(
+        {
+            "earnings",
+            "sentiment",
+            "guidance",
+            "transcript",
+            "transcripts",
+            "tone",
+        }
+    ),
+    "alerts": frozenset({"alert", "alerts", "threshold", "thresholds"}),
+    "forecast": frozenset(
+        {"forecast", "forecasts", "predict", "prediction", "outlook"}
+    ),
+}
+
+_TOKEN = re.compile(r"[a-z0-9&\-]+")
+
+
+def extract_symbols(text: str) -> list[str]:
+    """Extract supported ticker symbols from company names or tickers."""
+    symbols: list[str] = []
+    for token in _TOKEN.findall(normalize_message(text)):
+        symbol = COMPANY_TICKERS.get(token)
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+def plan_query(text: str) -> dict[str, Any]:
+    """Build the minimal analysis plan for a user query.
+
+    Multiple narrow intents are merged ("VIX and Apple earnings" runs both the
+    technical and speech agents). Queries asking for a complete analysis, or
+    matching no narrow intent, get the full pipeline.
+
+    Args:
+        text: Raw user message.
+
+    Returns:
+        Plan dict with intents, agents (in execution order) and symbols.
+    """
+    message = normalize_message(text)
+    symbols = extract_symbols(message)
+
+    tokens = set(_TOKEN.findall(message))
+    intents = [
+        intent for intent, keywords in _INTENT_KEYWORDS.items() if tokens & keywords
+    ]
+    # A company name on its own is an earnings question
+    if symbols and not intents:
+        intents = ["earnings"]
+
+    if not intents or any(p.search(message) for p in _FULL_PATTERNS):
+        intents = ["full"]
+
+    needed = {agent for intent in intents for agent in INTENT_AGENTS[intent]}
+
+    return {
+        "intents": intents,
+        "agents": [agent for agent in ALL_AGENTS if agent in needed],
+        "symbols": ",".join(symbols) if symbols else DEFAULT_SYMBOLS,
+    }
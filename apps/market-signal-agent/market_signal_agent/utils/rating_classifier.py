@@ -0,0 +1,52 @@
+"""Vectorized classification of analyst rating headlines.
+
+analyst_ratings titles follow a few fixed phrasings ("Morgan Stanley Upgrades
+Apple to Overweight", "... Maintains Buy on X, Lowers Price Target to $90"),
+so each action is one case-insensitive regex evaluated over the whole title
+column at once. Titles are converted to Arrow strings so the regexes run in
+Arrow's native engine instead of a Python loop per headline. A headline can
+match several actions (e.g. a downgrade that also cuts the price target).
+"""
+
+import pandas as pd
+
+# Action -> pattern over the headline
+RATING_ACTIONS = {
+    "upgrades": r"\bupgrade",
+    "downgrades": r"\bdowngrade",
+    "initiations": r"\binitiat|\bassume[sd]? coverage",
+    "reiterations": r"\bmaintain|\breiterat|\breaffirm",
+    "target_raises": r"\b(?:raise[sd]?|boost(?:s|ed)?|increase[sd]?)\b[^,;]*price target",
+    "target_cuts": r"\b(?:lower(?:s|ed)?|cut(?:s)?|reduce[sd]?|trim(?:s|med)?)\b[^,;]*price target",
+}
+
+# Weight of a price target change relative to a rating change in the momentum score
+TARGET_WEIGHT = 0.5
+
+
+def classify_titles(titles: pd.Series) -> pd.DataFrame:
+    """Flag the rating actions in each headline.
+
+    Args:
+        titles: Headline strings (missing values count as no action).
+
+    Returns:
+        Integer (0/1) columns, one per action in RATING_ACTIONS, aligned with titles.
+    """
+    titles = titles.astype("string[pyarrow]").fillna("")
+    return pd.DataFrame(
+        {
+            action: titles.str.contains(pattern, case=False, regex=True).astype("int64")
+            for action, pattern in RATING_ACTIONS.items()
+        },
+        index=titles.index,
+    )
+
+
+def momentum_score(actions: pd.DataFrame) -> pd.Series:
+    """Net rating direction: upgrades minus downgrades plus weighted target moves."""
+    return (
+        actions["upgrades"]
+        - actions["downgrades"]
+        + TARGET_WEIGHT * (actions["target_raises"] - actions["target_cuts"])
+    )
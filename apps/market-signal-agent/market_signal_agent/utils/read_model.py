@@ -0,0 +1,415 @@
+"""In-memory read model behind the dashboard's /api/volatility/* routes.
+
+The web dashboard's metrics, forecasts, anomalies, events and alerts routes
+(apps/web/lib/bigquery/volatility-queries.ts) each ran BigQuery on every
+page load. ReadModel runs the same queries once, keeps each view's JSON
+body and ETag in memory, and refreshes a view only when its source changes:
+
+- metrics, forecasts and alerts come from one market_30yr_v query, re-run
+  when MAX(date) of market_30yr_v moves;
+- anomalies are re-run when MAX(date) of index_data_v moves;
+- events (Fed communications, analyst ratings, M&A) are re-read every
+  config.event_calendar_refresh_seconds.
+
+A refresh check is one small watermark query, so BigQuery cost follows data
+updates rather than dashboard traffic. scripts/run_read_api.py serves the
+views over HTTP; response bodies match the Next.js routes, so the dashboard
+can read from it unchanged (READ_API_URL in apps/web).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from ..config import config
+from ..tools.bigquery_tools import execute_query
+from .forecast_rules import vix_regime
+from .scenarios import INDEX_MULTIPLIERS
+
+logger = logging.getLogger(__name__)
+
+VIEWS = ("metrics", "forecasts", "anomalies", "events", "alerts")
+
+# Dashboard forecast rules (getVolatilityForecasts in volatility-queries.ts)
+DASHBOARD_5D_PREMIUM = 1.1  # uncertainty premium on the 5-day forecast
+DASHBOARD_CONFIDENCE = {"low": 0.9, "normal": 0.85, "elevated": 0.75, "extreme": 0.6}
+DASHBOARD_CONFIDENCE_ADJUSTMENT = {"SPX": 0.0, "NDX": -0.03, "DJI": 0.02, "RUT": -0.05}
+
+# Rows per event list on the dashboard calendar
+EVENT_LIMIT = 10
+
+
+def _table(name: str) -> str:
+    return f"`{config.bq_dataset_full}.{name}`"
+
+
+def _row_dict(row: Any) -> dict[str, Any]:
+    return dict(row.items())
+
+
+def encode_view(payload: Any) -> tuple[bytes, str]:
+    """JSON body and strong ETag for a view payload."""
+    body = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+async def fetch_watermarks() -> dict[str, str | None]:
+    """Latest data dates of the sources behind the market and anomaly views."""
+    query = f"""
+    SELECT
+        (SELECT MAX(date) FROM {_table("market_30yr_v")}) AS market,
+        (SELECT MAX(date) FROM {_table("index_data_v")}) AS index_data
+    """
+    rows, _ = await execute_query(query)
+    row = rows[0]
+    return {
+        "market": str(row.market) if row.market else None,
+        "index_data": str(row.index_data) if row.index_data else None,
+    }
+
+
+async def fetch_market() -> dict[str, Any]:
+    """Latest VIX, day change, percentile and 20-day S&P 500 realized vol."""
+    table = _table("market_30yr_v")
+    query = f"""
+    WITH ranked AS (
+        SELECT
+            date,
+            vix,
+            LAG(vix) OVER (ORDER BY date) AS prev_vix,
+            PERCENT_RANK() OVER (ORDER BY vix) * 100 AS vix_percentile
+        FROM {table}
+        WHERE vix IS NOT NULL
+    ),
+    price_changes AS (
+        SELECT
+            (sp500 - LAG(sp500) OVER (ORDER BY date)) /
+                NULLIF(LAG(sp500) OVER (ORDER BY date), 0) AS daily_return
+        FROM (
+            SELECT date, sp500
+            FROM {table}
+            WHERE sp500 IS NOT NULL
+            ORDER BY date DESC
+            LIMIT 21
+        )
+    ),
+    historical_vol AS (
+        SELECT STDDEV(daily_return) * SQRT(252) * 100 AS vol_20d
+        FROM price_changes
+        WHERE daily_return IS NOT NULL
+    )
+    SELECT
+        FORMAT_DATE('%Y-%m-%d', r.date) AS data_date,
+        r.vix AS current_vix,
+        ROUND(r.vix - COALESCE(r.prev_vix, r.vix), 2) AS vix_change,
+        ROUND(r.vix_percentile, 1) AS vix_percentile,
+        h.vol_20d AS historical_vol_20d
+    FROM ranked r
+    CROSS JOIN historical_vol h
+    ORDER BY r.date DESC
+    LIMIT 1
+    """
+    rows, _ = await execute_query(query)
+    return _row_dict(rows[0])
+
+
+async def fetch_anomalies() -> list[dict[str, Any]]:
+    """Latest close and volume z-scores per index against the last 90 days."""
+    table = _table("index_data_v")
+    threshold = config.zscore_threshold
+    query = f"""
+    WITH stats AS (
+        SELECT
+            symbol,
+            AVG(close) AS avg_price,
+            STDDEV(close) AS std_price,
+            AVG(volume) AS avg_volume,
+            STDDEV(volume) AS std_volume
+        FROM {table}
+        WHERE date >= DATE_SUB((SELECT MAX(date) FROM {table}), INTERVAL 90 DAY)
+            AND close IS NOT NULL
+        GROUP BY symbol
+    ),
+    latest AS (
+        SELECT symbol, date, close, volume
+        FROM {table}
+        WHERE date = (SELECT MAX(date) FROM {table})
+            AND close IS NOT NULL
+    ),
+    scored AS (
+        SELECT
+            l.symbol,
+            l.date,
+            l.close,
+            (l.close - s.avg_price) / NULLIF(s.std_price, 0) AS price_z,
+            (l.volume - s.avg_volume) / NULLIF(s.std_volume, 0) AS volume_z
+        FROM latest l
+        JOIN stats s ON l.symbol = s.symbol
+    )
+    SELECT
+        symbol,
+        FORMAT_DATE('%Y-%m-%d', date) AS date,
+        ROUND(close, 2) AS close_price,
+        ROUND(price_z, 2) AS price_zscore,
+        ROUND(volume_z, 2) AS volume_zscore,
+        IF(ABS(price_z) > {threshold}, 'ANOMALY', 'NORMAL') AS price_status,
+        IF(ABS(volume_z) > {threshold}, 'ANOMALY', 'NORMAL') AS volume_status
+    FROM scored
+    ORDER BY ABS(price_z) DESC
+    """
+    rows, _ = await execute_query(query)
+    return [_row_dict(row) for row in rows]
+
+
+async def _safe_rows(query: str, name: str) -> list[dict[str, Any]]:
+    """Rows of an optional table; an empty list if the query fails."""
+    try:
+        rows, _ = await execute_query(query)
+    except Exception:
+        logger.exception("Failed to fetch %s", name)
+        return []
+    return [_row_dict(row) for row in rows]
+
+
+async def fetch_events() -> dict[str, list[dict[str, Any]]]:
+    """Recent Fed communications, analyst ratings and M&A deals."""
+    fed_query = f"""
+    SELECT
+        FORMAT_DATE('%Y-%m-%d', date) AS date,
+        FORMAT_DATE('%Y-%m-%d', release_date) AS release_date,
+        type,
+        SUBSTR(text, 1, 200) AS summary
+    FROM {_table("fed_communications_v")}
+    WHERE type IN ('Minutes', 'Statement', 'Minute')
+    ORDER BY date DESC
+    LIMIT {EVENT_LIMIT}
+    """
+    # The CSV import mixes up title and date columns; the date starts with YYYY-
+    ratings_query = f"""
+    WITH ratings AS (
+        SELECT
+            CASE
+                WHEN REGEXP_CONTAINS(string_field_2, r'^\\d{{4}}-') THEN string_field_2
+                WHEN REGEXP_CONTAINS(string_field_1, r'^\\d{{4}}-') THEN string_field_1
+                ELSE string_field_2
+            END AS date,
+            CASE
+                WHEN REGEXP_CONTAINS(string_field_1, r'^\\d{{4}}-') THEN string_field_2
+                ELSE string_field_1
+            END AS title,
+            string_field_3 AS stock
+        FROM {_table("analyst_ratings")}
+        WHERE string_field_1 IS NOT NULL OR string_field_2 IS NOT NULL
+    )
+    SELECT date, title, stock
+    FROM ratings
+    ORDER BY date DESC
+    LIMIT {EVENT_LIMIT}
+    """
+    mna_query = f"""
+    SELECT
+        SAFE_CAST(`Acquisition Year` AS INT64) AS year,
+        `Acquisition Month` AS month,
+        `Parent Company` AS parent_company,
+        `Acquired Company` AS acquired_company,
+        SAFE_CAST(REGEXP_REPLACE(`Acquisition Price`, r'[^0-9.]', '') AS FLOAT64)
+            AS price,
+        `Category` AS category
+    FROM {_table("acquisitions")}
+    WHERE `Acquisition Year` IS NOT NULL
+    ORDER BY `Acquisition Year` DESC, `Acquisition Month` DESC
+    LIMIT {EVENT_LIMIT}
+    """
+    fed, ratings, mna = await asyncio.gather(
+        _safe_rows(fed_query, "fed_meetings"),
+        _safe_rows(ratings_query, "analyst_ratings"),
+        _safe_rows(mna_query, "mna_events"),
+    )
+    return {"fed_meetings": fed, "analyst_ratings": ratings, "mna_events": mna}
+
+
+def market_views(market: dict[str, Any]) -> dict[str, Any]:
+    """Metrics and forecasts payloads from the latest market row."""
+    vix = float(market["current_vix"])
+    vol_20d = float(market["historical_vol_20d"] or 0.0)
+    regime = vix_regime(vix)
+
+    metrics = {
+        "data_date": market["data_date"],
+        "current_vix": vix,
+        "vix_change": market["vix_change"],
+        "vix_percentile": market["vix_percentile"],
+        "regime": regime,
+        "historical_vol_20d": round(vol_20d, 2),
+    }
+    forecasts = [
+        {
+            "symbol": symbol,
+            "volatility_1d": round(vix * multiplier, 1),
+            "volatility_5d": round(vol_20d * multiplier * DASHBOARD_5D_PREMIUM, 1),
+            "confidence": round(
+                DASHBOARD_CONFIDENCE[regime] + DASHBOARD_CONFIDENCE_ADJUSTMENT[symbol],
+                2,
+            ),
+        }
+        for symbol, multiplier in INDEX_MULTIPLIERS.items()
+    ]
+    return {
+        "metrics": metrics,
+        "forecasts": {
+            "forecasts": forecasts,
+            "current_vix": vix,
+            "regime": regime,
+            "data_date": market["data_date"],
+        },
+    }
+
+
+def dashboard_alerts(
+    metrics: dict[str, Any] | None,
+    anomalies: list[dict[str, Any]],
+    triggered_at: datetime,
+) -> dict[str, Any]:
+    """Alerts payload: the VIX band alert plus one alert per anomalous z-score."""
+    now = triggered_at.isoformat()
+    stamp = int(triggered_at.timestamp() * 1000)
+    alerts = []
+
+    vix = metrics["current_vix"] if metrics else None
+    bands = (
+        (config.vix_high, "vix_extreme", "critical", "EXTREME"),
+        (config.vix_elevated, "vix_high", "warning", "HIGH"),
+        (config.vix_normal, "vix_elevated", "info", "ELEVATED"),
+    )
+    for threshold, alert_type, severity, label in bands:
+        if vix is not None and vix > threshold:
+            alerts.append(
+                {
+                    "id": f"vix-{severity}-{stamp}",
+                    "alert_type": alert_type,
+                    "severity": severity,
+                    "symbol": None,
+                    "message": f"{label} volatility - VIX at {vix:.1f}, "
+                    f"above {threshold:g}",
+                    "vix_value": vix,
+                    "triggered_at": now,
+                }
+            )
+            break
+
+    for anomaly in anomalies:
+        for kind in ("price", "volume"):
+            if anomaly[f"{kind}_status"] != "ANOMALY":
+                continue
+            zscore = anomaly[f"{kind}_zscore"]
+            direction = "above" if zscore > 0 else "below"
+            alerts.append(
+                {
+                    "id": f"anomaly-{kind}-{anomaly['symbol']}-{stamp}",
+                    "alert_type": f"{kind}_anomaly",
+                    "severity": "info",
+                    "symbol": anomaly["symbol"],
+                    "message": f"{anomaly['symbol']} {kind} anomaly: "
+                    f"{abs(zscore):.1f}σ {direction} average",
+                    "vix_value": None,
+                    "triggered_at": now,
+                }
+            )
+
+    return {
+        "alerts": alerts,
+        "has_critical": any(a["severity"] == "critical" for a in alerts),
+        "has_warning": any(a["severity"] == "warning" for a in alerts),
+    }
+
+
+class ReadModel:
+    """Latest dashboard views, encoded once and served from memory."""
+
+    def __init__(self) -> None:
+        self.views: dict[str, tuple[bytes, str]] = {}
+        self.watermarks: dict[str, str | None] = {}
+        self.refreshed_at: dict[str, str] = {}
+        self._payloads: dict[str, Any] = {}
+        self._events_loaded = 0.0
+
+    def get(self, view: str) -> tuple[bytes, str] | None:
+        """Encoded body and ETag of a view, or None before its first load."""
+        return self.views.get(view)
+
+    def status(self) -> dict[str, Any]:
+        """Watermarks and refresh time of each view."""
+        return {
+            "views": {view: self.refreshed_at.get(view) for view in VIEWS},
+            "watermarks": self.watermarks,
+        }
+
+    def _publish(self, view: str, payload: Any, now: datetime) -> bool:
+        """Store a view payload; False if its body is unchanged."""
+        self._payloads[view] = payload
+        encoded = encode_view(payload)
+        current = self.views.get(view)
+        if current is not None and current[1] == encoded[1]:
+            return False
+        self.views[view] = encoded
+        self.refreshed_at[view] = now.isoformat()
+        return True
+
+    async def refresh(self, force: bool = False) -> list[str]:
+        """Re-query the views whose sources changed.
+
+        Args:
+            force: Re-query every view regardless of watermarks.
+
+        Returns:
+            Names of the views whose content changed.
+        """
+        now = datetime.now(timezone.utc)
+        watermarks = await fetch_watermarks()
+        market_due = force or watermarks["market"] != self.watermarks.get("market")
+        anomalies_due = force or (
+            watermarks["index_data"] != self.watermarks.get("index_data")
+        )
+        events_due = force or (
+            time.monotonic() - self._events_loaded
+            >= config.event_calendar_refresh_seconds
+            or "events" not in self.views
+        )
+
+        tasks: dict[str, Any] = {}
+        if market_due:
+            tasks["market"] = fetch_market()
+        if anomalies_due:
+            tasks["anomalies"] = fetch_anomalies()
+        if events_due:
+            tasks["events"] = fetch_events()
+        results = dict(zip(tasks, await asyncio.gather(*tasks.values()), strict=True))
+
+        payloads: dict[str, Any] = {}
+        if "market" in results:
+            payloads.update(market_views(results["market"]))
+        if "anomalies" in results:
+            payloads["anomalies"] = {"anomalies": results["anomalies"]}
+        if "events" in results:
+            payloads["events"] = results["events"]
+            self._events_loaded = time.monotonic()
+        changed = [
+            view
+            for view, payload in payloads.items()
+            if self._publish(view, payload, now)
+        ]
+        if {"metrics", "anomalies"} & set(changed):
+            alerts = dashboard_alerts(
+                self._payloads.get("metrics"),
+                self._payloads.get("anomalies", {}).get("anomalies", []),
+                now,
+            )
+            if self._publish("alerts", alerts, now):
+                changed.append("alerts")
+
+        self.watermarks = watermarks
+        return changed
@@ -0,0 +1,189 @@
+"""Vectorized what-if grid over the forecast and VIX alert rules.
+
+A scenario is a VIX level, a 20-day realized volatility and a set of upcoming
+events. The grid is the cross product of the requested values; every
+scenario is evaluated for every index with the same rules as
+calculate_volatility_forecast (mean reversion, event adjustment, regime
+confidence) and check_vix_threshold (alert bands), as numpy array
+operations. Event adjustments are looked up once per distinct event set, so
+thousands of scenarios cost one pass.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+
+from ..config import config
+from .event_impact import HEURISTIC_EVENT_MULTIPLIERS, event_adjustment
+from .forecast_rules import (
+    CONFIDENCE_BY_REGIME,
+    DIVERGENCE_LIMIT,
+    DIVERGENCE_PENALTY,
+    MEAN_REVERSION_1D,
+    MEAN_REVERSION_5D,
+    VIX_LONG_TERM_AVG,
+)
+
+# Index volatility relative to the VIX-based forecast (synthesis agent table)
+INDEX_MULTIPLIERS = {
+    "SPX": 1.0,  # baseline
+    "NDX": 1.15,  # tech premium
+    "DJI": 0.95,  # blue chip discount
+    "RUT": 1.35,  # small cap premium
+}
+
+# Event-set names meaning "no event" and "an event of unknown type"
+NO_EVENT = "none"
+UNKNOWN_EVENT = "event"
+
+# Upper bound on the grid size
+MAX_SCENARIOS = 100_000
+
+REGIMES = np.array(["low", "normal", "elevated", "extreme"])
+
+
+def parse_values(spec: str) -> list[float]:
+    """Parse "20,25,30" or a "start:stop:step" range (stop inclusive).
+
+    Raises:
+        ValueError: On malformed input, or more than MAX_SCENARIOS values
+            (checked before any range is expanded).
+    """
+    values: list[float] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if ":" in part:
+            bounds = part.split(":")
+            if len(bounds) != 3:
+                raise ValueError(f"Range must be start:stop:step: '{part}'")
+            start, stop, step = (float(x) for x in bounds)
+            if not all(math.isfinite(x) for x in (start, stop, step)):
+                raise ValueError(f"Range bounds must be finite: '{part}'")
+            if step <= 0:
+                raise ValueError(f"Range step must be positive: '{part}'")
+            # Length of the arange below, without building it
+            count = max(math.ceil((stop + step / 2 - start) / step), 0)
+            if len(values) + count > MAX_SCENARIOS:
+                raise ValueError(f"More than {MAX_SCENARIOS:,} values: '{part}'")
+            values.extend(np.arange(start, stop + step / 2, step).round(6).tolist())
+        else:
+            values.append(float(part))
+    return values
+
+
+def parse_event_sets(spec: str) -> list[list[str] | None]:
+    """Parse ";"-separated event sets, e.g. "none;fed_statement;fed_minute,mna_mega".
+
+    Returns:
+        None for no event, [] for an event of unknown type, else the types.
+    """
+    sets: list[list[str] | None] = []
+    for part in spec.split(";"):
+        names = [name.strip().lower() for name in part.split(",") if name.strip()]
+        if not names or names == [NO_EVENT]:
+            sets.append(None)
+        elif names == [UNKNOWN_EVENT]:
+            sets.append([])
+        else:
+            sets.append(names)
+    return sets
+
+
+def _event_effects(
+    event_sets: list[list[str] | None],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str]]:
+    """Additive VIX points and multipliers (1d, 5d) per event set."""
+    points_1d = np.zeros(len(event_sets))
+    points_5d = np.zeros(len(event_sets))
+    mult_1d = np.ones(len(event_sets))
+    mult_5d = np.ones(len(event_sets))
+    labels = []
+    for k, events in enumerate(event_sets):
+        if events is None:
+            labels.append(NO_EVENT)
+            continue
+        labels.append(",".join(events) or UNKNOWN_EVENT)
+        adjustment = event_adjustment(events)
+        if adjustment is not None:
+            points_1d[k] = adjustment["vix_points_1d"]
+            points_5d[k] = adjustment["vix_points_5d"]
+        else:
+            mult_1d[k], mult_5d[k] = HEURISTIC_EVENT_MULTIPLIERS
+    return points_1d, points_5d, mult_1d, mult_5d, labels
+
+
+def vix_alert_bands(vix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Alert type and severity per VIX level, as in check_vix_threshold."""
+    conditions = [
+        vix > config.vix_high,
+        vix > config.vix_elevated,
+        vix > config.vix_normal,
+    ]
+    alert_type = np.select(conditions, ["vix_extreme", "vix_high", "vix_elevated"], "")
+    severity = np.select(conditions, ["critical", "warning", "info"], "")
+    return alert_type, severity
+
+
+def evaluate_grid(
+    vix_levels: list[float],
+    realized_vols: list[float],
+    event_sets: list[list[str] | None],
+    indices: list[str],
+) -> dict[str, Any]:
+    """Evaluate the cross product of scenarios for each index.
+
+    Returns:
+        Column arrays: scenario inputs (vix, realized_vol, events), regime,
+        confidence, alert type and severity, and {index}_1d / {index}_5d
+        forecasts.
+    """
+    vix, realized, event_ids = (
+        grid.ravel()
+        for grid in np.meshgrid(
+            np.asarray(vix_levels, dtype=float),
+            np.asarray(realized_vols, dtype=float),
+            np.arange(len(event_sets)),
+            indexing="ij",
+        )
+    )
+    points_1d, points_5d, mult_1d, mult_5d, labels = _event_effects(event_sets)
+
+    base_1d = vix * (1 - MEAN_REVERSION_1D) + VIX_LONG_TERM_AVG * MEAN_REVERSION_1D
+    base_5d = vix * (1 - MEAN_REVERSION_5D) + VIX_LONG_TERM_AVG * MEAN_REVERSION_5D
+    volatility_1d = (base_1d + points_1d[event_ids]) * mult_1d[event_ids]
+    volatility_5d = (base_5d + points_5d[event_ids]) * mult_5d[event_ids]
+
+    bands = [config.vix_low, config.vix_normal, config.vix_high]
+    regime_ids = np.searchsorted(bands, vix, side="right")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        divergent = (vix > 0) & (np.abs(vix - realized) / vix > DIVERGENCE_LIMIT)
+
+    # Confidence takes one of 2 values per regime; rounded like the scalar tool
+    base_confidence = [CONFIDENCE_BY_REGIME[name] for name in REGIMES]
+    confidence_table = np.array(
+        [
+            [round(value, 2) for value in base_confidence],
+            [round(value * DIVERGENCE_PENALTY, 2) for value in base_confidence],
+        ]
+    )
+    confidence = confidence_table[divergent.astype(int), regime_ids]
+
+    alert_type, severity = vix_alert_bands(vix)
+
+    columns: dict[str, Any] = {
+        "vix": vix,
+        "realized_vol": realized,
+        "events": np.array(labels, dtype=object)[event_ids],
+        "regime": REGIMES[regime_ids],
+        "confidence": confidence,
+        "alert": alert_type,
+        "severity": severity,
+    }
+    for index in indices:
+        multiplier = INDEX_MULTIPLIERS[index]
+        columns[f"{index}_1d"] = np.round(volatility_1d * multiplier, 2)
+        columns[f"{index}_5d"] = np.round(volatility_5d * multiplier, 2)
+    return columns
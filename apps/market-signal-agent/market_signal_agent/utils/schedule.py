@@ -0,0 +1,77 @@
+"""Minimal cron expressions for the precompute scheduler.
+
+Supports the standard five fields (minute hour day-of-month month
+day-of-week) with "*", lists ("1,15"), ranges ("9-17") and steps ("*/15",
+"9-17/2"). Day of week is 0-6 with 0 = Sunday (7 is also Sunday). As in
+cron, when both day fields are restricted a day matching either one runs.
+"""
+
+from datetime import datetime, timedelta
+
+# (low, high) bounds of each field
+_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# Search horizon for the next run (covers e.g. "0 0 29 2 *")
+_MAX_LOOKAHEAD = timedelta(days=366 * 5)
+
+
+def _parse_field(field: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        spec, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in '{part}'")
+        if spec == "*":
+            start, end = low, high
+        elif "-" in spec:
+            start, end = (int(x) for x in spec.split("-", 1))
+        else:
+            start = int(spec)
+            end = high if step_text else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"'{part}' is outside {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """Parsed cron expression."""
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: '{expression}'")
+        self.expression = expression
+        parsed = [
+            _parse_field(f, *bounds) for f, bounds in zip(fields, _FIELDS, strict=True)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = frozenset(d % 7 for d in weekdays)
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    def _day_matches(self, when: datetime) -> bool:
+        weekday = (when.weekday() + 1) % 7  # cron: 0 = Sunday
+        if self.any_day and self.any_weekday:
+            return True
+        if self.any_day:
+            return weekday in self.weekdays
+        if self.any_weekday:
+            return when.day in self.days
+        return when.day in self.days or weekday in self.weekdays
+
+    def next_run(self, after: datetime) -> datetime:
+        """First matching minute strictly after the given time."""
+        when = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after + _MAX_LOOKAHEAD
+        while when <= limit:
+            if when.month not in self.months or not self._day_matches(when):
+                when = (when + timedelta(days=1)).replace(hour=0, minute=0)
+            elif when.hour not in self.hours:
+                when = (when + timedelta(hours=1)).replace(minute=0)
+            elif when.minute not in self.minutes:
+                when += timedelta(minutes=1)
+            else:
+                return when
+        raise ValueError(f"Cron expression never runs: '{self.expression}'")
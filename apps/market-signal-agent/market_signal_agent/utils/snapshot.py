@@ -0,0 +1,171 @@
+"""Precomputed analysis snapshot served for standard questions.
+
+scripts/run_precompute.py runs the full analysis on a schedule and writes
+the final answer and the pipeline's session state (technical_signals,
+event_calendar, speech_signals, volatility_forecasts, alerts) to
+config.snapshot_path. The ADK server keeps the latest snapshot in memory,
+reloading it only when the file changes, and route_intent_callback answers
+standard questions from it while it is younger than
+config.snapshot_max_age_seconds, so those turns cost a dictionary lookup
+instead of the pipeline.
+
+Only questions in the standard phrasing (config.precompute_query, a request
+for a complete analysis, or "what is the current VIX / forecast / ...") are
+served. Questions with dates, numbers or other specifics, questions about
+specific companies, and turns where the session sets SNAPSHOT_BYPASS_KEY (the
+precompute run itself) always run the pipeline.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timezone
+from typing import Any
+
+from ..config import config
+from .intent_router import normalize_message
+from .query_planner import DEFAULT_SYMBOLS
+
+# Session state flag that disables snapshot answers (set by the precompute run)
+SNAPSHOT_BYPASS_KEY = "snapshot_bypass"
+
+# Pipeline output keys stored in the snapshot
+SNAPSHOT_STATE_KEYS = (
+    "technical_signals",
+    "event_calendar",
+    "speech_signals",
+    "volatility_forecasts",
+    "alerts",
+)
+
+# Snapshot section answering each narrow planner intent
+INTENT_SECTIONS = {
+    "technical": "technical_signals",
+    "events": "event_calendar",
+    "earnings": "speech_signals",
+    "alerts": "alerts",
+    "forecast": "volatility_forecasts",
+}
+
+# Standard phrasings answered from the snapshot (matched against the whole
+# normalized question)
+_STANDARD_QUESTIONS = (
+    re.compile(
+        r"(please )?(run|give me|show me|provide|do) (an? |the )?"
+        r"(complete|full|comprehensive|overall) (volatility |market )?analysis"
+    ),
+    re.compile(
+        r"((what|how) (is|are) |what's |show me |give me )?(the )?"
+        r"(current |latest |today's )?(market )?"
+        r"(vix( level)?|volatility( regime| forecast| outlook)?|forecast|outlook"
+        r"|(active )?alerts|(upcoming )?events)"
+    ),
+)
+
+# Dates, thresholds and other numbers make a question non-standard
+_DIGITS = re.compile(r"\d")
+
+_cache: dict[str, Any] = {"mtime": None, "snapshot": None}
+
+
+def _canonical(text: str) -> str:
+    return " ".join(normalize_message(text).rstrip("?!. ").split())
+
+
+def is_standard_question(text: str) -> bool:
+    """Whether a question is phrased as one of the precomputed questions."""
+    question = _canonical(text)
+    if _DIGITS.search(question):
+        return False
+    if question == _canonical(config.precompute_query):
+        return True
+    return any(pattern.fullmatch(question) for pattern in _STANDARD_QUESTIONS)
+
+
+def write_snapshot(
+    response: str, state: dict[str, Any], created_at: datetime | None = None
+) -> dict[str, Any]:
+    """Atomically write a snapshot file and return its contents."""
+    snapshot = {
+        "created_at": (created_at or datetime.now(timezone.utc)).isoformat(),
+        "response": response,
+        "state": {key: state.get(key) for key in SNAPSHOT_STATE_KEYS},
+    }
+    path = config.resolve_path(config.snapshot_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(snapshot, default=str), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return snapshot
+
+
+def load_snapshot() -> dict[str, Any] | None:
+    """Latest snapshot, re-read only when the file's mtime changes."""
+    path = config.resolve_path(config.snapshot_path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if mtime != _cache["mtime"]:
+        try:
+            _cache["snapshot"] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return _cache["snapshot"]
+        _cache["mtime"] = mtime
+    return _cache["snapshot"]
+
+
+def snapshot_age_seconds(
+    snapshot: dict[str, Any], now: datetime | None = None
+) -> float:
+    """Seconds since the snapshot was computed."""
+    created_at = datetime.fromisoformat(snapshot["created_at"])
+    return ((now or datetime.now(timezone.utc)) - created_at).total_seconds()
+
+
+def _section_text(value: Any) -> str | None:
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, dict) and value.get("status") != "pending":
+        return json.dumps(value, default=str)
+    return None
+
+
+def snapshot_answer(
+    text: str, plan: dict[str, Any]
+) -> tuple[str, dict[str, Any]] | None:
+    """Answer for a standard question from a fresh snapshot.
+
+    Args:
+        text: Raw user message.
+        plan: Plan from utils.query_planner.plan_query.
+
+    Returns:
+        The answer text and the snapshot state to merge into the session, or
+        None when the query must run the pipeline.
+    """
+    if config.snapshot_max_age_seconds <= 0 or plan["symbols"] != DEFAULT_SYMBOLS:
+        return None
+    if not is_standard_question(text):
+        return None
+    snapshot = load_snapshot()
+    if snapshot is None:
+        return None
+    age = snapshot_age_seconds(snapshot)
+    if age > config.snapshot_max_age_seconds:
+        return None
+
+    state = snapshot["state"]
+    if "full" in plan["intents"]:
+        sections = [snapshot["response"]]
+    else:
+        sections = [
+            _section_text(state.get(INTENT_SECTIONS[intent]))
+            for intent in plan["intents"]
+        ]
+    if not all(sections):
+        return None
+
+    minutes = int(age // 60)
+    note = f"_Precomputed analysis from {minutes} min ago ({snapshot['created_at']})._"
+    return "\n\n".join([*sections, note]), state
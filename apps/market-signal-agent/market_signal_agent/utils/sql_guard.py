@@ -0,0 +1,103 @@
+"""Guards for agent-written BigQuery SQL.
+
+Agents phrase their own SQL through the BigQuery toolset, so a single
+`SELECT *` can pull wide text columns (raw earnings transcripts, full Fed
+statements) into the model context. These checks run before execute_sql:
+- transcript stores are never queryable by agents
+- the raw speech_signals table must be read through the narrow speech_signals_v
+- raw tables with a precomputed aggregate must be read through the aggregate
+- `SELECT *` is rejected on tables with wide text columns
+
+Results are additionally bounded after execution by truncating long cells
+(see truncate_rows), which holds no matter how the SQL is written.
+"""
+
+import re
+from typing import Any
+
+# Raw transcript stores; only the ingestion scripts read these
+TRANSCRIPT_TABLES = ("speech_transcripts", "earnings_transcripts_raw")
+
+# Columns holding full documents
+WIDE_TEXT_COLUMNS = ("transcript",)
+
+# Tables with wide text columns, where SELECT * is rejected
+WIDE_TEXT_TABLES = ("fed_communications", "fed_communications_v")
+
+# Raw tables -> precomputed aggregate agents read instead
+AGGREGATED_TABLES = {"analyst_ratings": "analyst_rating_daily"}
+
+TRUNCATION_MARKER = "...[truncated]"
+
+_SELECT_STAR = re.compile(r"\bSELECT\s+(?:DISTINCT\s+)?(?:\w+\.)?\*", re.IGNORECASE)
+_RAW_SPEECH_TABLE = re.compile(r"\bspeech_signals\b(?!_v)", re.IGNORECASE)
+
+
+def _references(sql: str, name: str) -> bool:
+    """Check whether the SQL mentions an identifier as a whole word."""
+    return re.search(rf"\b{re.escape(name)}\b", sql, re.IGNORECASE) is not None
+
+
+def check_query(sql: str) -> str | None:
+    """Check agent SQL against the wide-column rules.
+
+    Args:
+        sql: Query text passed to execute_sql.
+
+    Returns:
+        Reason the query is rejected, or None if it may run.
+    """
+    for table in TRANSCRIPT_TABLES:
+        if _references(sql, table):
+            return f"{table} holds raw transcripts and cannot be queried by agents."
+
+    for column in WIDE_TEXT_COLUMNS:
+        if _references(sql, column):
+            return (
+                f"Column '{column}' holds full documents and cannot be selected. "
+                "Use speech_signals_v (tone, guidance, topics, risks) instead."
+            )
+
+    if _RAW_SPEECH_TABLE.search(sql):
+        return "Query speech_signals_v instead of the raw speech_signals table."
+
+    for table, aggregate in AGGREGATED_TABLES.items():
+        if _references(sql, table):
+            return (
+                f"Query the precomputed {aggregate} instead of the raw {table} table."
+            )
+
+    if _SELECT_STAR.search(sql):
+        for table in WIDE_TEXT_TABLES:
+            if _references(sql, table):
+                return (
+                    f"SELECT * is not allowed on {table}; list the columns you need "
+                    "and use SUBSTR() for long text."
+                )
+
+    return None
+
+
+def truncate_rows(
+    rows: list[dict[str, Any]], max_chars: int
+) -> tuple[list[dict[str, Any]], int]:
+    """Truncate long string values in query result rows.
+
+    Args:
+        rows: Result rows as returned by execute_sql.
+        max_chars: Maximum characters kept per string value.
+
+    Returns:
+        The bounded rows and the number of values that were truncated.
+    """
+    truncated = 0
+    bounded: list[dict[str, Any]] = []
+    for row in rows:
+        bounded_row = {}
+        for key, value in row.items():
+            if isinstance(value, str) and len(value) > max_chars:
+                value = value[:max_chars] + TRUNCATION_MARKER
+                truncated += 1
+            bounded_row[key] = value
+        bounded.append(bounded_row)
+    return bounded, truncated
@@ -0,0 +1,188 @@
+"""Vectorized volatility forecasts for a whole symbol universe.
+
+calculate_volatility_forecast forecasts one index at a time from VIX. This
+module forecasts every symbol in a long (symbol, date, close) price table in
+one pass: prices are sorted by symbol and date, log returns and squared
+returns are computed for all rows at once, and per-symbol realized
+volatilities come from segment sums (cumulative sums and np.bincount over
+symbol ids), so the cost is linear in the number of rows and independent of
+how many symbols there are.
+
+Each symbol's forecast applies the same rules as the index tool
+(utils/forecast_rules.py): the current (EWMA) volatility reverts towards the
+symbol's own one-year realized volatility instead of the long-run VIX
+average. Large universes can be split into symbol chunks evaluated on
+several processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .forecast_rules import (
+    CONFIDENCE_BY_REGIME,
+    DIVERGENCE_LIMIT,
+    DIVERGENCE_PENALTY,
+    MEAN_REVERSION_1D,
+    MEAN_REVERSION_5D,
+    vix_regime,
+)
+
+TRADING_DAYS = 252
+
+# Realized volatility windows in trading days
+SHORT_WINDOW = 5
+MEDIUM_WINDOW = 20
+LONG_WINDOW = TRADING_DAYS
+
+# RiskMetrics decay for the current (EWMA) volatility
+EWMA_LAMBDA = 0.94
+EWMA_DAYS = 100
+
+# Minimum returns per symbol for a forecast
+MIN_RETURNS = 20
+
+# Below this many rows a single process is faster than a pool
+PARALLEL_MIN_ROWS = 1_000_000
+
+
+def realized_vol_features(prices: pd.DataFrame) -> pd.DataFrame:
+    """Annualized realized volatilities (percent) at each symbol's latest date.
+
+    Args:
+        prices: Long table with symbol, date and close columns.
+
+    Returns:
+        One row per symbol with the latest date, return count and hv_5d,
+        hv_20d, hv_252d and ewma_vol.
+    """
+    close = prices["close"].to_numpy(dtype=float)
+    valid = close > 0  # also drops NaN
+    symbol_ids, symbols = pd.factorize(prices["symbol"].to_numpy()[valid], sort=True)
+    dates = pd.to_datetime(prices["date"].to_numpy()[valid]).to_numpy("datetime64[D]")
+
+    # Integer sort keys: rows grouped by symbol, in date order within each
+    order = np.lexsort((dates, symbol_ids))
+    symbol_ids, dates = symbol_ids[order], dates[order]
+    log_close = np.log(close[valid][order])
+
+    # Returns within a symbol; the first row of each symbol has none
+    returns = np.zeros_like(log_close)
+    returns[1:] = np.diff(log_close)
+    first = np.ones(len(returns), dtype=bool)
+    first[1:] = symbol_ids[1:] != symbol_ids[:-1]
+    returns[first] = 0.0
+    has_return = (~first).astype(float)
+
+    # Position of each row counted back from its symbol's last row (0 = latest)
+    n_symbols = len(symbols)
+    rows_per_symbol = np.bincount(symbol_ids, minlength=n_symbols)
+    ends = np.cumsum(rows_per_symbol)
+    age = ends[symbol_ids] - 1 - np.arange(len(returns))
+
+    squared = returns * returns
+    features = pd.DataFrame(
+        {
+            "symbol": symbols,
+            "date": dates[ends - 1],
+            "returns": np.bincount(symbol_ids, weights=has_return, minlength=n_symbols),
+        }
+    )
+    for name, window in (
+        ("hv_5d", SHORT_WINDOW),
+        ("hv_20d", MEDIUM_WINDOW),
+        ("hv_252d", LONG_WINDOW),
+    ):
+        in_window = age < window
+        total = np.bincount(
+            symbol_ids, weights=squared * in_window, minlength=n_symbols
+        )
+        count = np.bincount(
+            symbol_ids, weights=has_return * in_window, minlength=n_symbols
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            features[name] = np.sqrt(total / count * TRADING_DAYS) * 100
+
+    decay = EWMA_LAMBDA ** np.arange(EWMA_DAYS)
+    weights = np.where(age < EWMA_DAYS, decay[np.minimum(age, EWMA_DAYS - 1)], 0.0)
+    weights *= has_return
+    ewma_total = np.bincount(symbol_ids, weights=weights * squared, minlength=n_symbols)
+    ewma_weight = np.bincount(symbol_ids, weights=weights, minlength=n_symbols)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        features["ewma_vol"] = np.sqrt(ewma_total / ewma_weight * TRADING_DAYS) * 100
+
+    return features[features["returns"] >= MIN_RETURNS].reset_index(drop=True)
+
+
+def forecast_from_features(features: pd.DataFrame, current_vix: float) -> pd.DataFrame:
+    """Apply the mean-reversion forecast to realized volatility features.
+
+    Args:
+        features: Output of realized_vol_features.
+        current_vix: Market VIX on the forecast date (sets regime and confidence).
+
+    Returns:
+        Rows shaped like the volatility_forecasts table, without id/computed_at.
+    """
+    current = features["ewma_vol"].to_numpy()
+    long_run = features["hv_252d"].to_numpy()
+    regime = vix_regime(current_vix)
+
+    divergence = np.abs(features["hv_20d"].to_numpy() - current) / current
+    confidence = np.where(
+        divergence > DIVERGENCE_LIMIT,
+        CONFIDENCE_BY_REGIME[regime] * DIVERGENCE_PENALTY,
+        CONFIDENCE_BY_REGIME[regime],
+    )
+
+    return pd.DataFrame(
+        {
+            "symbol": features["symbol"],
+            "forecast_date": pd.to_datetime(features["date"]).dt.date,
+            "volatility_1d": np.round(
+                current * (1 - MEAN_REVERSION_1D) + long_run * MEAN_REVERSION_1D, 2
+            ),
+            "volatility_5d": np.round(
+                current * (1 - MEAN_REVERSION_5D) + long_run * MEAN_REVERSION_5D, 2
+            ),
+            "current_vix": current_vix,
+            "volatility_regime": regime,
+            "confidence": np.round(confidence, 2),
+        }
+    )
+
+
+def _forecast_chunk(prices: pd.DataFrame, current_vix: float) -> pd.DataFrame:
+    return forecast_from_features(realized_vol_features(prices), current_vix)
+
+
+def forecast_universe(
+    prices: pd.DataFrame, current_vix: float, workers: int = 1
+) -> pd.DataFrame:
+    """Forecast every symbol in a long price table.
+
+    Args:
+        prices: Long table with symbol, date and close columns.
+        current_vix: Market VIX on the forecast date.
+        workers: Processes for large tables; symbols are split into
+            contiguous chunks, one per worker.
+
+    Returns:
+        One forecast row per symbol with enough history, sorted by symbol.
+    """
+    if workers <= 1 or len(prices) < PARALLEL_MIN_ROWS:
+        forecasts = _forecast_chunk(prices, current_vix)
+    else:
+        symbols = np.sort(prices["symbol"].unique())
+        chunks = [
+            prices[prices["symbol"].isin(part)]
+            for part in np.array_split(symbols, workers)
+            if len(part)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            forecasts = pd.concat(
+                pool.map(_forecast_chunk, chunks, [current_vix] * len(chunks)),
+                ignore_index=True,
+            )
+    return forecasts.sort_values("symbol").reset_index(drop=True)
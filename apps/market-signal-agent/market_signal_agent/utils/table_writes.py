@@ -0,0 +1,60 @@
+"""Atomic replacement of daily aggregate tables from the build scripts.
+
+The daily aggregate tables (analyst_rating_daily, news_sentiment_daily) are
+refreshed by recomputing recent days. Deleting those days and then appending
+the new rows in a second job leaves readers without them in between, and
+loses them entirely if the load fails. replace_days swaps them in one step:
+a WRITE_TRUNCATE load for a full rebuild, or a staging-table load followed by
+one DELETE + INSERT transaction for an incremental run.
+"""
+
+from datetime import date
+
+import pandas as pd
+from google.cloud import bigquery
+
+
+def replace_days(
+    client: bigquery.Client,
+    table_id: str,
+    frame: pd.DataFrame,
+    since: date | None,
+) -> None:
+    """Replace a table's rows from a date on with a frame, atomically.
+
+    Args:
+        client: BigQuery client.
+        table_id: Table keyed by a DATE column named "date".
+        frame: New rows, with the table's columns.
+        since: First replaced date; None replaces the whole table.
+    """
+    schema = client.get_table(table_id).schema
+    job_config = bigquery.LoadJobConfig(
+        schema=schema, write_disposition="WRITE_TRUNCATE"
+    )
+    if since is None:
+        client.load_table_from_dataframe(
+            frame, table_id, job_config=job_config
+        ).result()
+        return
+
+    staging_id = f"{table_id}_staging"
+    try:
+        client.load_table_from_dataframe(
+            frame, staging_id, job_config=job_config
+        ).result()
+        columns = ", ".join(field.name for field in schema)
+        client.query(
+            f"""
+            BEGIN TRANSACTION;
+            DELETE FROM `{table_id}` WHERE date >= @since;
+            INSERT INTO `{table_id}` ({columns})
+            SELECT {columns} FROM `{staging_id}`;
+            COMMIT TRANSACTION;
+            """,
+            job_config=bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ScalarQueryParameter("since", "DATE", since)]
+            ),
+        ).result()
+    finally:
+        client.delete_table(staging_id, not_found_ok=True)
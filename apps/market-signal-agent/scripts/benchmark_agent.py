@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Offline load test and benchmark for the Market Signal Agent pipeline.
+
+Gemini is replaced with a deterministic fake model and BigQuery with an
+in-memory stand-in, so runs need no credentials and are repeatable. The script
+drives root_agent with N concurrent sessions and reports turn latency
+(p50/p95/p99), events/sec and memory per session.
+
+Results are written as JSON (default: logs/benchmarks/benchmark-YYYY-MM-DD-HHMMSS.json).
+Pass --baseline with an earlier results file to print the regression deltas.
+
+Usage:
+    uv run python scripts/benchmark_agent.py
+    uv run python scripts/benchmark_agent.py --sessions 50 --turns 4 --bq-latency-ms 200
+    uv run python scripts/benchmark_agent.py --baseline logs/benchmarks/<previous>.json
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import subprocess
+import time
+import tracemalloc
+from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import google.auth
+import numpy as np
+from google.auth.credentials import AnonymousCredentials
+
+# The BigQuery toolsets resolve credentials at import time; benchmarks run offline
+google.auth.default = lambda *args, **kwargs: (AnonymousCredentials(), "benchmark")
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.adk.tools import FunctionTool
+from google.adk.tools.bigquery import BigQueryToolset
+from google.cloud import bigquery
+from google.genai import types
+
+from market_signal_agent.agent import root_agent
+from market_signal_agent.config import config
+from market_signal_agent.tools import run_in_bigquery_executor
+from market_signal_agent.utils.query_planner import DEFAULT_SYMBOLS
+
+APP_DIR = Path(__file__).parent.parent
+
+# Query mix: each session cycles through these, offset by its index
+DEFAULT_QUERIES = [
+    "hi",
+    "Run a complete volatility analysis",
+    "What is the current VIX?",
+    "What's Apple's earnings sentiment?",
+    "Check for alerts",
+]
+
+# First table reference in an agent instruction, e.g. `project.dataset.market_30yr_v`
+TABLE_REF = re.compile(r"`[\w-]+\.\w+\.(\w+)`")
+
+# Canned rows returned by the in-memory BigQuery, keyed by table/view name
+CANNED_ROWS: dict[str, list[dict[str, Any]]] = {
+    "market_30yr_v": [
+        {"date": "2023-11-17", "vix": 13.8, "sp500": 4514.0, "treasury_10y": 4.44},
+        {"date": "2023-11-16", "vix": 14.3, "sp500": 4508.2, "treasury_10y": 4.45},
+    ],
+    "index_data_v": [
+        {"symbol": "^GSPC", "date": "2023-11-17", "close": 4514.0, "volume": 3.5e9},
+    ],
+    "fed_communications_v": [
+        {"date": "2023-11-01", "type": "FOMC Statement", "title": "Rates held"},
+    ],
+}
+DEFAULT_ROWS = [{"value": 1}]
+
+SPEECH_ROW = {
+    "event": "Q3 2023 Earnings Call",
+    "tone": "neutral",
+    "guidance": "maintained",
+    "topics": ["AI", "margins"],
+    "risks": ["supply chain"],
+    "risk_score": 0.5,
+    "sentiment_score": 0,
+    "avg_risk_score": 0.5,
+    "avg_sentiment_score": 0.0,
+    "bullish_count": 0,
+    "bearish_count": 0,
+}
+
+
+class InMemoryBigQuery:
+    """In-memory BigQuery stand-in with a fixed per-query latency.
+
+    Latency is simulated with a blocking sleep, like a real BigQuery round-trip,
+    and the stand-in runs on the same thread pool as the real tools.
+    """
+
+    def __init__(self, latency_ms: float) -> None:
+        self.latency_ms = latency_ms
+        self.queries = 0
+
+    def run(self, query: str) -> list[dict[str, Any]]:
+        """Return the canned rows for the first table referenced by a query."""
+        self.queries += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        match = TABLE_REF.search(query)
+        return CANNED_ROWS.get(match.group(1), DEFAULT_ROWS) if match else DEFAULT_ROWS
+
+    def execute_sql(self, project_id: str, query: str) -> dict:
+        """Run a BigQuery SQL query in the given project.
+
+        Args:
+            project_id: The GCP project id in which the query should be executed.
+            query: The BigQuery SQL query to be executed.
+
+        Returns:
+            Dictionary with the status and the rows of the query result.
+        """
+        return {"status": "SUCCESS", "rows": self.run(query)}
+
+
+class InMemoryQueryJob:
+    """Minimal bigquery.QueryJob stand-in for function tools."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+        self.job_id = "benchmark"
+        self.total_bytes_processed = 0
+        self.total_bytes_billed = 0
+        self.cache_hit = False
+
+    def result(self) -> list[Any]:
+        """Return the job's rows."""
+        return self._rows
+
+
+class InMemoryBigQueryClient:
+    """bigquery.Client stand-in backed by the shared InMemoryBigQuery."""
+
+    backend: InMemoryBigQuery
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def query(self, query: str, job_config: Any = None) -> InMemoryQueryJob:
+        """Run a query; speech_signals queries return one row per requested symbol."""
+        self.backend.run(query)
+        parameters = {p.name: p for p in getattr(job_config, "query_parameters", [])}
+        symbols = getattr(parameters.get("symbols"), "values", None) or []
+        rows = [
+            SimpleNamespace(
+                symbol=symbol,
+                processed_at=datetime.now(timezone.utc),
+                neutral_count=len(symbols),
+                **SPEECH_ROW,
+            )
+            for symbol in symbols
+        ]
+        return InMemoryQueryJob(rows)
+
+
+class BenchmarkLlm(BaseLlm):
+    """Deterministic fake model.
+
+    Agents with a data tool call it once, then answer with a fixed JSON summary;
+    all other calls answer immediately. Token usage is estimated from text length.
+    """
+
+    model: str = "benchmark-fake"
+    latency_ms: float = 0.0
+    calls: int = 0
+
+    def _tool_call(self, llm_request: LlmRequest) -> types.FunctionCall | None:
+        """Pick the data tool call for this agent, if it has one."""
+        if "query_speech_signals" in llm_request.tools_dict:
+            return types.FunctionCall(
+                name="query_speech_signals", args={"symbols": DEFAULT_SYMBOLS}
+            )
+        if "execute_sql" in llm_request.tools_dict:
+            instruction = str(llm_request.config.system_instruction or "")
+            match = TABLE_REF.search(instruction)
+            table = match.group(0) if match else "`benchmark.dataset.table`"
+            return types.FunctionCall(
+                name="execute_sql",
+                args={
+                    "project_id": config.bq_project,
+                    "query": f"SELECT * FROM {table} ORDER BY date DESC LIMIT 10",
+                },
+            )
+        return None
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        """Return one deterministic response."""
+        self.calls += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        last = llm_request.contents[-1] if llm_request.contents else None
+        answered = bool(
+            last and any(part.function_response for part in last.parts or [])
+        )
+        function_call = None if answered else self._tool_call(llm_request)
+        if function_call:
+            part = types.Part(function_call=function_call)
+        else:
+            part = types.Part(
+                text=json.dumps({"status": "success", "source": "benchmark"})
+            )
+
+        prompt_tokens = len(str(llm_request.contents)) // 4
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[part]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=16,
+                total_token_count=prompt_tokens + 16,
+            ),
+        )
+
+
+def install_stand_ins(
+    agent: BaseAgent, llm: BenchmarkLlm, bq: InMemoryBigQuery
+) -> None:
+    """Swap the model and BigQuery toolsets for stand-ins across the agent tree."""
+    if isinstance(agent, LlmAgent):
+        agent.model = llm
+        agent.tools = [
+            (
+                FunctionTool(func=run_in_bigquery_executor(bq.execute_sql))
+                if isinstance(tool, BigQueryToolset)
+                else tool
+            )
+            for tool in agent.tools
+        ]
+    for sub_agent in agent.sub_agents:
+        install_stand_ins(sub_agent, llm, bq)
+
+
+def summarize_latencies(latencies: list[float]) -> dict[str, float]:
+    """Latency percentiles in milliseconds."""
+    if not latencies:
+        return {}
+    values = np.array(latencies) * 1000
+    return {
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+        "mean": round(float(values.mean()), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+async def run_turn(
+    runner: InMemoryRunner, user_id: str, session_id: str, query: str
+) -> int:
+    """Run one user turn to completion and return the number of events."""
+    events = 0
+    async for _ in runner.run_async(
+        user_id=user_id,
+        session_id=session_id,
+        new_message=types.Content(role="user", parts=[types.Part(text=query)]),
+    ):
+        events += 1
+    return events
+
+
+async def run_session(
+    runner: InMemoryRunner,
+    index: int,
+    turns: int,
+    queries: list[str],
+    samples: list[tuple[str, float, int]],
+) -> None:
+    """Run one session's turns sequentially, recording (query, seconds, events)."""
+    user_id = f"bench_user_{index}"
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name, user_id=user_id
+    )
+    for turn in range(turns):
+        query = queries[(index + turn) % len(queries)]
+        start = time.perf_counter()
+        events = await run_turn(runner, user_id, session.id, query)
+        samples.append((query, time.perf_counter() - start, events))
+
+
+async def run_load(
+    sessions: int, turns: int, queries: list[str]
+) -> tuple[list[tuple[str, float, int]], float]:
+    """Run concurrent sessions against a fresh runner; return samples and wall time."""
+    runner = InMemoryRunner(agent=root_agent)
+    samples: list[tuple[str, float, int]] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(run_session(runner, i, turns, queries, samples) for i in range(sessions))
+    )
+    return samples, time.perf_counter() - start
+
+
+async def measure_memory(
+    sessions: int, turns: int, queries: list[str]
+) -> dict[str, int]:
+    """Measure memory retained per session (separate pass; tracemalloc adds overhead)."""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    runner = InMemoryRunner(agent=root_agent)
+    samples: list[tuple[str, float, int]] = []
+    await asyncio.gather(
+        *(run_session(runner, i, turns, queries, samples) for i in range(sessions))
+    )
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del runner
+    return {
+        "sessions": sessions,
+        "bytes_per_session": (current - baseline) // max(sessions, 1),
+        "peak_bytes": peak - baseline,
+    }
+
+
+def get_git_commit() -> str | None:
+    """Short hash of the checked-out commit, for labelling results."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=APP_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(results: dict, baseline: dict) -> None:
+    """Print key metrics against a baseline results file."""
+    metrics = [
+        ("latency p50 (ms)", ("latency_ms", "p50")),
+        ("latency p95 (ms)", ("latency_ms", "p95")),
+        ("latency p99 (ms)", ("latency_ms", "p99")),
+        ("events/sec", ("throughput", "events_per_sec")),
+        ("bytes/session", ("memory", "bytes_per_session")),
+    ]
+    print("\n" + "=" * 60)
+    print(f"Comparison with baseline ({baseline.get('git_commit')})")
+    print("=" * 60)
+    for label, (section, key) in metrics:
+        old = baseline.get(section, {}).get(key)
+        new = results.get(section, {}).get(key)
+        if old is None or new is None:
+            continue
+        delta = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+        print(f"  {label:<18} {old:>12} -> {new:>12}  ({delta})")
+
+
+async def main() -> None:
+    """Run the benchmark and write the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the agent pipeline offline")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--turns", type=int, default=5, help="Turns per session")
+    parser.add_argument(
+        "--model-latency-ms",
+        type=float,
+        default=0.0,
+        help="Fake model latency per call",
+    )
+    parser.add_argument(
+        "--bq-latency-ms",
+        type=float,
+        default=0.0,
+        help="In-memory BigQuery latency per query",
+    )
+    parser.add_argument(
+        "--query", action="append", dest="queries", help="Query to include (repeatable)"
+    )
+    parser.add_argument("--output", type=Path, help="Results JSON path")
+    parser.add_argument(
+        "--baseline", type=Path, help="Earlier results JSON to compare against"
+    )
+    args = parser.parse_args()
+
+    queries = args.queries or DEFAULT_QUERIES
+    llm = BenchmarkLlm(latency_ms=args.model_latency_ms)
+    bq = InMemoryBigQuery(latency_ms=args.bq_latency_ms)
+    InMemoryBigQueryClient.backend = bq
+    bigquery.Client = InMemoryBigQueryClient
+    install_stand_ins(root_agent, llm, bq)
+    config.snapshot_max_age_seconds = 0  # Measure the pipeline, not snapshot reads
+
+    print("=" * 60)
+    print(f"Benchmark: {args.sessions} sessions x {args.turns} turns")
+    print("=" * 60)
+
+    # Warm up imports and lazy initialization outside the measurement
+    await run_load(1, 1, queries[1:2] or queries)
+    llm.calls = bq.queries = 0
+
+    samples, wall_time = await run_load(args.sessions, args.turns, queries)
+    model_calls, bq_queries = llm.calls, bq.queries
+    memory = await measure_memory(args.sessions, args.turns, queries)
+
+    total_events = sum(events for _, _, events in samples)
+    results = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": get_git_commit(),
+        "config": {
+            "sessions": args.sessions,
+            "turns": args.turns,
+            "model_latency_ms": args.model_latency_ms,
+            "bq_latency_ms": args.bq_latency_ms,
+            "queries": queries,
+        },
+        "latency_ms": summarize_latencies([seconds for _, seconds, _ in samples]),
+        "per_query_latency_ms": {
+            query: summarize_latencies([s for q, s, _ in samples if q == query])
+            for query in queries
+        },
+        "throughput": {
+            "turns": len(samples),
+            "events": total_events,
+            "wall_time_s": round(wall_time, 3),
+            "turns_per_sec": round(len(samples) / wall_time, 2),
+            "events_per_sec": round(total_events / wall_time, 2),
+        },
+        "memory": memory,
+        "stand_ins": {"model_calls": model_calls, "bigquery_queries": bq_queries},
+    }
+
+    output = args.output or (
+        APP_DIR
+        / "logs"
+        / "benchmarks"
+        / f"benchmark-{datetime.now().strftime('%Y-%m-%d-%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    latency = results["latency_ms"]
+    print(
+        f"Latency (ms): p50={latency['p50']} p95={latency['p95']} p99={latency['p99']}"
+    )
+    for query, stats in results["per_query_latency_ms"].items():
+        if stats:
+            print(f"  {query[:40]:<40} p50={stats['p50']} p95={stats['p95']}")
+    print(
+        f"Throughput: {results['throughput']['turns_per_sec']} turns/sec, "
+        f"{results['throughput']['events_per_sec']} events/sec"
+    )
+    print(f"Memory: {memory['bytes_per_session']} bytes/session")
+    print(f"Stand-ins: {model_calls} model calls, {bq_queries} BigQuery queries")
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        print_comparison(results, json.loads(args.baseline.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+"""Build per-stock daily analyst rating aggregates (analyst_rating_daily).
+
+Reads analyst_ratings headlines, classifies each one as upgrade, downgrade,
+initiation, reiteration and/or price target raise/cut with vectorized regexes
+(market_signal_agent.utils.rating_classifier), and writes one row per symbol
+and day with the action counts, a net momentum score and rolling 5/20-day
+totals. Agents then read a few aggregate rows per symbol instead of raw
+headlines (see the get_analyst_momentum tool).
+
+Runs incrementally: only days from the last aggregated date (minus the rolling
+window) are recomputed and swapped in atomically
+(market_signal_agent.utils.table_writes). Use --full to rebuild everything,
+e.g. after backfilled headlines.
+
+    uv run python scripts/build_analyst_aggregates.py
+    uv run python scripts/build_analyst_aggregates.py --full
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+from google.cloud import bigquery
+
+from market_signal_agent.config import config
+from market_signal_agent.utils.rating_classifier import (
+    RATING_ACTIONS,
+    classify_titles,
+    momentum_score,
+)
+from market_signal_agent.utils.table_writes import replace_days
+
+# Longest rolling window in calendar days; recomputed days need this much history
+ROLLING_DAYS = 20
+
+# Days before the last aggregated date that are recomputed (late headlines)
+RECOMPUTE_DAYS = 3
+
+
+def last_aggregated_date(client: bigquery.Client, table_id: str) -> date | None:
+    """Latest date already in the aggregate table."""
+    rows = list(client.query(f"SELECT MAX(date) AS last FROM `{table_id}`").result())
+    return rows[0].last if rows else None
+
+
+def load_headlines(client: bigquery.Client, since: date | None) -> pd.DataFrame:
+    """Read (symbol, date, title) headlines, optionally from a date on."""
+    query = f"""
+        SELECT
+            stock AS symbol,
+            COALESCE(SAFE_CAST(date AS DATE), DATE(SAFE_CAST(date AS TIMESTAMP))) AS date,
+            title
+        FROM `{config.bq_dataset_full}.analyst_ratings`
+        WHERE stock IS NOT NULL
+    """
+    job_config = None
+    if since is not None:
+        query = f"SELECT * FROM ({query}) WHERE date >= @since"
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("since", "DATE", since)]
+        )
+    df = client.query(query, job_config=job_config).to_dataframe()
+    return df.dropna(subset=["date"])
+
+
+def aggregate_ratings(headlines: pd.DataFrame) -> pd.DataFrame:
+    """Per symbol and day action counts, momentum and rolling totals."""
+    actions = classify_titles(headlines["title"])
+    actions["ratings"] = 1
+    actions["momentum"] = momentum_score(actions)
+    actions["symbol"] = headlines["symbol"].str.upper()
+    actions["date"] = pd.to_datetime(headlines["date"])
+
+    daily = actions.groupby(["symbol", "date"], sort=True).sum().reset_index()
+
+    # Rolling calendar-day windows per symbol (rows are sorted by symbol, date)
+    indexed = daily.set_index("date").groupby("symbol")[["ratings", "momentum"]]
+    for days in (5, ROLLING_DAYS):
+        rolled = indexed.rolling(f"{days}D").sum()
+        daily[f"ratings_{days}d"] = rolled["ratings"].to_numpy().astype("int64")
+        daily[f"momentum_{days}d"] = rolled["momentum"].to_numpy()
+
+    daily["date"] = daily["date"].dt.date
+    daily["updated_at"] = datetime.now(timezone.utc)
+    columns = [
+        "symbol",
+        "date",
+        "ratings",
+        *RATING_ACTIONS,
+        "momentum",
+        "ratings_5d",
+        "momentum_5d",
+        "ratings_20d",
+        "momentum_20d",
+        "updated_at",
+    ]
+    return daily[columns]
+
+
+def main() -> None:
+    """Refresh analyst_rating_daily."""
+    parser = argparse.ArgumentParser(description="Build analyst rating aggregates")
+    parser.add_argument("--full", action="store_true", help="Rebuild all days")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("ANALYST RATING AGGREGATES")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    table_id = f"{config.bq_dataset_full}.analyst_rating_daily"
+
+    last = None if args.full else last_aggregated_date(client, table_id)
+    recompute_from = last - timedelta(days=RECOMPUTE_DAYS) if last else None
+    read_from = (
+        recompute_from - timedelta(days=ROLLING_DAYS) if recompute_from else None
+    )
+    print(f"Recomputing from: {recompute_from or 'beginning (full build)'}")
+
+    start = time.perf_counter()
+    headlines = load_headlines(client, read_from)
+    print(f"Read {len(headlines):,} headlines in {time.perf_counter() - start:.1f}s")
+    if headlines.empty:
+        print("No headlines to aggregate. Exiting.")
+        return
+
+    start = time.perf_counter()
+    daily = aggregate_ratings(headlines)
+    if recompute_from is not None:
+        daily = daily[daily["date"] >= recompute_from]
+    print(
+        f"Aggregated {len(daily):,} symbol-days in {time.perf_counter() - start:.1f}s"
+    )
+
+    # Swap in the recomputed days in one step
+    replace_days(client, table_id, daily, recompute_from)
+
+    print(f"\nWrote {len(daily):,} rows to {table_id}")
+    totals = daily[list(RATING_ACTIONS)].sum()
+    for action, count in totals.items():
+        print(f"  {action:<14} {count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
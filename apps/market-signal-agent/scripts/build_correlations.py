@@ -0,0 +1,92 @@
+"""Build the cross-asset correlation store from market_30yr_v.
+
+Computes rolling covariance and correlation matrices of the market_30yr_v
+assets for every trading day and window (market_signal_agent.utils.correlation)
+and writes them to CORRELATION_PATH for the get_cross_asset_correlation tool.
+
+An existing store is extended with the days after its last date, reading only
+the trailing window of history; --full recomputes all days.
+
+    uv run python scripts/build_correlations.py
+    uv run python scripts/build_correlations.py --full
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+from google.cloud import bigquery
+
+from market_signal_agent.config import config
+from market_signal_agent.utils.correlation import (
+    ASSETS,
+    CorrelationStore,
+    load_correlation_store,
+)
+
+# Calendar days of history read before the last cached date (covers the
+# longest window in trading days)
+HISTORY_DAYS = 200
+
+
+def load_market(client: bigquery.Client, since: date | None) -> pd.DataFrame:
+    """Read date plus asset levels, optionally from a start date."""
+    query = f"""
+        SELECT SAFE_CAST(date AS DATE) AS date, {", ".join(ASSETS)}
+        FROM `{config.bq_dataset_full}.market_30yr_v`
+        WHERE date IS NOT NULL
+    """
+    job_config = None
+    if since is not None:
+        query = f"SELECT * FROM ({query}) WHERE date >= @since"
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("since", "DATE", since)]
+        )
+    return client.query(f"{query} ORDER BY date", job_config=job_config).to_dataframe()
+
+
+def main() -> None:
+    """Build or extend the correlation store."""
+    parser = argparse.ArgumentParser(description="Build cross-asset correlations")
+    parser.add_argument("--full", action="store_true", help="Recompute all days")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("CROSS-ASSET CORRELATIONS")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    path = config.resolve_path(config.correlation_path)
+    store = None if args.full else load_correlation_store()
+
+    since = None
+    if store is not None:
+        since = date.fromisoformat(store.latest_date) - timedelta(days=HISTORY_DAYS)
+    print(f"Reading from: {since or 'beginning (full build)'}")
+
+    market = load_market(client, since)
+    print(f"Read {len(market):,} trading days x {len(ASSETS)} assets")
+
+    start = time.perf_counter()
+    if store is None:
+        store = CorrelationStore.build(market)
+    else:
+        before = len(store.dates)
+        store = store.extend(market)
+        print(f"Appended {len(store.dates) - before} new days")
+    print(f"Computed in {time.perf_counter() - start:.3f}s")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    store.save(str(path))
+
+    latest = len(store.dates) - 1
+    print(f"\nCorrelation store written to {path}")
+    print(f"  {len(store.dates):,} dates x windows {list(store.windows)}")
+    print(f"  Latest: {store.latest_date}, contagion {store.contagion[latest]:+.3f}")
+    for pair in store.breakdowns(latest):
+        print(f"  Breakdown: {pair['pair']} shift {pair['shift']:+.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Build the normalized event_calendar table from Fed and M&A sources.
+
+Rewrites event_calendar (created by scripts/create_tables.py) with one row per
+event and proper DATE columns:
+- fed_communications_v: dated by release date, typed fed_<type> (fed_minute, ...)
+- acquisitions over $1B: typed mna_large / mna_mega ($10B+). Only the year and
+  month are known, so the event spans the whole month (start_date..end_date)
+
+The check_upcoming_events tool and scripts/build_event_impact.py read this
+table instead of re-parsing the source columns at query time.
+
+Re-run after loading new Fed communications or acquisitions:
+    uv run python scripts/build_event_calendar.py
+"""
+
+from google.cloud import bigquery
+
+from market_signal_agent.config import config
+
+
+def build_event_calendar(client: bigquery.Client) -> None:
+    """Replace event_calendar contents with the normalized events."""
+    dataset = config.bq_dataset_full
+    table_id = f"{dataset}.event_calendar"
+
+    client.query(f"""
+        TRUNCATE TABLE `{table_id}`;
+
+        INSERT INTO `{table_id}`
+            (event_id, event_type, category, start_date, end_date, title, value_billions)
+        WITH fed AS (
+            SELECT DISTINCT
+                CONCAT('fed_', LOWER(REGEXP_REPLACE(type, r'[^A-Za-z]+', '_'))) AS event_type,
+                type,
+                COALESCE(SAFE_CAST(release_date AS DATE), SAFE_CAST(date AS DATE)) AS event_date
+            FROM `{dataset}.fed_communications_v`
+            WHERE type IS NOT NULL
+        ),
+        mna AS (
+            SELECT
+                CAST(id AS STRING) AS id,
+                IF(acquisition_price >= 10000000000, 'mna_mega', 'mna_large') AS event_type,
+                COALESCE(
+                    SAFE.PARSE_DATE('%Y-%b-%d', CONCAT(
+                        CAST(acquisition_year AS STRING), '-',
+                        SUBSTR(CAST(acquisition_month AS STRING), 1, 3), '-01')),
+                    SAFE.PARSE_DATE('%Y-%m-%d', CONCAT(
+                        CAST(acquisition_year AS STRING), '-',
+                        CAST(acquisition_month AS STRING), '-01'))
+                ) AS month_start,
+                CONCAT(parent_company, ' acquires ', acquired_company) AS title,
+                ROUND(acquisition_price / 1000000000, 2) AS value_billions
+            FROM `{dataset}.acquisitions`
+            WHERE acquisition_price >= 1000000000
+        )
+        SELECT
+            CONCAT(event_type, '-', CAST(event_date AS STRING)),
+            event_type,
+            'fed',
+            event_date,
+            event_date,
+            CONCAT('FOMC ', type),
+            CAST(NULL AS FLOAT64)
+        FROM fed
+        WHERE event_date IS NOT NULL
+        UNION ALL
+        SELECT
+            CONCAT('mna-', id),
+            event_type,
+            'mna',
+            month_start,
+            LAST_DAY(month_start, MONTH),
+            title,
+            value_billions
+        FROM mna
+        WHERE month_start IS NOT NULL
+    """).result()
+
+    query = f"""
+        SELECT event_type, COUNT(*) AS events, MIN(start_date) AS first, MAX(start_date) AS last
+        FROM `{table_id}`
+        GROUP BY event_type
+        ORDER BY event_type
+    """
+    for row in client.query(query).result():
+        print(
+            f"  {row.event_type:<15} {row.events:>6} events  {row.first} .. {row.last}"
+        )
+
+
+def main() -> None:
+    """Build the event calendar."""
+    print("=" * 60)
+    print("EVENT CALENDAR")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    build_event_calendar(client)
+
+    print("\nevent_calendar rebuilt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Build the event-impact lookup used by calculate_volatility_forecast.
+
+Event study over 30 years of market_30yr_v: every event in event_calendar
+(Fed communications by release date, M&A deals over $1B from the start of the
+deal month) is aligned to the first trading day on or after its date, and the
+script measures
+- the VIX change on the event day and over the 5 trading days from it
+- the S&P 500 realized volatility over those 5 days relative to the 20 before
+Per event type the distribution (mean, p10, p50, p90) and the excess over an
+average trading day are written to EVENT_IMPACT_PATH as a small JSON lookup.
+
+Re-run after loading new market or event data (after build_event_calendar.py):
+    uv run python scripts/build_event_impact.py
+"""
+
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+from google.cloud import bigquery
+from numpy.lib.stride_tricks import sliding_window_view
+
+from market_signal_agent.config import config
+from market_signal_agent.utils.event_impact import ANY_EVENT
+
+# Event types with fewer aligned events are left out of the lookup
+MIN_EVENTS = 8
+
+# Events more than this many days before the next trading day are dropped
+MAX_ALIGNMENT_DAYS = 7
+
+PRE_WINDOW = 20  # Trading days of realized vol before the event
+POST_WINDOW = 5  # Trading days of realized vol (and VIX change) from the event
+
+
+def load_market(client: bigquery.Client) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Daily dates, VIX closes and S&P 500 closes in date order."""
+    query = f"""
+        SELECT SAFE_CAST(date AS DATE) AS date, vix, sp500
+        FROM `{config.bq_dataset_full}.market_30yr_v`
+        WHERE vix IS NOT NULL AND sp500 IS NOT NULL AND sp500 > 0
+        ORDER BY date
+    """
+    df = client.query(query).to_dataframe()
+    print(f"Read {len(df)} trading days")
+    return (
+        df["date"].to_numpy(dtype="datetime64[D]"),
+        df["vix"].to_numpy(dtype=np.float64),
+        df["sp500"].to_numpy(dtype=np.float64),
+    )
+
+
+def load_events(client: bigquery.Client) -> dict[str, np.ndarray]:
+    """Event start dates per event type from event_calendar."""
+    query = f"""
+        SELECT DISTINCT event_type, start_date AS event_date
+        FROM `{config.bq_dataset_full}.event_calendar`
+    """
+    df = client.query(query).to_dataframe().dropna()
+    events = {
+        event_type: np.sort(group["event_date"].to_numpy(dtype="datetime64[D]"))
+        for event_type, group in df.groupby("event_type")
+    }
+    for event_type, dates in sorted(events.items()):
+        print(f"  {event_type}: {len(dates)} events")
+    return events
+
+
+def daily_responses(vix: np.ndarray, sp500: np.ndarray) -> dict[str, np.ndarray]:
+    """Per-day responses, indexed by the trading day an event would align to.
+
+    Values are NaN where the pre- or post-event window runs off the series.
+    """
+    n = len(vix)
+    returns = np.diff(np.log(sp500))  # returns[i] is the return of day i + 1
+
+    vix_change_1d = np.full(n, np.nan)
+    vix_change_1d[1:] = vix[1:] - vix[:-1]
+
+    vix_change_5d = np.full(n, np.nan)
+    vix_change_5d[1 : n - POST_WINDOW + 1] = vix[POST_WINDOW:] - vix[: n - POST_WINDOW]
+
+    # Realized vol of days t..t+4 over days t-20..t-1
+    post_vol = sliding_window_view(returns, POST_WINDOW).std(axis=1, ddof=1)
+    pre_vol = sliding_window_view(returns, PRE_WINDOW).std(axis=1, ddof=1)
+    vol_ratio = np.full(n, np.nan)
+    days = np.arange(PRE_WINDOW + 1, n - POST_WINDOW + 1)
+    vol_ratio[days] = post_vol[days - 1] / np.maximum(
+        pre_vol[days - PRE_WINDOW - 1], 1e-12
+    )
+
+    return {
+        "vix_change_1d": vix_change_1d,
+        "vix_change_5d": vix_change_5d,
+        "realized_vol_ratio": vol_ratio,
+    }
+
+
+def align_events(market_dates: np.ndarray, event_dates: np.ndarray) -> np.ndarray:
+    """Index of the first trading day on or after each event (unique, in range)."""
+    days = np.searchsorted(market_dates, event_dates, side="left")
+    in_range = days < len(market_dates)
+    days, event_dates = days[in_range], event_dates[in_range]
+    close = (market_dates[days] - event_dates) <= np.timedelta64(
+        MAX_ALIGNMENT_DAYS, "D"
+    )
+    return np.unique(days[close])
+
+
+def summarize(values: np.ndarray) -> dict[str, float]:
+    """Mean and p10/p50/p90 of the finite values."""
+    values = values[np.isfinite(values)]
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        "mean": round(float(values.mean()), 3),
+        "p10": round(float(p10), 3),
+        "p50": round(float(p50), 3),
+        "p90": round(float(p90), 3),
+    }
+
+
+def event_study(
+    market_dates: np.ndarray,
+    vix: np.ndarray,
+    sp500: np.ndarray,
+    events: dict[str, np.ndarray],
+) -> dict:
+    """Compute the lookup: baseline day plus response per event type."""
+    responses = daily_responses(vix, sp500)
+    valid = np.isfinite(responses["realized_vol_ratio"]) & np.isfinite(
+        responses["vix_change_5d"]
+    )
+
+    baseline_days = np.flatnonzero(valid)
+    baseline = {
+        "n": len(baseline_days),
+        "vix_change_1d": summarize(responses["vix_change_1d"][baseline_days]),
+        "vix_change_5d": summarize(responses["vix_change_5d"][baseline_days]),
+        "realized_vol_ratio": round(
+            float(np.median(responses["realized_vol_ratio"][baseline_days])), 3
+        ),
+    }
+
+    def impact(days: np.ndarray) -> dict:
+        change_1d = summarize(responses["vix_change_1d"][days])
+        change_5d = summarize(responses["vix_change_5d"][days])
+        return {
+            "n": len(days),
+            "vix_change_1d": change_1d,
+            "vix_change_5d": change_5d,
+            "excess_vix_1d": round(
+                change_1d["mean"] - baseline["vix_change_1d"]["mean"], 3
+            ),
+            "excess_vix_5d": round(
+                change_5d["mean"] - baseline["vix_change_5d"]["mean"], 3
+            ),
+            "realized_vol_ratio": round(
+                float(np.median(responses["realized_vol_ratio"][days])), 3
+            ),
+        }
+
+    impacts: dict[str, dict] = {}
+    all_days: list[np.ndarray] = []
+    for event_type, event_dates in sorted(events.items()):
+        days = align_events(market_dates, event_dates)
+        days = days[valid[days]]
+        if len(days) < MIN_EVENTS:
+            print(f"  Skipping {event_type}: {len(days)} aligned events")
+            continue
+        impacts[event_type] = impact(days)
+        all_days.append(days)
+
+    if all_days:
+        impacts[ANY_EVENT] = impact(np.unique(np.concatenate(all_days)))
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "market_range": [str(market_dates[0]), str(market_dates[-1])],
+        "baseline": baseline,
+        "event_types": impacts,
+    }
+
+
+def main() -> None:
+    """Run the event study and write the lookup."""
+    print("=" * 60)
+    print("EVENT IMPACT STUDY")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    market_dates, vix, sp500 = load_market(client)
+    events = load_events(client)
+
+    lookup = event_study(market_dates, vix, sp500, events)
+    if not lookup["event_types"]:
+        print("No event type has enough history. Lookup not written.")
+        return
+
+    path = config.resolve_path(config.event_impact_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(lookup, indent=2), encoding="utf-8")
+
+    print(f"\nLookup written to {path}")
+    for event_type, impact in lookup["event_types"].items():
+        print(
+            f"  {event_type:<15} n={impact['n']:<5} "
+            f"excess VIX 1d {impact['excess_vix_1d']:+.2f}  "
+            f"5d {impact['excess_vix_5d']:+.2f}  "
+            f"RV ratio {impact['realized_vol_ratio']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Build the local retrieval index over Fed communications.
+
+Chunks every Fed minute and statement from fed_communications_v into
+overlapping passages, builds a BM25 inverted index, embeds the passages with
+Vertex AI (unless --no-embeddings), and writes the index to FED_INDEX_DIR for
+the search_fed_communications tool.
+
+Re-run after loading new Fed communications:
+    uv run python scripts/build_fed_index.py
+    uv run python scripts/build_fed_index.py --no-embeddings   # BM25 only
+"""
+
+import argparse
+import time
+
+from google.cloud import bigquery
+
+from market_signal_agent.config import config
+from market_signal_agent.retrieval import HybridIndex, chunk_text
+from market_signal_agent.retrieval.embeddings import embed_documents
+from market_signal_agent.tools.retrieval_tools import resolve_index_dir
+
+
+def load_fed_chunks(client: bigquery.Client) -> list[dict]:
+    """Read Fed communications and split them into passages with metadata."""
+    query = f"""
+        SELECT date, release_date, type, text
+        FROM `{config.bq_dataset_full}.fed_communications_v`
+        WHERE text IS NOT NULL
+        ORDER BY date
+    """
+
+    chunks: list[dict] = []
+    documents = 0
+    for row in client.query(query).result():
+        documents += 1
+        for i, passage in enumerate(chunk_text(row.text)):
+            chunks.append(
+                {
+                    "doc_id": f"{row.date}-{row.type}",
+                    "chunk": i,
+                    "date": str(row.date) if row.date else None,
+                    "release_date": str(row.release_date) if row.release_date else None,
+                    "type": row.type,
+                    "text": passage,
+                }
+            )
+
+    print(f"Read {documents} documents -> {len(chunks)} passages")
+    return chunks
+
+
+def main() -> None:
+    """Build and save the Fed communications index."""
+    parser = argparse.ArgumentParser(description="Build the Fed communications index")
+    parser.add_argument("--no-embeddings", action="store_true", help="Build BM25 only")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("FED COMMUNICATIONS INDEX")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    chunks = load_fed_chunks(client)
+    if not chunks:
+        print("No Fed communications found. Exiting.")
+        return
+
+    embeddings = None
+    if not args.no_embeddings:
+        start = time.perf_counter()
+        embeddings = embed_documents([chunk["text"] for chunk in chunks])
+        print(
+            f"Embedded {len(embeddings)} passages in {time.perf_counter() - start:.1f}s"
+        )
+
+    index = HybridIndex.build(chunks, embeddings)
+    index_dir = resolve_index_dir(config.fed_index_dir)
+    index.save(index_dir)
+
+    print(f"Index written to {index_dir}")
+    print(f"  Vocabulary: {len(index.bm25.terms)} terms")
+    print(f"  Vectors: {'yes' if index.vectors is not None else 'no (BM25 only)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Build the macro feature store from economic_indicators and market_30yr_v.
+
+Reads the annual US economic indicators (inflation, GDP growth,
+unemployment) and daily treasury yields, oil and gold, computes the features
+in market_signal_agent.utils.macro_features (changes, surprises vs the
+trailing average, term spread, 20-day moves, macro regime) and writes one row
+per trading day to MACRO_FEATURE_PATH as Parquet for the get_macro_context tool.
+
+Re-run after loading new market or indicator data:
+    uv run python scripts/build_macro_features.py
+"""
+
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from google.cloud import bigquery
+
+from market_signal_agent.config import config
+from market_signal_agent.utils.macro_features import (
+    ANNUAL_INDICATORS,
+    compute_macro_features,
+)
+
+
+def main() -> None:
+    """Compute and write the macro feature store."""
+    print("=" * 60)
+    print("MACRO FEATURES")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    dataset = config.bq_dataset_full
+
+    indicators = client.query(f"""
+        SELECT CAST(year AS INT64) AS year, {", ".join(ANNUAL_INDICATORS)}
+        FROM `{dataset}.economic_indicators`
+        WHERE year IS NOT NULL
+        ORDER BY year
+    """).to_dataframe()
+    print(
+        f"Read {len(indicators)} years of indicators "
+        f"({indicators['year'].min()}-{indicators['year'].max()})"
+    )
+
+    market = client.query(f"""
+        SELECT SAFE_CAST(date AS DATE) AS date, treasury_10y, treasury_5y, oil_wti, gold
+        FROM `{dataset}.market_30yr_v`
+        WHERE date IS NOT NULL
+        ORDER BY date
+    """).to_dataframe()
+    print(f"Read {len(market)} trading days")
+
+    features = compute_macro_features(indicators, market)
+
+    path = config.resolve_path(config.macro_feature_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write next to the store and swap it in, so a running server never
+    # reads a partially written file
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    pq.write_table(pa.Table.from_pandas(features, preserve_index=False), tmp_path)
+    os.replace(tmp_path, path)
+
+    print(f"\nFeature store written to {path}")
+    print(f"  {len(features)} dates x {len(features.columns) - 1} features")
+    print(
+        f"  Latest: {features['date'].iloc[-1]} ({features['macro_regime'].iloc[-1]})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Build per-stock daily news sentiment (news_sentiment_daily).
+
+stock_news holds labeled headlines (positive / negative / neutral) without a
+ticker or date, so it is used as training data: a naive Bayes headline model
+(market_signal_agent.utils.news_sentiment) is fitted on it, checked on a
+held-out split, and then scores the dated per-stock headlines in
+analyst_ratings. Scores are aggregated to one row per symbol and day.
+
+Runs incrementally from the last aggregated date (minus a few days for late
+headlines), swapping the recomputed days in atomically; --full rebuilds
+everything.
+
+    uv run python scripts/build_news_sentiment.py
+    uv run python scripts/build_news_sentiment.py --full
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+from google.cloud import bigquery
+
+from market_signal_agent.config import config
+from market_signal_agent.utils.news_sentiment import NewsSentimentModel
+from market_signal_agent.utils.table_writes import replace_days
+
+# Days before the last aggregated date that are recomputed (late headlines)
+RECOMPUTE_DAYS = 3
+
+HOLDOUT_FRACTION = 0.2
+
+
+def load_training_headlines(client: bigquery.Client) -> pd.DataFrame:
+    """Labeled headlines from stock_news."""
+    query = f"""
+        SELECT headline, label
+        FROM `{config.bq_dataset_full}.stock_news`
+        WHERE headline IS NOT NULL AND label IS NOT NULL
+    """
+    return client.query(query).to_dataframe()
+
+
+def train_model(training: pd.DataFrame) -> NewsSentimentModel:
+    """Report held-out accuracy, then fit on all labeled headlines."""
+    rng = np.random.default_rng(0)
+    holdout = rng.random(len(training)) < HOLDOUT_FRACTION
+    train, test = training[~holdout], training[holdout]
+
+    model = NewsSentimentModel.fit(train["headline"], train["label"])
+    predicted = model.score(test["headline"])["label"]
+    actual = test["label"].astype(str).str.lower().to_numpy()
+    accuracy = (predicted.to_numpy() == actual).mean()
+    print(f"Held-out accuracy: {accuracy:.1%} on {len(test):,} headlines")
+
+    return NewsSentimentModel.fit(training["headline"], training["label"])
+
+
+def last_aggregated_date(client: bigquery.Client, table_id: str) -> date | None:
+    """Latest date already in the aggregate table."""
+    rows = list(client.query(f"SELECT MAX(date) AS last FROM `{table_id}`").result())
+    return rows[0].last if rows else None
+
+
+def load_headlines(client: bigquery.Client, since: date | None) -> pd.DataFrame:
+    """Read dated per-stock (symbol, date, title) headlines from analyst_ratings."""
+    query = f"""
+        SELECT
+            stock AS symbol,
+            COALESCE(SAFE_CAST(date AS DATE), DATE(SAFE_CAST(date AS TIMESTAMP))) AS date,
+            title
+        FROM `{config.bq_dataset_full}.analyst_ratings`
+        WHERE stock IS NOT NULL AND title IS NOT NULL
+    """
+    job_config = None
+    if since is not None:
+        query = f"SELECT * FROM ({query}) WHERE date >= @since"
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("since", "DATE", since)]
+        )
+    df = client.query(query, job_config=job_config).to_dataframe()
+    return df.dropna(subset=["date"])
+
+
+def aggregate_sentiment(
+    headlines: pd.DataFrame, model: NewsSentimentModel
+) -> pd.DataFrame:
+    """Score headlines and aggregate per symbol and day."""
+    scored = model.score(headlines["title"])
+    scored["symbol"] = headlines["symbol"].str.upper()
+    scored["date"] = headlines["date"]
+
+    labels = pd.get_dummies(scored["label"]).reindex(
+        columns=["positive", "negative", "neutral"], fill_value=False
+    )
+    frame = pd.concat(
+        [scored[["symbol", "date", "sentiment"]], labels.astype("int64")], axis=1
+    )
+
+    daily = (
+        frame.groupby(["symbol", "date"], sort=True)
+        .agg(
+            headlines=("sentiment", "size"),
+            positive=("positive", "sum"),
+            negative=("negative", "sum"),
+            neutral=("neutral", "sum"),
+            sentiment=("sentiment", "mean"),
+        )
+        .reset_index()
+    )
+    daily["sentiment"] = daily["sentiment"].round(4)
+    daily["updated_at"] = datetime.now(timezone.utc)
+    return daily
+
+
+def main() -> None:
+    """Refresh news_sentiment_daily."""
+    parser = argparse.ArgumentParser(description="Build daily news sentiment")
+    parser.add_argument("--full", action="store_true", help="Rebuild all days")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("NEWS SENTIMENT")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    table_id = f"{config.bq_dataset_full}.news_sentiment_daily"
+
+    training = load_training_headlines(client)
+    print(f"Read {len(training):,} labeled headlines from stock_news")
+    model = train_model(training)
+    print(f"Vocabulary: {len(model.vocabulary):,} terms")
+
+    last = None if args.full else last_aggregated_date(client, table_id)
+    since = last - timedelta(days=RECOMPUTE_DAYS) if last else None
+    print(f"Recomputing from: {since or 'beginning (full build)'}")
+
+    start = time.perf_counter()
+    headlines = load_headlines(client, since)
+    print(f"Read {len(headlines):,} headlines in {time.perf_counter() - start:.1f}s")
+    if headlines.empty:
+        print("No headlines to score. Exiting.")
+        return
+
+    start = time.perf_counter()
+    daily = aggregate_sentiment(headlines, model)
+    elapsed = time.perf_counter() - start
+    print(f"Scored and aggregated in {elapsed:.1f}s -> {len(daily):,} symbol-days")
+
+    # Swap in the recomputed days in one step
+    replace_days(client, table_id, daily, since)
+
+    print(f"\nWrote {len(daily):,} rows to {table_id}")
+    print(f"  Mean sentiment: {daily['sentiment'].mean():+.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Forecast volatility for every symbol in index_data_v and bulk-write them.
+
+Reads one year of closes for all symbols, computes realized-volatility
+features and mean-reversion forecasts in one vectorized pass
+(market_signal_agent.utils.symbol_forecast) and writes them to
+volatility_forecasts with a single load job. Re-running for the same date
+replaces that date's rows for the forecast symbols.
+
+    uv run python scripts/build_symbol_forecasts.py
+    uv run python scripts/build_symbol_forecasts.py --as-of 2021-06-01 --workers 8
+"""
+
+import argparse
+import os
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+from google.cloud import bigquery
+
+from market_signal_agent.config import config
+from market_signal_agent.utils.symbol_forecast import LONG_WINDOW, forecast_universe
+
+# Calendar days of prices read (covers LONG_WINDOW trading days)
+LOOKBACK_DAYS = LONG_WINDOW * 7 // 5 + 30
+
+# Symbols without a price in this many days before the as-of date are skipped
+STALE_DAYS = 10
+
+
+def resolve_as_of(client: bigquery.Client, as_of: str | None) -> date:
+    """The requested date, or the latest date in index_data_v."""
+    if as_of:
+        return date.fromisoformat(as_of)
+    rows = client.query(
+        f"SELECT MAX(SAFE_CAST(date AS DATE)) AS last "
+        f"FROM `{config.bq_dataset_full}.index_data_v`"
+    ).result()
+    return next(iter(rows)).last
+
+
+def load_prices(client: bigquery.Client, as_of: date) -> pd.DataFrame:
+    """Closes for all symbols in the lookback window ending at as_of."""
+    query = f"""
+        SELECT
+            symbol,
+            SAFE_CAST(date AS DATE) AS date,
+            COALESCE(adj_close, close) AS close
+        FROM `{config.bq_dataset_full}.index_data_v`
+        WHERE SAFE_CAST(date AS DATE) BETWEEN @start AND @as_of
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter(
+                "start", "DATE", as_of - timedelta(days=LOOKBACK_DAYS)
+            ),
+            bigquery.ScalarQueryParameter("as_of", "DATE", as_of),
+        ]
+    )
+    return client.query(query, job_config=job_config).to_dataframe()
+
+
+def load_vix(client: bigquery.Client, as_of: date) -> float:
+    """VIX on or before as_of."""
+    query = f"""
+        SELECT vix
+        FROM `{config.bq_dataset_full}.market_30yr_v`
+        WHERE vix IS NOT NULL AND SAFE_CAST(date AS DATE) <= @as_of
+        ORDER BY date DESC
+        LIMIT 1
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter("as_of", "DATE", as_of)]
+    )
+    return float(next(iter(client.query(query, job_config=job_config).result())).vix)
+
+
+def main() -> None:
+    """Forecast all symbols and write them to volatility_forecasts."""
+    parser = argparse.ArgumentParser(description="Forecast volatility for all symbols")
+    parser.add_argument("--as-of", help="Forecast date (default: latest data date)")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Processes"
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SYMBOL FORECASTS")
+    print("=" * 60)
+
+    client = bigquery.Client(project=config.bq_project)
+    table_id = f"{config.bq_dataset_full}.volatility_forecasts"
+
+    as_of = resolve_as_of(client, args.as_of)
+    prices = load_prices(client, as_of)
+    current_vix = load_vix(client, as_of)
+    print(
+        f"As of {as_of}: {len(prices):,} prices, "
+        f"{prices['symbol'].nunique()} symbols, VIX {current_vix:.2f}"
+    )
+
+    start = time.perf_counter()
+    forecasts = forecast_universe(prices, current_vix, workers=args.workers)
+    forecasts = forecasts[
+        forecasts["forecast_date"] >= as_of - timedelta(days=STALE_DAYS)
+    ].reset_index(drop=True)
+    print(f"Forecast {len(forecasts)} symbols in {time.perf_counter() - start:.3f}s")
+    if forecasts.empty:
+        print("No symbols with enough recent history. Exiting.")
+        return
+
+    forecasts["forecast_date"] = as_of
+    forecasts.insert(0, "id", [str(uuid.uuid4()) for _ in range(len(forecasts))])
+    forecasts["computed_at"] = datetime.now(timezone.utc)
+
+    # Replace this date's forecasts for the same symbols, then load in one job
+    client.query(
+        f"DELETE FROM `{table_id}` "
+        "WHERE forecast_date = @as_of AND symbol IN UNNEST(@symbols)",
+        job_config=bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("as_of", "DATE", as_of),
+                bigquery.ArrayQueryParameter(
+                    "symbols", "STRING", forecasts["symbol"].tolist()
+                ),
+            ]
+        ),
+    ).result()
+    job_config = bigquery.LoadJobConfig(write_disposition="WRITE_APPEND")
+    client.load_table_from_dataframe(
+        forecasts, table_id, job_config=job_config
+    ).result()
+
+    print(f"\nWrote {len(forecasts)} forecasts to {table_id}")
+    for row in forecasts.nlargest(5, "volatility_1d").itertuples():
+        print(
+            f"  {row.symbol:<12} 1d {row.volatility_1d:6.2f}%  "
+            f"5d {row.volatility_5d:6.2f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
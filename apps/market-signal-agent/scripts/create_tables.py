@@ -1,4 +1,11 @@
-"""Create BigQuery tables for speech_signals and output tables."""
+"""Create BigQuery tables for speech_signals, speech_transcripts, precomputed and output tables.
+
+Raw transcripts are kept in speech_transcripts, keyed by the same id as
+speech_signals, so signal queries never scan or return transcript text.
+event_calendar is filled by scripts/build_event_calendar.py,
+analyst_rating_daily by scripts/build_analyst_aggregates.py and
+news_sentiment_daily by scripts/build_news_sentiment.py.
+"""
 
 from google.cloud import bigquery
 
@@ -14,7 +21,6 @@ def create_speech_signals_table(client: bigquery.Client) -> None:
         bigquery.SchemaField("id", "STRING", mode="REQUIRED"),
         bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
         bigquery.SchemaField("event", "STRING"),
-        bigquery.SchemaField("transcript", "STRING"),
         bigquery.SchemaField("tone", "STRING"),  # bullish, neutral, bearish
         bigquery.SchemaField("guidance", "STRING"),
         bigquery.SchemaField("topics", "STRING", mode="REPEATED"),  # ARRAY<STRING>
@@ -27,6 +33,131 @@ def create_speech_signals_table(client: bigquery.Client) -> None:
     print(f"Created table: {table_id}")
 
 
+def create_speech_transcripts_table(client: bigquery.Client) -> None:
+    """Create speech_transcripts table holding raw earnings call transcripts."""
+    table_id = f"{PROJECT_ID}.{DATASET_ID}.speech_transcripts"
+
+    schema = [
+        bigquery.SchemaField("id", "STRING", mode="REQUIRED"),  # = speech_signals.id
+        bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("event", "STRING"),
+        bigquery.SchemaField("transcript", "STRING"),
+        bigquery.SchemaField("file_path", "STRING"),
+        bigquery.SchemaField("created_at", "TIMESTAMP"),
+    ]
+
+    table = bigquery.Table(table_id, schema=schema)
+    table = client.create_table(table, exists_ok=True)
+    print(f"Created table: {table_id}")
+
+
+def move_transcripts_to_store(client: bigquery.Client) -> None:
+    """Move transcripts out of a speech_signals table created with a transcript column."""
+    signals_id = f"{PROJECT_ID}.{DATASET_ID}.speech_signals"
+    transcripts_id = f"{PROJECT_ID}.{DATASET_ID}.speech_transcripts"
+
+    table = client.get_table(signals_id)
+    if "transcript" not in {field.name for field in table.schema}:
+        return
+
+    print(f"Moving transcripts from {signals_id} to {transcripts_id}...")
+    client.query(f"""
+        MERGE `{transcripts_id}` t
+        USING (
+            SELECT id, symbol, event, transcript
+            FROM `{signals_id}`
+            WHERE transcript IS NOT NULL
+        ) s
+        ON t.id = s.id
+        WHEN NOT MATCHED THEN
+            INSERT (id, symbol, event, transcript, created_at)
+            VALUES (s.id, s.symbol, s.event, s.transcript, CURRENT_TIMESTAMP())
+    """).result()
+    client.query(f"ALTER TABLE `{signals_id}` DROP COLUMN transcript").result()
+    print("  -> Moved transcripts and dropped speech_signals.transcript")
+
+
+def create_event_calendar_table(client: bigquery.Client) -> None:
+    """Create event_calendar table of Fed and M&A events with DATE columns."""
+    table_id = f"{PROJECT_ID}.{DATASET_ID}.event_calendar"
+
+    schema = [
+        bigquery.SchemaField("event_id", "STRING", mode="REQUIRED"),
+        # fed_minute, mna_mega, ...
+        bigquery.SchemaField("event_type", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("category", "STRING"),  # fed, mna
+        bigquery.SchemaField("start_date", "DATE", mode="REQUIRED"),
+        # Same as start_date unless only the month is known
+        bigquery.SchemaField("end_date", "DATE", mode="REQUIRED"),
+        bigquery.SchemaField("title", "STRING"),
+        bigquery.SchemaField("value_billions", "FLOAT64"),
+    ]
+
+    table = bigquery.Table(table_id, schema=schema)
+    # Monthly partitions: 30 years of daily partitions would exceed the partition limit
+    table.time_partitioning = bigquery.TimePartitioning(
+        type_=bigquery.TimePartitioningType.MONTH, field="start_date"
+    )
+    table.clustering_fields = ["event_type"]
+    table = client.create_table(table, exists_ok=True)
+    print(f"Created table: {table_id}")
+
+
+def create_analyst_rating_daily_table(client: bigquery.Client) -> None:
+    """Create analyst_rating_daily table of per-stock daily rating aggregates."""
+    table_id = f"{PROJECT_ID}.{DATASET_ID}.analyst_rating_daily"
+
+    schema = [
+        bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+        bigquery.SchemaField("ratings", "INT64"),  # Headlines that day
+        bigquery.SchemaField("upgrades", "INT64"),
+        bigquery.SchemaField("downgrades", "INT64"),
+        bigquery.SchemaField("initiations", "INT64"),
+        bigquery.SchemaField("reiterations", "INT64"),
+        bigquery.SchemaField("target_raises", "INT64"),
+        bigquery.SchemaField("target_cuts", "INT64"),
+        bigquery.SchemaField("momentum", "FLOAT64"),  # Net direction that day
+        bigquery.SchemaField("ratings_5d", "INT64"),  # Rolling 5 / 20 calendar days
+        bigquery.SchemaField("momentum_5d", "FLOAT64"),
+        bigquery.SchemaField("ratings_20d", "INT64"),
+        bigquery.SchemaField("momentum_20d", "FLOAT64"),
+        bigquery.SchemaField("updated_at", "TIMESTAMP"),
+    ]
+
+    table = bigquery.Table(table_id, schema=schema)
+    table.time_partitioning = bigquery.TimePartitioning(
+        type_=bigquery.TimePartitioningType.MONTH, field="date"
+    )
+    table.clustering_fields = ["symbol"]
+    table = client.create_table(table, exists_ok=True)
+    print(f"Created table: {table_id}")
+
+
+def create_news_sentiment_daily_table(client: bigquery.Client) -> None:
+    """Create news_sentiment_daily table of per-stock daily headline sentiment."""
+    table_id = f"{PROJECT_ID}.{DATASET_ID}.news_sentiment_daily"
+
+    schema = [
+        bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+        bigquery.SchemaField("headlines", "INT64"),
+        bigquery.SchemaField("positive", "INT64"),
+        bigquery.SchemaField("negative", "INT64"),
+        bigquery.SchemaField("neutral", "INT64"),
+        bigquery.SchemaField("sentiment", "FLOAT64"),  # Mean P(positive) - P(negative)
+        bigquery.SchemaField("updated_at", "TIMESTAMP"),
+    ]
+
+    table = bigquery.Table(table_id, schema=schema)
+    table.time_partitioning = bigquery.TimePartitioning(
+        type_=bigquery.TimePartitioningType.MONTH, field="date"
+    )
+    table.clustering_fields = ["symbol"]
+    table = client.create_table(table, exists_ok=True)
+    print(f"Created table: {table_id}")
+
+
 def create_volatility_forecasts_table(client: bigquery.Client) -> None:
     """Create volatility_forecasts output table."""
     table_id = f"{PROJECT_ID}.{DATASET_ID}.volatility_forecasts"
@@ -61,10 +192,21 @@ def create_alerts_table(client: bigquery.Client) -> None:
         bigquery.SchemaField("vix_value", "FLOAT64"),
         bigquery.SchemaField("triggered_at", "TIMESTAMP"),
         bigquery.SchemaField("is_active", "BOOLEAN"),
+        # Alert lifecycle (utils/alert_state.py): last check and close time
+        bigquery.SchemaField("updated_at", "TIMESTAMP"),
+        bigquery.SchemaField("resolved_at", "TIMESTAMP"),
     ]
 
     table = bigquery.Table(table_id, schema=schema)
     table = client.create_table(table, exists_ok=True)
+
+    # Tables created before the lifecycle columns get them appended
+    existing = {field.name for field in table.schema}
+    missing = [field for field in schema if field.name not in existing]
+    if missing:
+        table.schema = [*table.schema, *missing]
+        client.update_table(table, ["schema"])
+        print(f"Added columns to {table_id}: {[f.name for f in missing]}")
     print(f"Created table: {table_id}")
 
 
@@ -75,6 +217,11 @@ def main() -> None:
     print(f"Creating tables in {PROJECT_ID}.{DATASET_ID}\n")
 
     create_speech_signals_table(client)
+    create_speech_transcripts_table(client)
+    move_transcripts_to_store(client)
+    create_event_calendar_table(client)
+    create_analyst_rating_daily_table(client)
+    create_news_sentiment_daily_table(client)
     create_volatility_forecasts_table(client)
     create_alerts_table(client)
 
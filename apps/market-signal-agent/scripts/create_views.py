@@ -1,7 +1,8 @@
 """Create BigQuery views with clean column names.
 
 This script creates views that alias the messy V2 character-mapped column names
-to clean, lowercase names for easier querying by agents.
+to clean, lowercase names for easier querying by agents, and a narrow
+speech_signals_v view exposing only the compact extracted signal columns.
 
 Run once after data loading:
     uv run python scripts/create_views.py
@@ -55,6 +56,19 @@ def create_views() -> None:
                 Text as text
             FROM `{project}.{dataset}.fed_communications`
         """,
+        "speech_signals_v": """
+            CREATE OR REPLACE VIEW `{project}.{dataset}.speech_signals_v` AS
+            SELECT
+                id,
+                symbol,
+                event,
+                tone,
+                guidance,
+                topics,
+                risks,
+                processed_at
+            FROM `{project}.{dataset}.speech_signals`
+        """,
     }
 
     print(f"Creating views in {PROJECT_ID}.{DATASET_ID}\n")
@@ -117,6 +131,17 @@ def verify_views() -> None:
     for row in client.query(query).result():
         print(f"   {row.date} | {row.type} | {row.summary}...")
 
+    # Test speech_signals_v
+    print("\n4. speech_signals_v (latest earnings signals):")
+    query = f"""
+        SELECT symbol, event, tone
+        FROM `{PROJECT_ID}.{DATASET_ID}.speech_signals_v`
+        ORDER BY processed_at DESC
+        LIMIT 3
+    """
+    for row in client.query(query).result():
+        print(f"   {row.symbol} | {row.event} | {row.tone}")
+
 
 if __name__ == "__main__":
     create_views()
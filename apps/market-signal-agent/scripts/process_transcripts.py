@@ -1,10 +1,18 @@
 """Process earnings transcripts via Gemini and insert to BigQuery.
 
-Two-step pipeline:
+Pipeline:
 1. Load raw transcripts to temp table (earnings_transcripts_raw)
 2. Process in batches of 15-20 with Gemini -> insert to speech_signals
+3. Archive raw transcripts to speech_transcripts (speech_signals keeps only
+   the compact extracted fields)
+4. Chunk and embed transcripts into the local search index used by the
+   search_transcripts tool (TRANSCRIPT_INDEX_DIR)
+
+Rebuild only the search index from speech_transcripts:
+    uv run python scripts/process_transcripts.py --index-only
 """
 
+import argparse
 import json
 import os
 import uuid
@@ -20,6 +28,11 @@ from google import genai
 from google.cloud import bigquery
 from google.genai.types import GenerateContentConfig
 
+from market_signal_agent.config import config
+from market_signal_agent.retrieval import HybridIndex, chunk_text
+from market_signal_agent.retrieval.embeddings import embed_documents
+from market_signal_agent.tools.retrieval_tools import resolve_index_dir
+
 PROJECT_ID = "ccibt-hack25ww7-736"
 DATASET_ID = "market_volatility"
 LOCATION = "us-central1"
@@ -31,6 +44,7 @@ TRANSCRIPTS_DIR = Path(__file__).parent.parent.parent.parent / "ai_docs" / "Idea
 # Table names
 TEMP_TABLE = f"{PROJECT_ID}.{DATASET_ID}.earnings_transcripts_raw"
 SPEECH_TABLE = f"{PROJECT_ID}.{DATASET_ID}.speech_signals"
+TRANSCRIPTS_TABLE = f"{PROJECT_ID}.{DATASET_ID}.speech_transcripts"
 
 
 def create_temp_table(bq_client: bigquery.Client) -> None:
@@ -186,8 +200,7 @@ def process_batch(bq_client: bigquery.Client, batch_num: int, offset: int) -> in
         speech_row = {
             "id": row.id,
             "symbol": row.symbol,
-            "event": row.event,
-            "transcript": row.transcript,  # Keep raw transcript
+            "event": row.event,  # Raw transcript is archived to speech_transcripts
             "tone": signals.get("tone", "neutral"),
             "guidance": signals.get("guidance", ""),
             "topics": signals.get("topics", []),
@@ -228,6 +241,58 @@ def process_all_batches(bq_client: bigquery.Client, total_rows: int) -> int:
     return total_processed
 
 
+def archive_transcripts(bq_client: bigquery.Client) -> None:
+    """Step 3: Copy raw transcripts to speech_transcripts (keyed by speech_signals.id)."""
+    print("\n=== STEP 3: Archiving raw transcripts ===")
+    query = f"""
+    MERGE `{TRANSCRIPTS_TABLE}` t
+    USING `{TEMP_TABLE}` s
+    ON t.id = s.id
+    WHEN MATCHED THEN
+        UPDATE SET transcript = s.transcript, file_path = s.file_path
+    WHEN NOT MATCHED THEN
+        INSERT (id, symbol, event, transcript, file_path, created_at)
+        VALUES (s.id, s.symbol, s.event, s.transcript, s.file_path, s.created_at)
+    """
+    bq_client.query(query).result()
+    print(f"Archived transcripts to: {TRANSCRIPTS_TABLE}")
+
+
+def build_transcript_index(bq_client: bigquery.Client) -> None:
+    """Step 4: Chunk and embed transcripts into the local search index."""
+    print("\n=== STEP 4: Building transcript search index ===")
+    query = f"""
+    SELECT id, symbol, event, transcript
+    FROM `{TRANSCRIPTS_TABLE}`
+    WHERE transcript IS NOT NULL
+    ORDER BY symbol, event
+    """
+
+    chunks = []
+    for row in bq_client.query(query).result():
+        for i, passage in enumerate(chunk_text(row.transcript)):
+            chunks.append(
+                {
+                    "id": row.id,
+                    "symbol": row.symbol,
+                    "event": row.event,
+                    "chunk": i,
+                    "text": passage,
+                }
+            )
+
+    if not chunks:
+        print("No transcripts to index.")
+        return
+
+    print(f"Embedding {len(chunks)} passages...")
+    embeddings = embed_documents([chunk["text"] for chunk in chunks])
+
+    index_dir = resolve_index_dir(config.transcript_index_dir)
+    HybridIndex.build(chunks, embeddings).save(index_dir)
+    print(f"Index written to {index_dir}")
+
+
 def delete_temp_table(bq_client: bigquery.Client) -> None:
     """Cleanup: Delete temp table."""
     print(f"\n=== CLEANUP: Deleting temp table ===")
@@ -257,13 +322,25 @@ def verify_results(bq_client: bigquery.Client) -> None:
 
 
 def main() -> None:
-    """Main entry point for two-step pipeline."""
+    """Main entry point for the transcript pipeline."""
+    parser = argparse.ArgumentParser(description="Process earnings transcripts")
+    parser.add_argument(
+        "--index-only",
+        action="store_true",
+        help="Only rebuild the search index from speech_transcripts",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("TRANSCRIPT INGESTION PIPELINE")
     print("=" * 60)
 
     bq_client = bigquery.Client(project=PROJECT_ID)
 
+    if args.index_only:
+        build_transcript_index(bq_client)
+        return
+
     # Step 1: Create temp table and load raw transcripts
     create_temp_table(bq_client)
     total_rows = load_raw_transcripts(bq_client)
@@ -275,12 +352,18 @@ def main() -> None:
     # Step 2: Process in batches with Gemini
     processed = process_all_batches(bq_client, total_rows)
 
+    # Step 3: Keep raw transcripts outside speech_signals
+    archive_transcripts(bq_client)
+
     # Verify results
     verify_results(bq_client)
 
     # Cleanup temp table
     delete_temp_table(bq_client)
 
+    # Step 4: Passage search index over the archived transcripts
+    build_transcript_index(bq_client)
+
     print("\n" + "=" * 60)
     print(f"COMPLETE: Processed {processed}/{total_rows} transcripts")
     print("=" * 60)
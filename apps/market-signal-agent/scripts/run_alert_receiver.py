@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Local stand-in for an alert webhook receiver.
+
+Accepts the JSON batches POSTed by the alert dispatcher
+(market_signal_agent/utils/alert_delivery.py), prints each alert and keeps
+counts, so delivery can be tested without a real endpoint:
+
+    POST /alerts    {"alerts": [...]} batch (any path is accepted)
+    GET  /status    batches and alerts received so far
+
+--fail-rate rejects a share of batches with 503 to exercise retries.
+
+    uv run python scripts/run_alert_receiver.py --port 8091
+    ALERT_WEBHOOK_URL=http://127.0.0.1:8091/alerts uv run adk web
+"""
+
+import argparse
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(fail_rate: float) -> type[BaseHTTPRequestHandler]:
+    """Request handler class recording received batches."""
+    lock = threading.Lock()
+    counts = {"batches": 0, "alerts": 0, "rejected": 0}
+
+    class AlertReceiverHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802
+            with lock:
+                self._send_json(200, dict(counts))
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                alerts = json.loads(self.rfile.read(length))["alerts"]
+            except (ValueError, KeyError, TypeError):
+                self._send_json(400, {"error": 'Expected {"alerts": [...]}'})
+                return
+            if random.random() < fail_rate:
+                with lock:
+                    counts["rejected"] += 1
+                print(f"Rejected batch of {len(alerts)} (simulated failure)")
+                self._send_json(503, {"error": "simulated failure"})
+                return
+
+            with lock:
+                counts["batches"] += 1
+                counts["alerts"] += len(alerts)
+                batch_number = counts["batches"]
+            print(f"Batch {batch_number}: {len(alerts)} alert(s)")
+            for alert in alerts:
+                print(
+                    f"  {alert.get('transition', '?'):<9} "
+                    f"[{alert.get('severity')}] {alert.get('id')}: "
+                    f"{alert.get('message')}"
+                )
+            self._send_json(200, {"received": len(alerts)})
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass  # Alerts are printed above
+
+    return AlertReceiverHandler
+
+
+def main() -> None:
+    """Start the receiver."""
+    parser = argparse.ArgumentParser(description="Local alert webhook receiver")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8091)
+    parser.add_argument(
+        "--fail-rate",
+        type=float,
+        default=0.0,
+        help="Share of batches rejected with 503 to test retries (0-1)",
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("ALERT WEBHOOK RECEIVER")
+    print("=" * 60)
+    print(f"Listening on http://{args.host}:{args.port}/alerts")
+    if args.fail_rate:
+        print(f"Rejecting {args.fail_rate:.0%} of batches")
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.fail_rate))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down receiver...")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Scheduled precompute daemon: runs the analysis before users ask.
+
+Runs the full analysis pipeline (config.precompute_query) on the cron
+schedule in config.precompute_schedule. Each run goes through the same agent
+tree as a chat session, so the persistence agent writes volatility_forecasts
+and alerts as usual; the final answer and pipeline state are then kept in
+memory and written to config.snapshot_path, from which the ADK server answers
+standard questions (see market_signal_agent/utils/snapshot.py).
+
+A run also happens at startup when there is no fresh snapshot.
+
+    uv run python scripts/run_precompute.py
+    uv run python scripts/run_precompute.py --once
+    uv run python scripts/run_precompute.py --schedule "*/30 13-21 * * 1-5"
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Load environment variables BEFORE importing the agent
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).parent.parent / ".env.local")
+
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from market_signal_agent.agent import root_agent
+from market_signal_agent.config import config
+from market_signal_agent.utils.alert_delivery import alert_dispatcher
+from market_signal_agent.utils.schedule import CronSchedule
+from market_signal_agent.utils.snapshot import (
+    SNAPSHOT_BYPASS_KEY,
+    load_snapshot,
+    snapshot_age_seconds,
+    write_snapshot,
+)
+
+USER_ID = "precompute"
+
+
+class Precomputer:
+    """Runs the pipeline and holds the latest snapshot in memory."""
+
+    def __init__(self) -> None:
+        self.runner = InMemoryRunner(agent=root_agent)
+        self.snapshot: dict[str, Any] | None = load_snapshot()
+
+    def is_fresh(self) -> bool:
+        """Whether the current snapshot is young enough to be served."""
+        return (
+            self.snapshot is not None
+            and snapshot_age_seconds(self.snapshot) < config.snapshot_max_age_seconds
+        )
+
+    async def run(self) -> dict[str, Any]:
+        """Run the analysis once and publish the snapshot."""
+        started = datetime.now(timezone.utc)
+        start = time.perf_counter()
+
+        session = await self.runner.session_service.create_session(
+            app_name=self.runner.app_name,
+            user_id=USER_ID,
+            state={SNAPSHOT_BYPASS_KEY: True},
+        )
+        message = types.Content(
+            role="user", parts=[types.Part(text=config.precompute_query)]
+        )
+
+        response = ""
+        async for event in self.runner.run_async(
+            user_id=USER_ID, session_id=session.id, new_message=message
+        ):
+            if event.partial or not event.content or not event.content.parts:
+                continue
+            text = "".join(part.text for part in event.content.parts if part.text)
+            if text.strip():
+                response = text
+
+        session = await self.runner.session_service.get_session(
+            app_name=self.runner.app_name, user_id=USER_ID, session_id=session.id
+        )
+        self.snapshot = write_snapshot(
+            response, dict(session.state), created_at=started
+        )
+        await self.runner.session_service.delete_session(
+            app_name=self.runner.app_name, user_id=USER_ID, session_id=session.id
+        )
+
+        print(
+            f"[{started:%Y-%m-%d %H:%M:%S}] Snapshot refreshed "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+        return self.snapshot
+
+    async def run_safely(self) -> None:
+        """Run once, logging failures instead of stopping the daemon."""
+        try:
+            await self.run()
+        except Exception as e:
+            print(f"Precompute run failed: {e}")
+
+
+async def serve(schedule: CronSchedule, precomputer: Precomputer) -> None:
+    """Run on every schedule slot until interrupted."""
+    if not precomputer.is_fresh():
+        await precomputer.run_safely()
+
+    while True:
+        now = datetime.now()
+        next_run = schedule.next_run(now)
+        print(f"Next run: {next_run:%Y-%m-%d %H:%M}")
+        await asyncio.sleep((next_run - now).total_seconds())
+        await precomputer.run_safely()
+
+
+async def run_once(precomputer: Precomputer) -> None:
+    """Run once, then wait for the run's alerts to be delivered."""
+    await precomputer.run()
+    await alert_dispatcher.flush()
+
+
+def main() -> None:
+    """Start the precompute scheduler."""
+    parser = argparse.ArgumentParser(description="Precompute analysis on a schedule")
+    parser.add_argument(
+        "--schedule",
+        default=config.precompute_schedule,
+        help="Cron expression (default: PRECOMPUTE_SCHEDULE)",
+    )
+    parser.add_argument("--once", action="store_true", help="Run once and exit")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PRECOMPUTE DAEMON")
+    print("=" * 60)
+    print(f"Query: {config.precompute_query}")
+    print(f"Snapshot: {config.resolve_path(config.snapshot_path)}")
+
+    precomputer = Precomputer()
+    try:
+        if args.once:
+            asyncio.run(run_once(precomputer))
+        else:
+            print(f"Schedule: {args.schedule}")
+            asyncio.run(serve(CronSchedule(args.schedule), precomputer))
+    except KeyboardInterrupt:
+        print("\nShutting down precompute daemon...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Dashboard read API: serves the /api/volatility/* views from memory.
+
+Keeps the metrics, forecasts, anomalies, events and alerts views in an
+in-memory ReadModel (market_signal_agent/utils/read_model.py) and serves
+them as JSON with ETags, so dashboard loads no longer run BigQuery:
+
+    GET  /api/volatility/<view>    view body (304 if If-None-Match matches)
+    GET  /api/volatility/status    refresh times and source watermarks
+    POST /api/volatility/refresh   re-query every view now (e.g. after a load)
+
+Every config.read_api_refresh_seconds a watermark query checks whether the
+source tables moved; only changed views are re-queried.
+
+    uv run python scripts/run_read_api.py
+    uv run python scripts/run_read_api.py --port 8090 --refresh-seconds 60
+
+Point the dashboard at it with READ_API_URL=http://127.0.0.1:8090 in
+apps/web/.env.local.
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Load environment variables BEFORE importing the agent package
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).parent.parent / ".env.local")
+
+from market_signal_agent.config import config
+from market_signal_agent.utils.read_model import VIEWS, ReadModel
+
+PREFIX = "/api/volatility/"
+
+
+def make_handler(
+    model: ReadModel, loop: asyncio.AbstractEventLoop, refresh_now: asyncio.Event
+) -> type[BaseHTTPRequestHandler]:
+    """Request handler class bound to a read model."""
+
+    class ReadApiHandler(BaseHTTPRequestHandler):
+        def _send(
+            self, status: int, body: bytes = b"", etag: str | None = None
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", "no-cache")
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, status: int, payload: dict) -> None:
+            self._send(status, json.dumps(payload).encode("utf-8"))
+
+        def do_GET(self) -> None:  # noqa: N802
+            name = self.path.split("?", 1)[0].removeprefix(PREFIX)
+            if name == "status":
+                self._send_json(200, model.status())
+                return
+            if name not in VIEWS:
+                self._send_json(404, {"error": f"Unknown view '{name}'"})
+                return
+
+            view = model.get(name)
+            if view is None:
+                self._send_json(503, {"error": f"View '{name}' is not loaded yet"})
+                return
+            body, etag = view
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, etag=etag)
+            else:
+                self._send(200, body, etag)
+
+        def do_POST(self) -> None:  # noqa: N802
+            if self.path != PREFIX + "refresh":
+                self._send_json(404, {"error": "Not found"})
+                return
+            loop.call_soon_threadsafe(refresh_now.set)
+            self._send_json(202, {"status": "refresh scheduled"})
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass  # One line per dashboard poll would drown the refresh log
+
+    return ReadApiHandler
+
+
+async def refresh_loop(
+    model: ReadModel, interval: int, refresh_now: asyncio.Event
+) -> None:
+    """Refresh on every interval, or immediately when asked to."""
+    force = True
+    while True:
+        try:
+            changed = await model.refresh(force=force)
+            if changed:
+                print(f"Refreshed: {', '.join(changed)}")
+        except Exception as e:
+            print(f"Refresh failed: {e}")
+
+        try:
+            await asyncio.wait_for(refresh_now.wait(), timeout=interval)
+            force = True
+        except asyncio.TimeoutError:
+            force = False
+        refresh_now.clear()
+
+
+async def serve(host: str, port: int, interval: int) -> None:
+    """Start the HTTP server and keep the read model fresh."""
+    model = ReadModel()
+    refresh_now = asyncio.Event()
+    handler = make_handler(model, asyncio.get_running_loop(), refresh_now)
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving on http://{host}:{port}{PREFIX}<view>")
+    try:
+        await refresh_loop(model, interval, refresh_now)
+    finally:
+        server.shutdown()
+
+
+def main() -> None:
+    """Start the read API."""
+    parser = argparse.ArgumentParser(description="Serve dashboard views from memory")
+    parser.add_argument("--host", default=config.read_api_host)
+    parser.add_argument("--port", type=int, default=config.read_api_port)
+    parser.add_argument(
+        "--refresh-seconds",
+        type=int,
+        default=config.read_api_refresh_seconds,
+        help="Watermark check interval (default: READ_API_REFRESH_SECONDS)",
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("DASHBOARD READ API")
+    print("=" * 60)
+    print(f"Dataset: {config.bq_dataset_full}")
+    print(f"Views: {', '.join(VIEWS)}")
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.refresh_seconds))
+    except KeyboardInterrupt:
+        print("\nShutting down read API...")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,10 @@ def verify_tables() -> None:
         "stock_news",
         "analyst_ratings",
         "speech_signals",
+        "speech_transcripts",
+        "event_calendar",
+        "analyst_rating_daily",
+        "news_sentiment_daily",
         "volatility_forecasts",
         "alerts",
     ]
@@ -78,7 +82,7 @@ def test_speech_signals() -> None:
 
     query = f"""
     SELECT symbol, event, tone, guidance
-    FROM `{PROJECT_ID}.{DATASET_ID}.speech_signals`
+    FROM `{PROJECT_ID}.{DATASET_ID}.speech_signals_v`
     ORDER BY processed_at DESC
     LIMIT 3
     """
@@ -0,0 +1,10 @@
+"""Shared test setup.
+
+Importing market_signal_agent builds the agent tree, whose BigQuery toolset
+resolves Application Default Credentials; tests run without them.
+"""
+
+import google.auth
+from google.auth.credentials import AnonymousCredentials
+
+google.auth.default = lambda *args, **kwargs: (AnonymousCredentials(), "test-project")
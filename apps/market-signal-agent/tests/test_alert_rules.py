@@ -0,0 +1,215 @@
+"""Compilation, evaluation and reloading of the declarative alert rules."""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from market_signal_agent.config import config
+from market_signal_agent.tools.alert_tools import (
+    check_anomaly_alert,
+    check_vix_threshold,
+)
+from market_signal_agent.utils import alert_rules
+from market_signal_agent.utils.alert_rules import (
+    AlertRule,
+    RuleSet,
+    load_rules,
+    substitute_settings,
+)
+
+NOW = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+ZSCORE_RULE = {
+    "id": "zscore",
+    "table": "symbols",
+    "alert_type": "anomaly",
+    "severity": "warning",
+    "band": "price_{price_direction}_2",
+    "when": {"field": "price_zscore", "op": ">", "value": 2, "abs": True},
+    "message": "{symbol} price {price_sigma:.1f} sigma {price_direction}",
+}
+
+RULES_FILE = """
+rules:
+  - id: vix_high
+    table: market
+    alert_type: vix_high
+    severity: warning
+    band: "${vix_high}+"
+    when: {field: vix, op: ">", value: ${vix_high}}
+    message: "VIX at {vix:.1f}"
+"""
+
+
+def market(vix: float) -> dict[str, np.ndarray]:
+    return {
+        "date": np.array(["2024-01-02"], dtype=object),
+        "vix": np.array([vix]),
+        "hv_20d": np.array([vix]),
+        "hv_vix_spread": np.array([0.0]),
+        "contagion": np.array([np.nan]),
+    }
+
+
+def symbols(zscores: dict[str, float]) -> dict[str, np.ndarray]:
+    price = np.array(list(zscores.values()), dtype=float)
+    volume = np.zeros(len(price))
+    return {
+        "symbol": np.array(list(zscores), dtype=object),
+        "price_zscore": price,
+        "volume_zscore": volume,
+        "price_sigma": np.abs(price),
+        "volume_sigma": volume,
+        "price_direction": np.where(price > 0, "above", "below").astype(object),
+        "volume_direction": np.full(len(price), "below", dtype=object),
+    }
+
+
+@pytest.fixture
+def bundled_rules() -> RuleSet:
+    return RuleSet.from_file(config.resolve_path(config.alert_rules_path))
+
+
+@pytest.mark.parametrize("vix", [14.0, 20.0, 20.5, 25.0, 26.4, 30.0, 31.2])
+def test_vix_rules_match_check_vix_threshold(
+    bundled_rules: RuleSet, vix: float
+) -> None:
+    alerts, scopes = bundled_rules.evaluate({"market": market(vix)}, NOW)
+    expected = check_vix_threshold(vix)
+
+    got = [(alert["id"], alert["message"]) for alert in alerts]
+    assert got == ([(expected["id"], expected["message"])] if expected else [])
+    assert "vix" in scopes
+
+
+def test_zscore_rule_matches_check_anomaly_alert() -> None:
+    rules = RuleSet([AlertRule(**ZSCORE_RULE)])
+
+    alerts, _ = rules.evaluate({"symbols": symbols({"SPX": 2.5, "NDX": -3.0})}, NOW)
+
+    expected = [
+        check_anomaly_alert("SPX", "price", 2.5, 2.0),
+        check_anomaly_alert("NDX", "price", -3.0, 2.0),
+    ]
+    assert [alert["id"] for alert in alerts] == [alert["id"] for alert in expected]
+    assert alerts[0]["symbol"] == "SPX"
+    assert alerts[0]["message"] == "SPX price 2.5 sigma above"
+
+
+def test_nan_values_never_match() -> None:
+    rules = RuleSet([AlertRule(**ZSCORE_RULE)])
+
+    alerts, _ = rules.evaluate({"symbols": symbols({"SPX": np.nan, "NDX": 2.5})})
+
+    assert [alert["symbol"] for alert in alerts] == ["NDX"]
+
+
+def test_nan_vix_raises_no_band(bundled_rules: RuleSet) -> None:
+    alerts, _ = bundled_rules.evaluate({"market": market(np.nan)})
+
+    assert [alert for alert in alerts if alert["alert_type"].startswith("vix")] == []
+
+
+def test_combinators_and_in() -> None:
+    rule = {
+        **ZSCORE_RULE,
+        "when": {
+            "all": [
+                {"field": "symbol", "op": "in", "value": ["SPX", "NDX"]},
+                {"not": {"field": "price_zscore", "op": "<", "value": 0}},
+            ]
+        },
+    }
+    rules = RuleSet([AlertRule(**rule)])
+
+    alerts, _ = rules.evaluate(
+        {"symbols": symbols({"SPX": 0.5, "NDX": -0.5, "DJI": 1.0})}
+    )
+
+    assert [alert["symbol"] for alert in alerts] == ["SPX"]
+
+
+def test_missing_table_skips_rule() -> None:
+    rules = RuleSet([AlertRule(**ZSCORE_RULE)])
+
+    assert rules.evaluate({"market": market(40.0)}) == ([], [])
+
+
+@pytest.mark.parametrize(
+    "change, error",
+    [
+        ({"when": {"field": "vix", "op": ">", "value": 1}}, "Unknown field"),
+        ({"when": {"field": "price_zscore", "op": "~", "value": 1}}, "Unknown op"),
+        ({"when": {"field": "symbol", "op": "in", "value": "SPX"}}, "list value"),
+        ({"when": {"all": []}}, "at least one"),
+        ({"message": "{vix}"}, "bad template"),
+    ],
+)
+def test_invalid_rules_are_rejected(change: dict, error: str) -> None:
+    with pytest.raises(ValueError, match=error):
+        RuleSet([AlertRule(**{**ZSCORE_RULE, **change})])
+
+
+def test_duplicate_rule_ids_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Duplicate rule ids"):
+        RuleSet([AlertRule(**ZSCORE_RULE), AlertRule(**ZSCORE_RULE)])
+
+
+def test_substitute_settings() -> None:
+    text = "value: ${vix_high}, z: ${zscore_threshold}, cost: $$5"
+
+    assert substitute_settings(text) == (
+        f"value: {config.vix_high:g}, z: {config.zscore_threshold:g}, cost: $5"
+    )
+    with pytest.raises(ValueError, match="Unknown config setting"):
+        substitute_settings("value: ${no_such_setting}")
+
+
+def write_rules(path: Path, text: str, mtime_ns: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def rules_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "alert_rules.yaml"
+    monkeypatch.setattr(config, "alert_rules_path", str(path))
+    monkeypatch.setattr(alert_rules, "_cache", {"mtime": None, "rules": None})
+    return path
+
+
+def test_load_rules_reloads_on_change(rules_path: Path) -> None:
+    write_rules(rules_path, RULES_FILE, 1_000_000_000)
+    first = load_rules()
+
+    assert load_rules() is first
+    assert first.rules[0].band == f"{config.vix_high:g}+"
+
+    write_rules(rules_path, RULES_FILE.replace("warning", "critical"), 2_000_000_000)
+    second = load_rules()
+
+    assert second is not first
+    assert second.rules[0].rule.severity == "critical"
+
+
+def test_load_rules_keeps_previous_rules_on_bad_file(rules_path: Path) -> None:
+    write_rules(rules_path, RULES_FILE, 1_000_000_000)
+    good = load_rules()
+
+    write_rules(
+        rules_path, RULES_FILE.replace("field: vix", "field: nope"), 2_000_000_000
+    )
+    assert load_rules() is good
+
+    write_rules(rules_path, "rules: [", 3_000_000_000)
+    assert load_rules() is good
+
+
+def test_load_rules_raises_without_previous_rules(rules_path: Path) -> None:
+    write_rules(rules_path, RULES_FILE.replace("${vix_high}+", "${nope}"), 1)
+
+    with pytest.raises(ValueError):
+        load_rules()
@@ -0,0 +1,155 @@
+"""Alert transitions planned by the active-alert index."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from market_signal_agent.utils.alert_state import (
+    VIX_SCOPE,
+    ActiveAlertIndex,
+    AlertSweep,
+    alert_fingerprint,
+    alert_scope,
+    anomaly_band,
+    anomaly_scope,
+    vix_band,
+)
+
+OPENED_AT = "2024-01-01T00:00:00+00:00"
+NOW = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def make_alert(alert_id: str, **fields: object) -> dict:
+    return {
+        "id": alert_id,
+        "alert_type": alert_id.split(":")[0],
+        "severity": "warning",
+        "symbol": None,
+        "message": "message",
+        "vix_value": None,
+        "triggered_at": OPENED_AT,
+        "is_active": True,
+        **fields,
+    }
+
+
+VIX_HIGH = alert_fingerprint("vix_high", None, vix_band(25, 30))
+SPX_PRICE = alert_fingerprint("anomaly", "SPX", anomaly_band("price", 2.5, 2.0))
+NDX_VOLUME = alert_fingerprint("anomaly", "NDX", anomaly_band("volume", -3.1, 2.0))
+
+
+@pytest.fixture
+def index() -> ActiveAlertIndex:
+    index = ActiveAlertIndex()
+    index.load(
+        [
+            make_alert(VIX_HIGH),
+            make_alert(SPX_PRICE),
+            make_alert("5f2b8c1e-legacy-uuid"),
+        ]
+    )
+    return index
+
+
+def by_id(rows: list[dict]) -> dict[str, dict]:
+    return {row["id"]: row for row in rows}
+
+
+def test_fingerprints_are_stable() -> None:
+    assert VIX_HIGH == "vix_high:*:25-30"
+    assert SPX_PRICE == "anomaly:SPX:price_above_2"
+    assert NDX_VOLUME == "anomaly:NDX:volume_below_2"
+
+
+def test_load_separates_legacy_rows(index: ActiveAlertIndex) -> None:
+    assert set(index.active) == {VIX_HIGH, SPX_PRICE}
+    assert set(index.legacy) == {"5f2b8c1e-legacy-uuid"}
+
+
+def test_new_fingerprint_is_opened(index: ActiveAlertIndex) -> None:
+    fired = {NDX_VOLUME: make_alert(NDX_VOLUME, triggered_at="ignored")}
+
+    rows = by_id(index.plan(fired, {anomaly_scope("NDX", "volume")}, NOW))
+
+    assert rows[NDX_VOLUME]["transition"] == "opened"
+    assert rows[NDX_VOLUME]["triggered_at"] == NOW.isoformat()
+    assert rows[NDX_VOLUME]["is_active"] is True
+    assert rows[NDX_VOLUME]["resolved_at"] is None
+
+
+def test_active_fingerprint_is_updated_and_keeps_triggered_at(
+    index: ActiveAlertIndex,
+) -> None:
+    fired = {VIX_HIGH: make_alert(VIX_HIGH, severity="critical", vix_value=29.0)}
+
+    rows = by_id(index.plan(fired, {VIX_SCOPE}, NOW))
+
+    assert rows[VIX_HIGH]["transition"] == "updated"
+    assert rows[VIX_HIGH]["triggered_at"] == OPENED_AT
+    assert rows[VIX_HIGH]["updated_at"] == NOW.isoformat()
+    assert rows[VIX_HIGH]["severity"] == "critical"
+
+
+def test_checked_scope_that_did_not_fire_is_resolved(
+    index: ActiveAlertIndex,
+) -> None:
+    rows = by_id(index.plan({}, {VIX_SCOPE}, NOW))
+
+    assert set(rows) == {VIX_HIGH}
+    assert rows[VIX_HIGH]["transition"] == "resolved"
+    assert rows[VIX_HIGH]["is_active"] is False
+    assert rows[VIX_HIGH]["resolved_at"] == NOW.isoformat()
+
+
+def test_unchecked_scopes_and_legacy_rows_are_left_alone(
+    index: ActiveAlertIndex,
+) -> None:
+    # Only NDX was checked: the SPX alert and the legacy row stay open
+    rows = index.plan({}, {anomaly_scope("NDX", "price")}, NOW)
+
+    assert rows == []
+
+
+def test_plan_does_not_change_the_index(index: ActiveAlertIndex) -> None:
+    index.plan({}, {VIX_SCOPE}, NOW)
+
+    assert VIX_HIGH in index.active
+
+
+def test_apply_moves_alerts_between_active_and_resolved(
+    index: ActiveAlertIndex,
+) -> None:
+    fired = {NDX_VOLUME: make_alert(NDX_VOLUME)}
+    checked = {VIX_SCOPE, anomaly_scope("NDX", "volume")}
+
+    index.apply(index.plan(fired, checked, NOW))
+
+    assert set(index.active) == {SPX_PRICE, NDX_VOLUME}
+    assert "transition" not in index.active[NDX_VOLUME]
+
+
+@pytest.mark.parametrize(
+    ("alert_id", "scope"),
+    [
+        (VIX_HIGH, VIX_SCOPE),
+        ("vix_extreme:*:30+", VIX_SCOPE),
+        (SPX_PRICE, "anomaly:SPX:price"),
+        (NDX_VOLUME, "anomaly:NDX:volume"),
+        ("correlation_break:*:sp500/gold", "correlation_break:*"),
+        ("5f2b8c1e-legacy-uuid", None),
+    ],
+)
+def test_alert_scope(alert_id: str, scope: str | None) -> None:
+    assert alert_scope({"id": alert_id}) == scope
+
+
+def test_sweep_record() -> None:
+    sweep = AlertSweep()
+    first = make_alert(alert_fingerprint("vix_high", None, vix_band(25, 30)))
+    again = {**first, "severity": "critical"}
+
+    sweep.record([VIX_SCOPE], [first])
+    sweep.record([VIX_SCOPE, anomaly_scope("SPX", "price")], [again])
+
+    assert sweep.checked == {VIX_SCOPE, "anomaly:SPX:price"}
+    assert sweep.fired == {first["id"]: again}
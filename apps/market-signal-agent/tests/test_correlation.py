@@ -0,0 +1,65 @@
+"""Rolling correlation matrices against pandas' pairwise rolling statistics."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_signal_agent.utils.correlation import (
+    MIN_OBSERVATIONS,
+    breakdown_scores,
+    rolling_matrices,
+)
+
+WINDOWS = (20, 60)
+
+
+@pytest.fixture
+def moves() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=(300, 4)) @ rng.normal(size=(4, 4))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[:40, 3] = np.nan  # one asset starts trading later
+    return values
+
+
+def test_rolling_matrices_match_pandas(moves: np.ndarray) -> None:
+    covariance, correlation = rolling_matrices(moves, WINDOWS)
+    frame = pd.DataFrame(moves)
+
+    for w, window in enumerate(WINDOWS):
+        rolling = frame.rolling(window, min_periods=MIN_OBSERVATIONS)
+        for i in frame.columns:
+            for j in frame.columns:
+                expected_cov = rolling[i].cov(frame[j]).to_numpy()
+                expected_corr = rolling[i].corr(frame[j]).to_numpy()
+                np.testing.assert_allclose(
+                    covariance[w, :, i, j], expected_cov, rtol=1e-7, atol=1e-10
+                )
+                np.testing.assert_allclose(
+                    correlation[w, :, i, j], expected_corr, rtol=1e-7, atol=1e-10
+                )
+
+
+def test_rolling_matrices_nan_until_window_has_enough_joint_days(
+    moves: np.ndarray,
+) -> None:
+    _, correlation = rolling_matrices(moves, WINDOWS)
+
+    assert np.isnan(correlation[:, : MIN_OBSERVATIONS - 2]).all()
+    assert np.isnan(correlation[:, 40, 0, 3]).all()
+    assert not np.isnan(correlation[:, -1]).any()
+
+
+def test_breakdown_scores_compare_shortest_and_longest_window(
+    moves: np.ndarray,
+) -> None:
+    _, correlation = rolling_matrices(moves, WINDOWS)
+    shift, contagion = breakdown_scores(correlation)
+
+    np.testing.assert_allclose(shift, correlation[0] - correlation[-1])
+    off_diagonal = ~np.eye(4, dtype=bool)
+    expected = (
+        np.abs(correlation[0, -1][off_diagonal]).mean()
+        - np.abs(correlation[-1, -1][off_diagonal]).mean()
+    )
+    assert contagion[-1] == pytest.approx(expected)
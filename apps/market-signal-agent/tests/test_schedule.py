@@ -0,0 +1,101 @@
+"""Cron matching for the precompute scheduler."""
+
+from datetime import datetime
+
+import pytest
+
+from market_signal_agent.utils.schedule import CronSchedule
+
+# 2024-01-01 is a Monday
+MONDAY = datetime(2024, 1, 1, 12, 0)
+
+
+def test_every_fifteen_minutes() -> None:
+    schedule = CronSchedule("*/15 * * * *")
+
+    assert schedule.next_run(datetime(2024, 1, 1, 12, 7)) == datetime(
+        2024, 1, 1, 12, 15
+    )
+    assert schedule.next_run(datetime(2024, 1, 1, 12, 45)) == datetime(
+        2024, 1, 1, 13, 0
+    )
+
+
+def test_next_run_is_strictly_after() -> None:
+    schedule = CronSchedule("0 12 * * *")
+
+    assert schedule.next_run(MONDAY) == datetime(2024, 1, 2, 12, 0)
+    assert schedule.next_run(datetime(2024, 1, 1, 11, 59, 30)) == MONDAY
+
+
+def test_range_with_step() -> None:
+    schedule = CronSchedule("0 9-17/4 * * *")
+
+    runs = [schedule.next_run(datetime(2024, 1, 1, 0, 0))]
+    while len(runs) < 4:
+        runs.append(schedule.next_run(runs[-1]))
+    assert [run.hour for run in runs] == [9, 13, 17, 9]
+
+
+def test_step_from_a_single_value_runs_to_the_field_end() -> None:
+    schedule = CronSchedule("50/5 * * * *")
+
+    assert schedule.minutes == frozenset({50, 55})
+
+
+def test_lists_and_weekday_range() -> None:
+    schedule = CronSchedule("30 9,16 * * 1-5")
+
+    assert schedule.next_run(datetime(2024, 1, 5, 17, 0)) == datetime(2024, 1, 8, 9, 30)
+
+
+@pytest.mark.parametrize("sunday", ["0", "7"])
+def test_seven_is_sunday(sunday: str) -> None:
+    schedule = CronSchedule(f"0 6 * * {sunday}")
+
+    assert schedule.next_run(MONDAY) == datetime(2024, 1, 7, 6, 0)
+
+
+def test_day_of_month_or_day_of_week() -> None:
+    # The 15th, or any Friday
+    schedule = CronSchedule("0 0 15 * 5")
+
+    assert schedule.next_run(MONDAY) == datetime(2024, 1, 5, 0, 0)
+    assert schedule.next_run(datetime(2024, 1, 12, 1, 0)) == datetime(2024, 1, 15, 0, 0)
+
+
+def test_only_day_of_month_restricted() -> None:
+    schedule = CronSchedule("0 0 1 * *")
+
+    assert schedule.next_run(MONDAY) == datetime(2024, 2, 1, 0, 0)
+
+
+def test_leap_day_is_found() -> None:
+    schedule = CronSchedule("0 0 29 2 *")
+
+    assert schedule.next_run(datetime(2024, 3, 1)) == datetime(2028, 2, 29, 0, 0)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "* * * *",
+        "60 * * * *",
+        "* 24 * * *",
+        "* * 0 * *",
+        "* * * 13 *",
+        "* * * * 8",
+        "*/0 * * * *",
+        "5-1 * * * *",
+    ],
+)
+def test_invalid_expressions(expression: str) -> None:
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_expression_that_never_runs() -> None:
+    schedule = CronSchedule("0 0 31 2 *")
+
+    with pytest.raises(ValueError):
+        schedule.next_run(MONDAY)
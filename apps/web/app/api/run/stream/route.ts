@@ -0,0 +1,94 @@
+import { NextRequest } from "next/server";
+import { getCurrentUserId } from "@/lib/auth";
+import { getADK_APP_NAME, shouldUseAgentEngine } from "@/lib/config/backend-config";
+import { getAuthHeaders } from "@/lib/config/server-auth";
+import { createStageStream } from "@/lib/adk/stage-stream";
+
+export const dynamic = "force-dynamic";
+
+/**
+ * POST /api/run/stream
+ * Runs the agent and streams each completed analysis stage as server-sent
+ * events (see lib/adk/stage-stream.ts), instead of returning immediately and
+ * leaving the client to poll the session like /api/run.
+ */
+export async function POST(request: NextRequest): Promise<Response> {
+  try {
+    // Step 1: Get user ID
+    const userId = await getCurrentUserId();
+    if (!userId) {
+      return new Response("Unauthorized", { status: 401 });
+    }
+
+    // Step 2: Extract and validate request data
+    const { userId: requestUserId, message, sessionId, profile } = await request.json();
+
+    if (!requestUserId || !message || !sessionId) {
+      return new Response("Missing required fields", { status: 400 });
+    }
+
+    // Agent Engine's streamQuery does not expose ADK custom metadata
+    if (shouldUseAgentEngine()) {
+      return new Response("Stage streaming requires the local ADK server", {
+        status: 501,
+      });
+    }
+
+    const adkUrl = process.env.ADK_URL;
+    if (!adkUrl) {
+      return new Response("ADK_URL environment variable not configured", {
+        status: 500,
+      });
+    }
+
+    // Include profile in the message context
+    const contextualMessage = profile
+      ? `[Signal Profile: ${profile}] ${message}`
+      : message;
+
+    console.log("[ADK STREAM] 🚀 Streaming ADK agent for session:", sessionId);
+
+    // Step 3: Open the ADK SSE stream
+    const adkResponse = await fetch(`${adkUrl}/run_sse`, {
+      method: "POST",
+      headers: await getAuthHeaders(),
+      body: JSON.stringify({
+        app_name: getADK_APP_NAME(),
+        user_id: requestUserId,
+        session_id: sessionId,
+        new_message: {
+          role: "user",
+          parts: [{ text: contextualMessage }],
+        },
+        streaming: false,
+        state: {
+          user_id: requestUserId,
+        },
+      }),
+    });
+
+    if (!adkResponse.ok || !adkResponse.body) {
+      console.error("[ADK STREAM] ADK request failed:", adkResponse.status);
+      return new Response(
+        `ADK request failed: ${adkResponse.status} ${adkResponse.statusText}`,
+        { status: 502 }
+      );
+    }
+
+    // Step 4: Relay stage-by-stage results to the client
+    return new Response(createStageStream(adkResponse.body), {
+      headers: {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache, no-transform",
+        Connection: "keep-alive",
+      },
+    });
+  } catch (error) {
+    console.error("[ADK STREAM] Stream request error:", error);
+
+    const errorMessage =
+      error instanceof Error ? error.message : "An unknown error occurred";
+
+    return new Response(errorMessage, { status: 500 });
+  }
+}
@@ -0,0 +1,129 @@
+/**
+ * Stage Stream
+ *
+ * Converts the ADK server's /run_sse event stream into compact server-sent
+ * events for the browser, so clients can render each analysis stage (e.g.
+ * technical_signals) as soon as it completes instead of waiting for the whole
+ * workflow.
+ *
+ * Emitted SSE events:
+ * - "stage":   { stage, outputs } when a workflow stage has written its state keys
+ * - "message": { author, text } for each complete agent text response
+ * - "error":   { error } when the agent run fails
+ * - "done":    {} when the ADK stream ends
+ */
+
+/**
+ * Payload of a "stage" event, mirroring custom_metadata["stage_ready"]
+ * emitted by DagWorkflowAgent in market_signal_agent
+ */
+export interface StageReadyPayload {
+  stage: string;
+  outputs: Record<string, unknown>;
+}
+
+/**
+ * Subset of a serialized ADK event (camelCase aliases) used by the stream
+ */
+interface AdkStreamEvent {
+  author?: string;
+  partial?: boolean;
+  error?: string;
+  content?: {
+    parts?: Array<{ text?: string }>;
+  };
+  customMetadata?: {
+    stage_ready?: StageReadyPayload;
+  };
+}
+
+function formatSseEvent(eventName: string, data: unknown): string {
+  return `event: ${eventName}\ndata: ${JSON.stringify(data)}\n\n`;
+}
+
+/**
+ * Map one ADK event to zero or more browser SSE frames
+ */
+function toClientFrames(event: AdkStreamEvent): string[] {
+  if (event.error) {
+    return [formatSseEvent("error", { error: event.error })];
+  }
+
+  const frames: string[] = [];
+
+  const stageReady = event.customMetadata?.stage_ready;
+  if (stageReady) {
+    frames.push(formatSseEvent("stage", stageReady));
+  }
+
+  const text = (event.content?.parts ?? [])
+    .map((part) => part.text ?? "")
+    .join("")
+    .trim();
+  if (text && !event.partial) {
+    frames.push(formatSseEvent("message", { author: event.author, text }));
+  }
+
+  return frames;
+}
+
+/**
+ * Wrap an ADK /run_sse response body in a browser-facing SSE stream
+ */
+export function createStageStream(
+  adkBody: ReadableStream<Uint8Array>
+): ReadableStream<Uint8Array> {
+  const decoder = new TextDecoder();
+  const encoder = new TextEncoder();
+  let buffer = "";
+
+  return new ReadableStream<Uint8Array>({
+    async start(controller): Promise<void> {
+      const reader = adkBody.getReader();
+
+      const flushFrames = (chunk: string): void => {
+        for (const line of chunk.split("\n")) {
+          if (!line.startsWith("data:")) {
+            continue;
+          }
+          try {
+            const event = JSON.parse(line.slice(5).trim()) as AdkStreamEvent;
+            for (const frame of toClientFrames(event)) {
+              controller.enqueue(encoder.encode(frame));
+            }
+          } catch (error) {
+            console.error("[STAGE STREAM] Failed to parse ADK event:", error);
+          }
+        }
+      };
+
+      try {
+        while (true) {
+          const { done, value } = await reader.read();
+          if (done) {
+            break;
+          }
+
+          buffer += decoder.decode(value, { stream: true });
+
+          // ADK separates events with a blank line
+          const chunks = buffer.split("\n\n");
+          buffer = chunks.pop() ?? "";
+          chunks.forEach(flushFrames);
+        }
+
+        flushFrames(buffer);
+        controller.enqueue(encoder.encode(formatSseEvent("done", {})));
+      } catch (error) {
+        const errorMessage =
+          error instanceof Error ? error.message : "Unknown stream error";
+        controller.enqueue(
+          encoder.encode(formatSseEvent("error", { error: errorMessage }))
+        );
+      } finally {
+        controller.close();
+        reader.releaseLock();
+      }
+    },
+  });
+}
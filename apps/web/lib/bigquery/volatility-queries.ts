@@ -24,6 +24,12 @@ const INDEX_MULTIPLIERS: Record<string, number> = {
 // Z-score threshold for anomaly detection
 const ZSCORE_THRESHOLD = 2.0;
 
+// Optional in-memory read API (apps/market-signal-agent/scripts/run_read_api.py)
+const READ_API_URL = process.env.READ_API_URL;
+
+// Last ETag and body per read API view, revalidated with If-None-Match
+const readApiCache = new Map<string, { etag: string; body: unknown }>();
+
 export type VolatilityRegime = "low" | "normal" | "elevated" | "extreme";
 
 export interface VolatilityMetrics {
@@ -90,10 +96,42 @@ export interface Alert {
   triggered_at: string;
 }
 
+/**
+ * Fetch a view from the read API, or null when it is not configured or fails
+ * (callers then query BigQuery directly). The last body of each view is kept
+ * with its ETag, so an unchanged view is answered by a bodiless 304.
+ */
+async function fromReadApi<T>(view: string): Promise<T | null> {
+  if (!READ_API_URL) return null;
+  const cached = readApiCache.get(view);
+  try {
+    const response = await fetch(`${READ_API_URL}/api/volatility/${view}`, {
+      cache: "no-store",
+      headers: cached ? { "If-None-Match": cached.etag } : undefined,
+    });
+    if (response.status === 304 && cached) return cached.body as T;
+    if (!response.ok) return null;
+    const body = (await response.json()) as T;
+    const etag = response.headers.get("ETag");
+    if (etag) {
+      readApiCache.set(view, { etag, body });
+    } else {
+      readApiCache.delete(view);
+    }
+    return body;
+  } catch (error) {
+    console.warn(`Read API unavailable for ${view}, querying BigQuery:`, error);
+    return null;
+  }
+}
+
 /**
  * Get current VIX level, regime, and percentile
  */
 export async function getVolatilityMetrics(): Promise<VolatilityMetrics> {
+  const cached = await fromReadApi<VolatilityMetrics>("metrics");
+  if (cached) return cached;
+
   const client = getBigQueryClient();
   const { project, dataset } = getBigQueryConfig();
 
@@ -163,6 +201,14 @@ export async function getVolatilityForecasts(): Promise<{
   regime: VolatilityRegime;
   data_date: string;
 }> {
+  const cached = await fromReadApi<{
+    forecasts: VolatilityForecast[];
+    current_vix: number;
+    regime: VolatilityRegime;
+    data_date: string;
+  }>("forecasts");
+  if (cached) return cached;
+
   const client = getBigQueryClient();
   const { project, dataset } = getBigQueryConfig();
 
@@ -275,6 +321,9 @@ export async function getVolatilityForecasts(): Promise<{
  * Get z-score anomalies for all indices
  */
 export async function getAnomalies(): Promise<Anomaly[]> {
+  const cached = await fromReadApi<{ anomalies: Anomaly[] }>("anomalies");
+  if (cached) return cached.anomalies;
+
   const client = getBigQueryClient();
   const { project, dataset } = getBigQueryConfig();
 
@@ -330,6 +379,9 @@ export async function getAnomalies(): Promise<Anomaly[]> {
  * Each query is handled separately to gracefully handle missing tables
  */
 export async function getEventCalendar(): Promise<EventCalendarData> {
+  const cached = await fromReadApi<EventCalendarData>("events");
+  if (cached) return cached;
+
   const client = getBigQueryClient();
   const { project, dataset } = getBigQueryConfig();
 
@@ -419,6 +471,13 @@ export async function getAlerts(): Promise<{
   has_critical: boolean;
   has_warning: boolean;
 }> {
+  const cached = await fromReadApi<{
+    alerts: Alert[];
+    has_critical: boolean;
+    has_warning: boolean;
+  }>("alerts");
+  if (cached) return cached;
+
   // Get current metrics and anomalies
   const [metrics, anomalies] = await Promise.all([
     getVolatilityMetrics(),